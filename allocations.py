@@ -0,0 +1,192 @@
+# allocations.py
+
+import gc
+import sys
+import time
+import logging
+import tracemalloc
+from collections import Counter
+
+class StateAllocations:
+    """Allocation and GC totals for the frames spent in one GameState."""
+    __slots__ = (
+        "frames", "net_bytes", "net_blocks", "peak_bytes", "max_peak_bytes",
+        "collections", "gc_pause", "max_gc_pause", "sampled", "sites", "site_blocks",
+    )
+
+    def __init__(self):
+        self.frames         = 0
+        self.net_bytes      = 0     # traced bytes still alive at frame end
+        self.net_blocks     = 0     # interpreter blocks still alive at frame end
+        self.peak_bytes     = 0     # sum of per-frame transient peaks
+        self.max_peak_bytes = 0
+        self.collections    = 0
+        self.gc_pause       = 0.0   # seconds
+        self.max_gc_pause   = 0.0
+        self.sampled        = 0     # frames with a per-site snapshot
+        self.sites:       Counter = Counter()   # "file:line" -> bytes
+        self.site_blocks: Counter = Counter()   # "file:line" -> blocks
+
+    def summary(self, top: int = 5) -> dict:
+        n = max(1, self.frames)
+        s = max(1, self.sampled)
+        return {
+            "frames":            self.frames,
+            "net_bytes_per_frame":  self.net_bytes / n,
+            "net_blocks_per_frame": self.net_blocks / n,
+            "peak_bytes_per_frame": self.peak_bytes / n,
+            "max_peak_bytes":    self.max_peak_bytes,
+            "gc_per_1000_frames": self.collections * 1000 / n,
+            "gc_pause_ms":       self.gc_pause * 1000,
+            "max_gc_pause_ms":   self.max_gc_pause * 1000,
+            "sites": [
+                (site, size / s, self.site_blocks[site] / s)
+                for site, size in self.sites.most_common(top)
+            ],
+        }
+
+
+class AllocationTracker:
+    """
+    Instrumentation mode: what each frame allocates, per GameState.
+
+    Wrap each frame's update and draw in begin_frame(state)/end_frame().
+    Every frame records the traced bytes and interpreter blocks that
+    survived the frame, the transient peak above the starting level
+    (which is what churn costs in memory), and the garbage collections
+    that ran, with their pause times. Every `site_every` frames a
+    tracemalloc snapshot diff attributes the frame's allocations to
+    source lines; snapshots are slow, so only those frames pay for them.
+
+    pygame keeps pixel data outside the Python allocator, so a new
+    Surface shows up as its (small) Python object; count surfaces by
+    call site rather than by bytes.
+
+    Before Python 3.12, a sound finishing while tracing can crash the
+    interpreter: pygame's mixer takes the GIL from SDL's audio thread,
+    and the new thread state's allocation trips tracemalloc.
+    """
+    _IGNORE = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    )
+
+    def __init__(self, site_every: int = 30, depth: int = 1):
+        self.site_every = site_every
+        self.depth      = depth
+        self.states: dict[str, StateAllocations] = {}
+        self._owns_tracing = False
+        self._current: StateAllocations|None = None
+        self._frame    = 0
+        self._bytes0   = 0
+        self._blocks0  = 0
+        self._snapshot: tracemalloc.Snapshot|None = None
+        self._gc_start = 0.0
+        # What begin/end themselves leave behind, subtracted from each frame
+        self._overhead_bytes = 0
+        self._overhead_peak  = 0
+
+    # ——— Lifecycle ———
+    def start(self) -> "AllocationTracker":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.depth)
+            self._owns_tracing = True
+        gc.callbacks.append(self._on_gc)
+        self._calibrate()
+        return self
+
+    def _calibrate(self) -> None:
+        """Measure empty frames so the tracker's own bookkeeping is not reported."""
+        site_every, self.site_every = self.site_every, 0
+        net, peak = [], []
+        for _ in range(8):
+            self.begin_frame("")
+            self.end_frame()
+            stats = self.states.pop("")
+            net.append(stats.net_bytes)
+            peak.append(stats.peak_bytes)
+        self._overhead_bytes += min(net)
+        self._overhead_peak  += min(peak)
+        self.site_every = site_every
+        self._frame = 0
+
+    def stop(self) -> None:
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def __enter__(self) -> "AllocationTracker":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ——— Per frame ———
+    def begin_frame(self, state: str) -> None:
+        stats = self.states.get(state)
+        if stats is None:
+            stats = self.states[state] = StateAllocations()
+        self._current = stats
+        self._frame += 1
+        if self.site_every and self._frame % self.site_every == 0:
+            self._snapshot = tracemalloc.take_snapshot().filter_traces(self._IGNORE)
+        tracemalloc.reset_peak()
+        self._blocks0 = sys.getallocatedblocks()
+        self._bytes0  = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self) -> None:
+        blocks = sys.getallocatedblocks()
+        current, peak = tracemalloc.get_traced_memory()
+        stats = self._current
+        if stats is None:
+            return
+        stats.frames     += 1
+        stats.net_bytes  += current - self._bytes0 - self._overhead_bytes
+        stats.net_blocks += blocks - self._blocks0
+        transient = peak - self._bytes0 - self._overhead_peak
+        stats.peak_bytes += transient
+        if transient > stats.max_peak_bytes:
+            stats.max_peak_bytes = transient
+
+        if self._snapshot is not None:
+            after = tracemalloc.take_snapshot().filter_traces(self._IGNORE)
+            for diff in after.compare_to(self._snapshot, "lineno"):
+                if diff.size_diff > 0:
+                    site = str(diff.traceback[0])
+                    stats.sites[site]       += diff.size_diff
+                    stats.site_blocks[site] += diff.count_diff
+            stats.sampled += 1
+            self._snapshot = None
+        self._current = None
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+            return
+        pause = time.perf_counter() - self._gc_start
+        stats = self._current
+        if stats is None:
+            return
+        stats.collections += 1
+        stats.gc_pause    += pause
+        if pause > stats.max_gc_pause:
+            stats.max_gc_pause = pause
+
+    # ——— Reporting ———
+    def report(self, top: int = 5) -> dict[str, dict]:
+        return {state: stats.summary(top) for state, stats in self.states.items()}
+
+    def log_report(self, top: int = 5) -> None:
+        for state, r in self.report(top).items():
+            logging.info(
+                "Allocations %s: %d frames, net %.0f B / %.1f blocks per frame, "
+                "peak %.0f B (max %d), %.1f GCs per 1000 frames, GC pause %.2f ms (max %.2f)",
+                state, r["frames"], r["net_bytes_per_frame"], r["net_blocks_per_frame"],
+                r["peak_bytes_per_frame"], r["max_peak_bytes"], r["gc_per_1000_frames"],
+                r["gc_pause_ms"], r["max_gc_pause_ms"],
+            )
+            for site, size, blocks in r["sites"]:
+                logging.info("  %s: %.0f B, %.1f blocks per sampled frame", site, size, blocks)
@@ -0,0 +1,352 @@
+# analytics.py
+
+import io
+import csv
+import logging
+
+import numpy as np
+
+from players import PlayerRegistry
+
+class MatchAnalytics:
+    """
+    The full match history as columnar NumPy arrays, one row per match,
+    with players as interned ids (from the shared PlayerRegistry).
+
+    Aggregates — head-to-head counts, and per player id the matches
+    played and won, summed game margins, best and current win streaks —
+    are computed in vectorized passes when history is loaded, then
+    updated in place by add() as each new match is recorded: O(1) for
+    players and pairs already seen. Head-to-head counts are kept per
+    pair that has met, as a sorted key array (a dense players x players
+    matrix would not fit a large registry), so a pair's first meeting
+    is a sorted insert, O(pairs); a new player widens the per-player
+    arrays, O(players). head_to_head() builds the matrix for the players
+    a view shows. Per-player form is computed on demand and cached until
+    that player plays again.
+
+    Matches older than the leaderboard's retention window are not held
+    as rows: load_rollup() seeds the aggregates from their compacted
+    totals (see retention.py), and the columns hold the recent detail.
+    """
+    def __init__(self, players: PlayerRegistry, capacity: int = 256):
+        self.players = players
+        self.n = 0
+        self.when         = np.empty(capacity, "datetime64[m]")
+        self.winner       = np.empty(capacity, np.int32)
+        self.loser        = np.empty(capacity, np.int32)
+        self.winner_games = np.empty(capacity, np.int16)
+        self.loser_games  = np.empty(capacity, np.int16)
+
+        # Aggregates, indexed by player id (grown as players appear)
+        # Head-to-head: sorted (a << 32 | b) keys of pairs that have met, and
+        # how many matches a won against b
+        self.pair_keys   = np.zeros(0, np.int64)
+        self.pair_counts = np.zeros(0, np.int32)
+        self.played = np.zeros(0, np.int32)
+        self.won    = np.zeros(0, np.int32)
+        self.margin = np.zeros(0, np.int64)        # sum of (own - opponent) games
+        self.best_streak = np.zeros(0, np.int32)   # longest run of match wins
+        self.streak = np.zeros(0, np.int32)        # current run: +wins or -losses
+        self._form: dict[tuple[int,int], np.ndarray] = {}
+
+        # Compacted history the aggregates start from, set by load_rollup()
+        self.base_pair_keys   = np.zeros(0, np.int64)
+        self.base_pair_counts = np.zeros(0, np.int32)
+        self.base_played = np.zeros(0, np.int32)
+        self.base_won    = np.zeros(0, np.int32)
+        self.base_margin = np.zeros(0, np.int64)
+        self.base_best   = np.zeros(0, np.int32)
+        self.base_streak = np.zeros(0, np.int32)
+        self.base_results: dict[int, np.ndarray] = {}   # each player's latest compacted results
+
+    # ——— Loading ———
+    def load_csv(self, path: str, start: int = 0) -> None:
+        """
+        Load a leaderboard CSV, which holds two rows per match (winner
+        row, then loser row), from byte offset `start` (past the header
+        when given). The rows become one object array whose
+        columns are sliced out and converted, and names are interned
+        once per distinct spelling. A torn last line (from a crashed
+        writer) and blank or malformed rows are skipped with a warning.
+        """
+        try:
+            with open(path, "rb") as raw:
+                raw.seek(start)
+                data = raw.read()
+        except OSError:
+            logging.exception("Could not read %s", path)
+            return
+        # Whole lines only, as in Leaderboard._read_tail
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            logging.warning("%s ends in a torn line; ignoring it", path)
+        reader = csv.reader(io.StringIO(data[:end].decode(), newline=""))
+        if not start:
+            next(reader, None)
+        rows = list(reader)
+        complete = [row for row in rows if len(row) == 6]
+        if len(complete) < len(rows):
+            logging.warning("%s has %d malformed rows; ignoring them", path, len(rows) - len(complete))
+        if not complete:
+            return
+        table = np.array(complete, dtype=object)
+        when, player, won, _, games, against = table.T
+        rows = len(player) - len(player) % 2
+        if rows < len(player):
+            logging.warning("%s has an unpaired row; ignoring it", path)
+        # Row index of each match's winner (pairs are written winner first,
+        # but don't rely on it) and of its loser, the other row of the pair
+        win_row  = np.arange(0, rows, 2) + (won[0:rows:2] == "0")
+        lose_row = win_row ^ 1
+        ids = self._intern_all(player)
+        self.extend(
+            when[win_row], ids[win_row], ids[lose_row],
+            games[win_row].astype(np.int16), against[win_row].astype(np.int16),
+        )
+
+    def load_entries(self, entries: list[dict]) -> None:
+        """Load leaderboard JSON entries (newest first)."""
+        entries = entries[::-1]
+        if not entries:
+            return
+        self.extend(
+            [e["when"] for e in entries],
+            self._intern_all(np.array([e["winner"] for e in entries], dtype=object)),
+            self._intern_all(np.array([e["loser"] for e in entries], dtype=object)),
+            [e["winner_games"] for e in entries],
+            [e["loser_games"] for e in entries],
+        )
+
+    def load_rollup(self, rollup: dict) -> None:
+        """
+        Start from compacted history: per-period pair totals, and each
+        player's streak state and latest results (see retention.py).
+        """
+        pairs, carried = rollup["pairs"], list(rollup["players"].values())
+        if not pairs and not carried:
+            return
+        n = len(pairs)
+        names = [name for row in pairs for name in row[1:3]] + [c[0] for c in carried]
+        ids = self._intern_all(np.array(names, dtype=object))
+        w, l = ids[0:2*n:2], ids[1:2*n:2]
+        totals = np.array([row[3:6] for row in pairs], np.int64).reshape(n, 3)
+        matches, diff = totals[:, 0], totals[:, 1] - totals[:, 2]
+        p = len(self.players)
+
+        self.base_pair_keys, inverse = np.unique((w.astype(np.int64) << 32) | l, return_inverse=True)
+        self.base_pair_counts = np.bincount(inverse, weights=matches).astype(np.int32)
+        self.base_won    = np.bincount(w, weights=matches, minlength=p).astype(np.int32)
+        self.base_played = self.base_won + np.bincount(l, weights=matches, minlength=p).astype(np.int32)
+        self.base_margin = (np.bincount(w, weights=diff, minlength=p)
+                            - np.bincount(l, weights=diff, minlength=p)).astype(np.int64)
+        self.base_best   = np.zeros(p, np.int32)
+        self.base_streak = np.zeros(p, np.int32)
+        for pid, (_, best, streak, tail) in zip(ids[2*n:], carried):
+            self.base_best[pid], self.base_streak[pid] = best, streak
+            self.base_results[int(pid)] = np.array([c == "W" for c in tail], np.int8)
+        self._recompute()
+
+    def _intern_all(self, names: np.ndarray) -> np.ndarray:
+        unique, inverse = np.unique(names.astype(str), return_inverse=True)
+        self.players.extend(unique)     # one index sort for all new names
+        ids = np.fromiter((self.players.intern(n) for n in unique), np.int32, len(unique))
+        return ids[inverse]
+
+    def extend(self, when, winner, loser, winner_games, loser_games) -> None:
+        """Append many matches (oldest first) and recompute the aggregates."""
+        m = len(winner)
+        self._reserve(self.n + m)
+        end = self.n + m
+        self.when[self.n:end]         = np.asarray(when, dtype="datetime64[m]")
+        self.winner[self.n:end]       = winner
+        self.loser[self.n:end]        = loser
+        self.winner_games[self.n:end] = winner_games
+        self.loser_games[self.n:end]  = loser_games
+        self.n = end
+        self._recompute()
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self.winner)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ("when", "winner", "loser", "winner_games", "loser_games"):
+            old = getattr(self, name)
+            new = np.empty(capacity, old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def _grow_players(self) -> None:
+        """Widen the per-player aggregates to cover every registered id."""
+        p = len(self.players)
+        for name in ("played", "won", "margin", "best_streak", "streak",
+                     "base_played", "base_won", "base_margin", "base_best", "base_streak"):
+            arr = getattr(self, name)
+            if len(arr) < p:
+                setattr(self, name, np.concatenate([arr, np.zeros(p - len(arr), arr.dtype)]))
+
+    # ——— Aggregates ———
+    def _recompute(self) -> None:
+        """All aggregates from the compacted totals and the columns, in vectorized passes."""
+        self._grow_players()
+        p = len(self.players)
+        w, l = self.winner[:self.n], self.loser[:self.n]
+        diff = (self.winner_games[:self.n] - self.loser_games[:self.n]).astype(np.int64)
+
+        keys = np.concatenate([self.base_pair_keys, (w.astype(np.int64) << 32) | l])
+        self.pair_keys, inverse = np.unique(keys, return_inverse=True)
+        counts = np.concatenate([self.base_pair_counts, np.ones(self.n, np.int32)])
+        self.pair_counts = np.bincount(inverse, weights=counts, minlength=len(self.pair_keys)).astype(np.int32)
+        won = np.bincount(w, minlength=p).astype(np.int32)
+        self.won    = self.base_won + won
+        self.played = self.base_played + won + np.bincount(l, minlength=p).astype(np.int32)
+        self.margin = self.base_margin + (np.bincount(w, weights=diff, minlength=p)
+                                          - np.bincount(l, weights=diff, minlength=p)).astype(np.int64)
+
+        # Streaks: each player's results in time order, split into runs
+        pid = np.column_stack((w, l)).ravel()
+        res = np.tile(np.array([1, 0], np.int8), self.n)
+        order = np.argsort(pid, kind="stable")
+        pid, res = pid[order], res[order]
+        self.best_streak = self.base_best.copy()
+        self.streak      = self.base_streak.copy()
+        self._form.clear()
+        if not len(pid):
+            return
+        starts = np.empty(len(pid), bool)
+        starts[0] = True
+        starts[1:] = (pid[1:] != pid[:-1]) | (res[1:] != res[:-1])
+        run_len    = np.bincount(np.cumsum(starts) - 1)
+        run_player = pid[starts]
+        run_win    = res[starts] == 1
+        # A player's first run continues their compacted streak of the same kind
+        first = np.empty(len(run_player), bool)
+        first[0] = True
+        first[1:] = run_player[1:] != run_player[:-1]
+        carried = self.base_streak[run_player[first]]
+        same = np.where(run_win[first], carried > 0, carried < 0)
+        run_len[first] += np.where(same, np.abs(carried), 0)
+        np.maximum.at(self.best_streak, run_player[run_win], run_len[run_win])
+        last = np.empty(len(run_player), bool)
+        last[-1] = True
+        last[:-1] = run_player[1:] != run_player[:-1]
+        self.streak[run_player[last]] = np.where(run_win, run_len, -run_len)[last]
+
+    def add(self, when: str, winner: str, loser: str, winner_games: int, loser_games: int) -> None:
+        """
+        Append one match, updating every aggregate in place: O(1), but
+        O(pairs) for a pair's first meeting and O(players) for a new player.
+        """
+        w, l = self.players.intern(winner), self.players.intern(loser)
+        self._reserve(self.n + 1)
+        i = self.n
+        self.when[i], self.winner[i], self.loser[i] = np.datetime64(when, "m"), w, l
+        self.winner_games[i], self.loser_games[i] = winner_games, loser_games
+        self.n += 1
+
+        self._grow_players()
+        key = (w << 32) | l
+        at = np.searchsorted(self.pair_keys, key)
+        if at < len(self.pair_keys) and self.pair_keys[at] == key:
+            self.pair_counts[at] += 1
+        else:
+            self.pair_keys   = np.insert(self.pair_keys, at, key)
+            self.pair_counts = np.insert(self.pair_counts, at, 1)
+        self.played[w] += 1; self.played[l] += 1
+        self.won[w] += 1
+        self.margin[w] += winner_games - loser_games
+        self.margin[l] -= winner_games - loser_games
+        self.streak[w] = self.streak[w] + 1 if self.streak[w] > 0 else 1
+        self.streak[l] = self.streak[l] - 1 if self.streak[l] < 0 else -1
+        self.best_streak[w] = max(self.best_streak[w], self.streak[w])
+        for key in [k for k in self._form if k[0] in (w, l)]:
+            del self._form[key]
+
+    # ——— Queries ———
+    def results(self, pid: int) -> np.ndarray:
+        """
+        1 (won) / 0 (lost) for each of the player's matches, oldest first.
+        Of compacted matches, only the latest retention.TAIL are included.
+        """
+        w, l = self.winner[:self.n], self.loser[:self.n]
+        mine = (w == pid) | (l == pid)
+        detail = (w[mine] == pid).astype(np.int8)
+        base = self.base_results.get(pid)
+        return detail if base is None else np.concatenate([base, detail])
+
+    def form(self, pid: int, window: int = 10) -> np.ndarray:
+        """
+        The player's win rate over their last `window` matches, after
+        each match they played (fewer at the start of their history).
+        """
+        key = (pid, window)
+        cached = self._form.get(key)
+        if cached is None:
+            res = self.results(pid)
+            total = np.cumsum(res, dtype=np.int32)
+            lagged = np.zeros_like(total)
+            lagged[window:] = total[:-window]
+            count = np.minimum(np.arange(1, len(res) + 1), window)
+            cached = self._form[key] = (total - lagged) / count
+        return cached
+
+    def head_to_head(self, ids) -> np.ndarray:
+        """Matrix m for `ids`: m[i, j] = matches ids[i] won against ids[j]."""
+        ids = np.asarray(ids, np.int64)
+        keys = (ids[:, None] << 32) | ids[None, :]
+        at = np.minimum(np.searchsorted(self.pair_keys, keys), max(len(self.pair_keys) - 1, 0))
+        if not len(self.pair_keys):
+            return np.zeros(keys.shape, np.int32)
+        return np.where(self.pair_keys[at] == keys, self.pair_counts[at], 0).astype(np.int32)
+
+    def ranked(self, limit: int|None = 10) -> np.ndarray:
+        """Ids of the most active players, most matches first."""
+        self._grow_players()
+        active = np.flatnonzero(self.played)
+        order = np.argsort(-self.played[active], kind="stable")
+        return active[order][:limit]
+
+    def win_rate(self) -> np.ndarray:
+        return self.won / np.maximum(self.played, 1)
+
+    def average_margin(self) -> np.ndarray:
+        """Mean (own - opponent) games per match, per player."""
+        return self.margin / np.maximum(self.played, 1)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+    import random
+    import tempfile
+    # Load and add() cost: python analytics.py [matches] [players]
+    matches = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    players = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    rng = random.Random(0)
+    names = [f"P{i}" for i in range(players)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.csv")
+        with open(path, "w", newline="") as f:
+            out = csv.writer(f)
+            out.writerow(["when","player","matches_won","matches_lost","games_won","games_lost"])
+            for i in range(matches):
+                w, l = rng.sample(names, 2)
+                lg = rng.randint(0, 2)
+                out.writerow(["2025-01-01 00:00", w, 1, 0, 3, lg])
+                out.writerow(["2025-01-01 00:00", l, 0, 1, lg, 3])
+        a = MatchAnalytics(PlayerRegistry())
+        start = time.perf_counter()
+        a.load_csv(path)
+        load = time.perf_counter() - start
+    adds = 1000
+    start = time.perf_counter()
+    for _ in range(adds):
+        w, l = rng.sample(names, 2)
+        a.add("2025-01-02 00:00", w, l, 3, 1)
+    add = (time.perf_counter() - start) / adds
+    print(f"matches: {a.n}")
+    print(f"load_s: {load:.3f}")
+    print(f"add_us: {add * 1e6:.1f}")
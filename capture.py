@@ -0,0 +1,150 @@
+# capture.py
+
+import os
+import json
+import queue
+import logging
+import threading
+from datetime import datetime
+
+import pygame
+
+from constants import CAPTURE_DIR, FPS
+
+class FrameRecorder:
+    """
+    Records presented frames without stalling the game loop.
+
+    capture() copies the surface's raw pixels (through its BufferProxy)
+    into one of a fixed pool of preallocated byte buffers and queues it;
+    a background thread writes it out and returns the buffer to the pool.
+    If the writer falls behind and no buffer is free, the frame is
+    dropped and counted, so recording never lowers the frame rate.
+
+    Formats:
+      - "raw": every frame appended to frames.raw, described by
+               clip.json (ffmpeg: -f rawvideo -pix_fmt bgr0 -s WxH -r FPS)
+      - "png": one frame_NNNNNN.png per frame
+    """
+    FORMATS = ("raw", "png")
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        out_dir: str|None = None,
+        fmt: str = "raw",
+        pool: int = 8,
+        fps: int = FPS
+    ):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown capture format: {fmt}")
+        if surface.get_bytesize() != 4:
+            raise ValueError("Capture needs a 32-bit surface")
+        self.size    = surface.get_size()
+        self.pitch   = surface.get_pitch()
+        self.masks   = surface.get_masks()
+        self.fmt     = fmt
+        self.out_dir = out_dir or os.path.join(
+            CAPTURE_DIR, datetime.now().strftime("%Y%m%d-%H%M%S")
+        )
+        os.makedirs(self.out_dir, exist_ok=True)
+
+        self.captured = 0
+        self.written  = 0
+        self.dropped  = 0
+        frame_bytes = self.pitch * self.size[1]
+        self._free: queue.SimpleQueue = queue.SimpleQueue()
+        self._full: queue.SimpleQueue = queue.SimpleQueue()
+        for _ in range(pool):
+            self._free.put(bytearray(frame_bytes))
+
+        with open(os.path.join(self.out_dir, "clip.json"), "w") as f:
+            json.dump({
+                "format": fmt, "size": list(self.size), "pitch": self.pitch,
+                "masks": list(self.masks), "fps": fps,
+                "pix_fmt": "bgr0" if self.masks[0] == 0xff0000 else "rgb0",
+            }, f, indent=2)
+
+        self._writer = threading.Thread(target=self._write_loop, name="capture", daemon=True)
+        self._writer.start()
+
+    def capture(self, surface: pygame.Surface) -> bool:
+        """Queue a copy of `surface`; returns False if the frame was dropped."""
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        proxy = surface.get_buffer()
+        memoryview(buf)[:] = proxy
+        del proxy   # releases the surface lock
+        self._full.put((self.captured, buf))
+        self.captured += 1
+        return True
+
+    def close(self) -> None:
+        """Finish writing queued frames."""
+        self._full.put(None)
+        self._writer.join()
+        logging.info(
+            "Capture %s: %d frames written, %d dropped",
+            self.out_dir, self.written, self.dropped
+        )
+
+    def _write_loop(self) -> None:
+        raw = None
+        target = None
+        if self.fmt == "raw":
+            raw = open(os.path.join(self.out_dir, "frames.raw"), "ab")
+        else:
+            # One reusable surface to wrap each frame for saving
+            target = pygame.Surface(self.size, 0, 32, self.masks)
+        try:
+            while True:
+                item = self._full.get()
+                if item is None:
+                    return
+                index, buf = item
+                try:
+                    if raw is not None:
+                        raw.write(buf)
+                    else:
+                        target.get_buffer().write(bytes(buf))
+                        pygame.image.save(
+                            target, os.path.join(self.out_dir, f"frame_{index:06d}.png")
+                        )
+                    self.written += 1
+                except (OSError, pygame.error):
+                    logging.exception("Could not write captured frame %d", index)
+                finally:
+                    self._free.put(buf)
+        finally:
+            if raw is not None:
+                raw.close()
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import tempfile
+    # Capture cost per frame: python capture.py [raw|png] [frames] [WxH]
+    fmt    = sys.argv[1] if len(sys.argv) > 1 else "raw"
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    size   = tuple(int(n) for n in (sys.argv[3] if len(sys.argv) > 3 else "800x600").split("x"))
+    pygame.init()
+    screen = pygame.display.set_mode(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        rec = FrameRecorder(screen, out_dir=tmp, fmt=fmt)
+        total = 0.0
+        for i in range(frames):
+            screen.fill((i % 256, 0, 0))
+            start = time.perf_counter()
+            rec.capture(screen)
+            total += time.perf_counter() - start
+            time.sleep(1.0 / FPS)
+        rec.close()
+    print(f"capture_ms: {total / frames * 1000:.3f}")
+    print(f"budget_ms: {1000 / FPS:.2f}")
+    print(f"written: {rec.written}")
+    print(f"dropped: {rec.dropped}")
+    pygame.quit()
@@ -4,8 +4,53 @@ import os
 # Size of the game window in pixels.
 SCREEN_WIDTH: int  = 800
 SCREEN_HEIGHT: int = 600
+# Window size, e.g. PONG_DISPLAY=3840x2160; screens are laid out at
+# SCREEN_WIDTH x SCREEN_HEIGHT and fitted to it (see display.py).
+DISPLAY_SIZE: tuple[int,int] = tuple(
+    int(n) for n in os.environ.get("PONG_DISPLAY", f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}").lower().split("x")
+)
+# How a larger window is filled: "native" draws the match at the window's
+# resolution, "scale" scales every frame up. PONG_RENDER_MODE.
+RENDER_MODE: str   = os.environ.get("PONG_RENDER_MODE", "native")
 # How many frames to draw per second.
 FPS: int           = 60
+# Frame pacing: "tick" (coarse sleep), "busy" (busy-wait) or "hybrid"
+# (sleep + spin, late input sampling). Override with PONG_FRAME_PACING.
+FRAME_PACING: str  = os.environ.get("PONG_FRAME_PACING", "tick")
+# Allocation/GC instrumentation per frame and GameState (see allocations.py).
+# Enable with PONG_ALLOC_PROFILE=1; the report is logged at exit.
+ALLOC_PROFILE: bool = os.environ.get("PONG_ALLOC_PROFILE", "") not in ("", "0")
+# Run physics for frame N+1 on a worker thread while frame N is drawn
+# (one frame more input latency, more throughput). PONG_PIPELINE=1.
+PIPELINE: bool = os.environ.get("PONG_PIPELINE", "") not in ("", "0")
+# Shed optional rendering work when frames run over budget (governor.py).
+# On by default; PONG_FRAME_GOVERNOR=0 always renders at full quality.
+FRAME_GOVERNOR: bool = os.environ.get("PONG_FRAME_GOVERNOR", "1") not in ("", "0")
+# Ball trails and impact sparks (see particles.py); PONG_PARTICLES=0 turns
+# them off. They may use PARTICLE_BUDGET of each frame's time, and fewer
+# than PARTICLE_CAPACITY particles are kept alive when that is exceeded.
+PARTICLES:         bool  = os.environ.get("PONG_PARTICLES", "1") not in ("", "0")
+PARTICLE_CAPACITY: int   = 4096
+PARTICLE_BUDGET:   float = 0.1
+# Multi-table mode (see tables.py): tournaments play up to PONG_TABLES
+# matches at once (2-9), each in its own part of the screen. 1 = off.
+TABLES: int = int(os.environ.get("PONG_TABLES", "1"))
+# TCP port for the spectator broadcast server (0 = disabled).
+SPECTATOR_PORT: int = int(os.environ.get("PONG_SPECTATOR_PORT", "0"))
+# Port for the Prometheus metrics endpoint on localhost (0 = disabled).
+METRICS_PORT: int = int(os.environ.get("PONG_METRICS_PORT", "0"))
+
+# ——— Physics ———
+# Paddle size and speed, ball speed and size, in pixels (per frame) at
+# SCREEN_WIDTH x SCREEN_HEIGHT. A key of the same name in the settings
+# (settings.json) overrides each for a game; sweep.py searches them.
+PHYSICS: dict[str,int] = {
+    "paddle_w":     10,
+    "paddle_h":     100,
+    "paddle_speed": 5,
+    "ball_speed":   4,
+    "ball_radius":  8,
+}
 
 # ——— Color Definitions ———
 # Background and foreground colors (RGB).
@@ -27,6 +72,22 @@ ASSET_DIR:     str = os.path.join(BASE_DIR, 'assets')
 SOUND_DIR:     str = os.path.join(ASSET_DIR, 'sounds')
 # Persistent settings for number of matches, etc.
 SETTINGS_FILE: str = os.path.join(BASE_DIR, 'settings.json')
-# Leaderboard data storage.
-LEADER_JSON:   str = os.path.join(BASE_DIR, 'leaderboard.json')
-LEADER_CSV:    str = os.path.join(BASE_DIR, 'leaderboard.csv')
+# Leaderboard data storage. Cabinets sharing one leaderboard point
+# PONG_LEADERBOARD_DIR at the same directory on a shared volume.
+LEADER_DIR:    str = os.environ.get("PONG_LEADERBOARD_DIR", BASE_DIR)
+LEADER_JSON:   str = os.path.join(LEADER_DIR, 'leaderboard.json')
+LEADER_CSV:    str = os.path.join(LEADER_DIR, 'leaderboard.csv')
+# Retention (see retention.py): matches stay in the CSV in full detail
+# for LEADER_DETAIL_DAYS, then are compacted into per-day totals per
+# pair, which are merged into per-month totals after LEADER_DAILY_DAYS.
+LEADER_DETAIL_DAYS: int = int(os.environ.get("PONG_LEADERBOARD_DETAIL_DAYS", "30"))
+LEADER_DAILY_DAYS:  int = 365
+# Append-only binary log of gameplay events (see telemetry.py).
+TELEMETRY_FILE: str = os.path.join(BASE_DIR, 'telemetry.bin')
+# Highlight clips recorded with F9 ("raw" frames or a "png" sequence).
+CAPTURE_DIR:    str = os.path.join(BASE_DIR, 'captures')
+CAPTURE_FORMAT: str = os.environ.get("PONG_CAPTURE_FORMAT", "raw")
+# Append-only series journal, replayed on startup to resume a series.
+JOURNAL_FILE:   str = os.path.join(BASE_DIR, 'series_journal.jsonl')
+# Optional list of tournament entrants, one name per line.
+ENTRANTS_FILE: str = os.path.join(BASE_DIR, 'entrants.txt')
@@ -0,0 +1,147 @@
+# display.py
+
+import pygame
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BG, FONT_PATH
+from utils     import get_font
+from game      import GameSprites
+
+class Display:
+    """
+    The window, and the SCREEN_WIDTH x SCREEN_HEIGHT logical surface
+    every screen lays out in. The logical frame is fitted to the window
+    (letterboxed, aspect kept) in one of two ways:
+
+      "scale"   screens draw the logical frame, and present() scales it
+                into the window once; one whole-frame scale per present
+      "native"  a scene that supports it (the match) draws straight into
+                the window at its resolution, with sprites and fonts
+                pre-scaled once per resolution (game_sprites(), font());
+                other screens are scaled as above
+
+    When the window is the logical size, `surface` is the window itself
+    and neither costs anything.
+    """
+    def __init__(
+        self,
+        window: pygame.Surface,
+        mode: str = "native",
+        logical_size: tuple[int,int] = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    ):
+        if mode not in ("scale", "native"):
+            raise ValueError(f"unknown render mode {mode!r}")
+        self.window = window
+        self.mode   = mode
+        self.logical_size = logical_size
+        lw, lh = logical_size
+        ww, wh = window.get_size()
+        self.scale = min(ww / lw, wh / lh)
+        self.viewport = pygame.Rect(0, 0, round(lw * self.scale), round(lh * self.scale))
+        self.viewport.center = window.get_rect().center
+        # The window area frames are drawn in; the bars outside stay clear
+        self.view = window if self.viewport == window.get_rect() else window.subsurface(self.viewport)
+        if self.viewport.size == logical_size:
+            self.surface = self.view
+        else:
+            window.fill(COLOR_BG)
+            self.surface = pygame.Surface(logical_size).convert(window)
+        self._sprites: dict[tuple, GameSprites] = {}
+        self._fonts: dict[int, pygame.font.Font] = {}
+        self._native = False        # this frame was drawn into `view`
+        self._shown_native = False  # the frame on screen was
+
+    @property
+    def scaled(self) -> bool:
+        return self.surface is not self.view
+
+    # ——— Per-resolution assets ———
+    def game_sprites(self, physics: dict|None = None) -> GameSprites:
+        """Game images (sized by `physics`) and score font pre-scaled to the window, made once."""
+        key = tuple(sorted((physics or {}).items()))
+        sprites = self._sprites.get(key)
+        if sprites is None:
+            sprites = self._sprites[key] = GameSprites(scale=self.scale, physics=physics)
+        return sprites
+
+    def font(self, size: int) -> pygame.font.Font:
+        """The font of logical point size `size`, at the window's resolution."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = get_font(round(size * self.scale), FONT_PATH)
+        return font
+
+    # ——— Per frame ———
+    def native_target(self) -> pygame.Surface|None:
+        """
+        For a scene that can draw this frame at the window's resolution:
+        the surface to draw it on, or None to draw on `surface` as usual.
+        """
+        if self.mode != "native" or not self.scaled:
+            return None
+        self._native = True
+        return self.view
+
+    def present(self) -> None:
+        """Put the frame on screen, scaling the logical one if it was drawn there."""
+        if self.scaled and not self._native:
+            pygame.transform.scale(self.surface, self.viewport.size, self.view)
+        self._shown_native, self._native = self._native, False
+        pygame.display.flip()
+
+    def capture_native(self) -> None:
+        """
+        Copy a natively drawn frame on screen into `surface`, so an
+        overlay entered now freezes it as its backdrop.
+        """
+        if self._shown_native:
+            pygame.transform.smoothscale(self.view, self.logical_size, self.surface)
+
+    def to_logical(self, pos: tuple[int,int]) -> tuple[int,int]:
+        """A window position (mouse) in logical coordinates."""
+        return (
+            int((pos[0] - self.viewport.x) / self.scale),
+            int((pos[1] - self.viewport.y) / self.scale),
+        )
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from constants import FPS
+    from events    import EventBus
+    from game      import Game
+    from particles import ParticleSystem
+    # Match frame cost in each mode: python display.py [WxH] [frames]
+    pygame.init()
+    size = tuple(int(n) for n in (sys.argv[1] if len(sys.argv) > 1 else "3840x2160").split("x"))
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    window = pygame.display.set_mode(size)
+    settings = {"points_to_win": 10**6, "games_per_match": 1, "balls": 4}
+    print(f"window: {size[0]}x{size[1]}")
+    for mode in ("scale", "native"):
+        display = Display(window, mode)
+        bus = EventBus()
+        particles = ParticleSystem(seed=0)
+        particles.attach(bus)
+        game = Game(display.surface, ["A", "B"], settings, bus=bus)
+        keys = pygame.key.get_pressed()
+        total = 0.0
+        for _ in range(frames):
+            game.update(keys)
+            particles.trail(game.ball_grp)
+            particles.update()
+            start = time.perf_counter()
+            target = display.native_target()
+            if target is None:
+                display.surface.fill(COLOR_BG)
+                particles.draw(display.surface)
+                game.draw()
+            else:
+                target.fill(COLOR_BG)
+                particles.draw(target, display.scale)
+                game.draw(None, target, display.game_sprites(game.sprites.physics))
+            display.present()
+            total += time.perf_counter() - start
+        print(f"{mode}_frame_ms: {total / frames * 1000:.2f}")
+    print(f"budget_ms: {1000 / FPS:.2f}")
+    pygame.quit()
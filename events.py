@@ -0,0 +1,95 @@
+# events.py
+
+from dataclasses import dataclass
+from typing      import Callable, TypeVar
+
+# ——— Gameplay events ———
+# `frame` is the Game's frame counter; `player` is 0 (left) or 1 (right).
+
+@dataclass(frozen=True, slots=True)
+class PaddleHit:
+    frame:  int
+    player: int
+    offset: float   # where the ball met the paddle: -1 top … 0 centre … 1 bottom
+    speed:  float   # ball speed (pixels per frame) after the hit
+    x:      int     # ball centre
+    y:      int
+
+@dataclass(frozen=True, slots=True)
+class WallBounce:
+    frame: int
+    x:     int
+    y:     int
+
+@dataclass(frozen=True, slots=True)
+class BallCollision:
+    frame: int
+    x:     int
+    y:     int
+
+@dataclass(frozen=True, slots=True)
+class PointScored:
+    frame:  int
+    player: int
+    name:   str
+    rally:  int     # paddle hits since the previous point
+    x:      int     # where the ball left the field
+    y:      int
+
+@dataclass(frozen=True, slots=True)
+class GameWon:
+    frame:  int
+    player: int
+    name:   str
+
+@dataclass(frozen=True, slots=True)
+class MatchWon:
+    frame:  int
+    player: int
+    name:   str
+    games:  tuple[int,int]
+
+
+E = TypeVar("E")
+
+class EventBus:
+    """
+    Synchronous publish/subscribe keyed by event class.
+    Publishing costs one dict lookup plus a call per subscriber, so it is
+    safe to use from the frame loop.
+    """
+    def __init__(self):
+        self._handlers: dict[type, list[Callable]] = {}
+
+    def subscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event: object) -> None:
+        for handler in self._handlers.get(type(event), ()):
+            handler(event)
+
+
+class EventBuffer:
+    """
+    Stands in for an EventBus while a Game is updated off the main
+    thread: publish() only records the event, and flush() replays the
+    recorded events on the real bus, in order, from the caller's thread.
+    """
+    def __init__(self):
+        self.events: list[object] = []
+
+    def publish(self, event: object) -> None:
+        self.events.append(event)
+
+    def flush(self, bus: EventBus) -> None:
+        for event in self.events:
+            bus.publish(event)
+        self.events.clear()
+
+    def clear(self) -> None:
+        self.events.clear()
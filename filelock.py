@@ -0,0 +1,44 @@
+# filelock.py
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+@contextmanager
+def locked(path: str, shared: bool = False) -> Iterator[None]:
+    """
+    Hold an advisory lock on `path` (created if missing) for the block.
+
+    Exclusive holders exclude everyone; shared holders exclude only
+    exclusive ones. Works between processes on one host, and on shared
+    volumes whose server supports locking (NFS, SMB). On Windows every
+    lock is exclusive.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10 s; a long writer just means waiting longer
+                    time.sleep(0.01)
+        yield
+    finally:
+        if fcntl is None:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            except OSError:
+                pass
+        # Closing the descriptor releases an flock
+        os.close(fd)
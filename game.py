@@ -1,10 +1,36 @@
 # game.py
 
-import os
+import time
+import random
+import logging
 import pygame
 
-from constants import SOUND_DIR, FONT_PATH
+import metrics
+
+from constants import FONT_PATH, PHYSICS
 from utils     import draw_text
+from spatial   import SpatialHash
+from logsetup  import RateLimitedLogger
+from sound     import SoundEffects
+from events    import (
+    EventBus, PaddleHit, WallBounce, BallCollision, PointScored, GameWon
+)
+
+# Physics trace: at most one line per second from the frame loop
+physics_log = RateLimitedLogger(logging.getLogger("physics"), interval=1.0)
+
+update_seconds = metrics.histogram("pong_game_update_seconds", "Time spent in one Game.update (physics step).")
+points_total   = metrics.counter("pong_points_total", "Points scored.")
+hits_total     = metrics.counter("pong_paddle_hits_total", "Balls returned by a paddle.")
+balls_in_play  = metrics.gauge("pong_balls", "Balls in play in the current game.")
+
+# (up, down) keys for the left and the right paddle
+Controls = tuple[tuple[int,int], tuple[int,int]]
+DEFAULT_CONTROLS: Controls = ((pygame.K_w, pygame.K_s), (pygame.K_UP, pygame.K_DOWN))
+
+def physics(settings: dict) -> dict[str,int]:
+    """The PHYSICS parameters for a game, with any overrides in `settings`."""
+    return {key: settings.get(key, default) for key, default in PHYSICS.items()}
 
 class Paddle(pygame.sprite.Sprite):
     """
@@ -15,11 +41,18 @@ class Paddle(pygame.sprite.Sprite):
         x: int, y: int,
         width: int, height: int,
         speed: int,
-        key_up: int, key_down: int
+        key_up: int, key_down: int,
+        image: pygame.Surface|None = None
     ):
+        """
+        :param image: paddle surface to share between games; a new one
+                      is made when omitted.
+        """
         super().__init__()
-        self.image = pygame.Surface((width, height))
-        self.image.fill((255,255,255))
+        if image is None:
+            image = pygame.Surface((width, height))
+            image.fill((255,255,255))
+        self.image = image
         self.rect  = self.image.get_rect(topleft=(x,y))
         self.speed = speed
         self.key_up   = key_up
@@ -36,17 +69,50 @@ class Ball(pygame.sprite.Sprite):
     """
     The pong ball that bounces off walls & paddles.
     """
-    def __init__(self, center_x: int, center_y: int, radius: int, speed_x: int, speed_y: int):
+    def __init__(
+        self,
+        center_x: int, center_y: int,
+        radius: int,
+        speed_x: int, speed_y: int,
+        image: pygame.Surface|None = None
+    ):
+        """
+        :param image: pre-rendered ball surface to share between many balls;
+                      a new one is drawn when omitted.
+        """
         super().__init__()
-        diameter = radius * 2
-        self.image = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255,255,255), (radius, radius), radius)
+        self.radius = radius
+        self.image = image if image is not None else Ball.make_image(radius)
         self.rect = self.image.get_rect(center=(center_x, center_y))
         self.speed_x = speed_x
         self.speed_y = speed_y
-        self.game_ref: "Game"  # set by Game
 
-    def update(self, paddles: pygame.sprite.Group, screen_w: int, screen_h: int) -> None:
+    @staticmethod
+    def make_image(radius: int, alpha: bool = True) -> pygame.Surface:
+        """
+        A white disc. With `alpha` False the corners are colour-keyed
+        instead of transparent pixels, which blits without blending.
+        """
+        diameter = radius * 2
+        if alpha:
+            image = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        else:
+            image = pygame.Surface((diameter, diameter))
+            image.set_colorkey((0,0,0), pygame.RLEACCEL)
+        pygame.draw.circle(image, (255,255,255), (radius, radius), radius)
+        return image
+
+    def update(
+        self,
+        paddles: pygame.sprite.Group,
+        screen_w: int, screen_h: int
+    ) -> tuple[bool, pygame.sprite.Sprite|None]:
+        """
+        Move one step, bouncing off walls and paddles.
+        Returns (bounced off a wall, paddle hit or None); the caller
+        turns these into events.
+        """
+        wall = False
         # Move
         self.rect.x += self.speed_x
         self.rect.y += self.speed_y
@@ -54,95 +120,255 @@ class Ball(pygame.sprite.Sprite):
         # Bounce off top/bottom
         if self.rect.top <= 0 or self.rect.bottom >= screen_h:
             self.speed_y *= -1
-            self.game_ref.snd_bounce.play()
+            wall = True
 
         # Bounce off any paddle
-        if pygame.sprite.spritecollideany(self, paddles):
+        paddle = pygame.sprite.spritecollideany(self, paddles)
+        if paddle:
             self.speed_x *= -1
-            self.game_ref.snd_bounce.play()
+        return wall, paddle
+
+
+class GameSprites:
+    """
+    The images and score font a Game draws with, at `scale` times the
+    sizes in `physics` (PHYSICS by default). Sprites only ever blit them,
+    so one set can serve any number of games (multi-table mode, see
+    tables.py), and their score digits share render_text's cache
+    through the one font.
+    """
+    def __init__(self, scale: float = 1.0, physics: dict|None = None):
+        self.scale = scale
+        self.physics = {**PHYSICS, **(physics or {})}
+        paddle_w, paddle_h = self.physics["paddle_w"], self.physics["paddle_h"]
+        self.paddle = pygame.Surface((max(2, round(paddle_w * scale)), max(8, round(paddle_h * scale))))
+        self.paddle.fill((255,255,255))
+        self.ball_radius = max(2, round(self.physics["ball_radius"] * scale))
+        # Blended and colour-keyed versions; see Game.set_sprite_alpha()
+        self.balls = {
+            True:  Ball.make_image(self.ball_radius),
+            False: Ball.make_image(self.ball_radius, alpha=False),
+        }
+        # Use FONT_PATH (may be None) or default system font
+        self.font = pygame.font.Font(FONT_PATH, max(12, round(48 * scale)))
+
+
+class RenderState:
+    """
+    What the renderer needs from one simulated frame: a (image, rect)
+    blit list parallel to the game's sprites, and the point scores.
+    Filled by Game.capture(); see pipeline.py for double-buffering.
+    """
+    __slots__ = ("frame", "blits", "points", "sprites")
+
+    def __init__(self, blits: list[tuple[pygame.Surface, pygame.Rect]]):
+        self.frame   = 0
+        self.blits   = blits
+        self.points  = (0, 0)
+        self.sprites = 0    # Game.sprite_version the images were taken from
 
 
 class Game:
     """
-    The core Pong game: handles sprites, input, scoring, and sound.
+    The core Pong game: handles sprites, input and scoring.
+    Hits, bounces, points and game wins are published on `bus`;
+    sound, HUD and telemetry subscribe to it.
     """
     def __init__(
         self,
         surface: pygame.Surface,
         player_names: list[str],
         settings: dict,
-        first_player: int = 0
+        first_player: int = 0,
+        bus: EventBus|None = None,
+        sprites: GameSprites|None = None,
+        controls: Controls = DEFAULT_CONTROLS
     ):
-        # Initialize mixer & sounds
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-        self.snd_bounce = pygame.mixer.Sound(os.path.join(SOUND_DIR, "bounce.mp3"))
-        self.snd_score  = pygame.mixer.Sound(os.path.join(SOUND_DIR, "score.wav"))
+        """
+        :param bus:      event bus to publish on; when omitted the game makes
+                         its own, with sound effects attached.
+        :param sprites:  images and font to draw with, possibly shared with
+                         other games; made for the settings' physics
+                         when omitted.
+        :param controls: (up, down) keys for the left and the right paddle.
+        """
+        if bus is None:
+            bus = EventBus()
+            SoundEffects().attach(bus)
+        self.bus = bus
+        self.frame = 0
+        self.rally = 0
 
         self.surface = surface
         self.width, self.height = surface.get_size()
         self.player1, self.player2 = player_names[:2]
         self.settings = settings
 
+        # Sizes come with the sprites; speeds from the settings
+        params = physics(settings)
+        if sprites is None:
+            sprites = GameSprites(physics=params)
+        self.sprites = sprites
+
         # Create paddles & ball
-        paddle_h, paddle_w, paddle_speed = 100, 10, 5
-        p1 = Paddle(10, (self.height-paddle_h)//2, paddle_w, paddle_h, paddle_speed, pygame.K_w, pygame.K_s)
-        p2 = Paddle(self.width-20, (self.height-paddle_h)//2, paddle_w, paddle_h, paddle_speed, pygame.K_UP, pygame.K_DOWN)
+        paddle_w, paddle_h = sprites.paddle.get_size()
+        paddle_speed = params["paddle_speed"]
+        (up1, down1), (up2, down2) = controls
+        p1 = Paddle(paddle_w, (self.height-paddle_h)//2, paddle_w, paddle_h, paddle_speed, up1, down1, sprites.paddle)
+        p2 = Paddle(self.width-2*paddle_w, (self.height-paddle_h)//2, paddle_w, paddle_h, paddle_speed, up2, down2, sprites.paddle)
 
-        ball_speed = 4
+        ball_speed  = params["ball_speed"]
+        ball_radius = sprites.ball_radius
         direction = 1 if first_player==1 else -1
-        ball = Ball(
-            self.width//2, self.height//2, 8,
-            ball_speed*direction, ball_speed
-        )
-        ball.game_ref = self  # back-reference
+        # Chaos mode: more than one ball, all sharing a single image
+        num_balls = max(1, settings.get("balls", 1))
+        self.rng = random.Random()
+        # Blended and colour-keyed versions; see set_sprite_alpha()
+        self.ball_images = sprites.balls
+        ball_image = self.ball_images[True]
+        self.sprite_alpha   = True
+        self.sprite_version = 0
+        balls = [
+            Ball(
+                self.width//2, self.height//2, ball_radius,
+                ball_speed*direction, ball_speed,
+                image=ball_image
+            )
+            for _ in range(num_balls)
+        ]
+        if num_balls > 1:
+            for ball in balls:
+                self._scatter(ball, to_right=(direction == 1))
 
         # Sprite groups
+        self.paddle_index = {p1: 0, p2: 1}
         self.paddles   = pygame.sprite.Group(p1, p2)
-        self.ball_grp  = pygame.sprite.Group(ball)
-        self.all_sprites = pygame.sprite.Group(p1, p2, ball)
+        self.ball_grp  = pygame.sprite.Group(*balls)
+        balls_in_play.set(len(balls))
+        self.all_sprites = pygame.sprite.Group(p1, p2, *balls)
+        # Rects are moved in place, so one (image, rect) sequence serves every frame
+        self._blit_seq = [(spr.image, spr.rect) for spr in self.all_sprites]
+
+        # Ball-ball collisions use a grid broad phase (only with several balls)
+        self.grid = SpatialHash(cell_size=ball_radius * 4)
+        self._hit_dist2 = (ball_radius * 2) ** 2
 
         # Score trackers
         self.points    = {self.player1:0, self.player2:0}
         self.games_won = {self.player1:0, self.player2:0}
 
         self.current_server = first_player
-        # Use FONT_PATH (may be None) or default system font
-        self.font = pygame.font.Font(FONT_PATH, 48)
+        self.font = sprites.font
+        self._scaled: tuple[GameSprites, dict]|None = None   # see _scaled_images()
 
-    def reset_ball(self, to_right: bool) -> None:
+    def _scatter(self, ball: Ball, to_right: bool) -> None:
         """
-        Center the ball and set its horizontal direction.
+        Place a chaos-mode ball somewhere in the middle third of the
+        field with a random vertical speed, heading the given way.
         """
-        ball = next(iter(self.ball_grp))
-        ball.rect.center = (self.width//2, self.height//2)
+        rng = self.rng
+        ball.rect.center = (
+            rng.randint(self.width//3, 2*self.width//3),
+            rng.randint(ball.radius, self.height - ball.radius)
+        )
         ball.speed_x = abs(ball.speed_x) * (1 if to_right else -1)
+        ball.speed_y = rng.choice((-1, 1)) * rng.randint(1, abs(ball.speed_x))
+
+    def reset_ball(self, to_right: bool, ball: Ball|None = None) -> None:
+        """
+        Center the ball and set its horizontal direction.
+        With several balls, `ball` is re-served from a random spot instead;
+        when omitted, every ball is reset.
+        """
+        balls = [ball] if ball is not None else list(self.ball_grp)
+        if len(self.ball_grp) > 1:
+            for b in balls:
+                self._scatter(b, to_right)
+            return
+        for b in balls:
+            b.rect.center = (self.width//2, self.height//2)
+            b.speed_x = abs(b.speed_x) * (1 if to_right else -1)
+
+    def _collide_balls(self) -> None:
+        """
+        Bounce overlapping balls off each other. Equal masses, so an
+        approaching pair simply exchanges velocities.
+        """
+        self.grid.rebuild(self.ball_grp)
+        hit_dist2 = self._hit_dist2
+        for a, b in self.grid.candidate_pairs():
+            ax, ay = a.rect.center
+            bx, by = b.rect.center
+            dx, dy = bx - ax, by - ay
+            if dx*dx + dy*dy >= hit_dist2:
+                continue
+            # Only react while closing in, so overlapping pairs don't stick
+            if (b.speed_x - a.speed_x)*dx + (b.speed_y - a.speed_y)*dy < 0:
+                a.speed_x, b.speed_x = b.speed_x, a.speed_x
+                a.speed_y, b.speed_y = b.speed_y, a.speed_y
+                self.bus.publish(BallCollision(self.frame, (ax+bx)//2, (ay+by)//2))
 
-    def update(self) -> str|None:
+    def update(self, keys: pygame.key.ScancodeWrapper|None = None) -> str|None:
         """
-        Advance one frame: move paddles, move ball, detect scoring.
+        Advance one frame: move paddles, move balls, detect scoring.
         Returns the name of the player who just won the *game*
         (i.e. reached points_to_win), or None otherwise.
+        :param keys: pressed-key state to use; read from pygame when omitted.
         """
-        keys = pygame.key.get_pressed()
+        start = time.perf_counter()
+        self.frame += 1
+        publish = self.bus.publish
+        if keys is None:
+            keys = pygame.key.get_pressed()
         for paddle in self.paddles:
             paddle.update(keys, self.height)
-        ball = next(iter(self.ball_grp))
-        ball.update(self.paddles, self.width, self.height)
+
+        for ball in self.ball_grp:
+            wall, paddle = ball.update(self.paddles, self.width, self.height)
+            if wall:
+                publish(WallBounce(self.frame, *ball.rect.center))
+            if paddle:
+                self.rally += 1
+                hits_total.inc()
+                half = paddle.rect.height / 2
+                publish(PaddleHit(
+                    self.frame,
+                    self.paddle_index[paddle],
+                    (ball.rect.centery - paddle.rect.centery) / half,
+                    (ball.speed_x**2 + ball.speed_y**2) ** 0.5,
+                    *ball.rect.center
+                ))
+        if len(self.ball_grp) > 1:
+            self._collide_balls()
+        physics_log.debug(
+            "balls=%d rally=%d points=%d-%d",
+            len(self.ball_grp), self.rally,
+            self.points[self.player1], self.points[self.player2]
+        )
 
         # Someone missed → point to the other
-        if ball.rect.right < 0:
-            scorer = self.player2
+        for ball in self.ball_grp:
+            if ball.rect.right < 0:
+                scorer = self.player2
+                to_right = True
+            elif ball.rect.left > self.width:
+                scorer = self.player1
+                to_right = False
+            else:
+                continue
             self.points[scorer] += 1
-            self.snd_score.play()
-            self.reset_ball(to_right=True)
-            return self._check_game_end(scorer)
-        if ball.rect.left > self.width:
-            scorer = self.player1
-            self.points[scorer] += 1
-            self.snd_score.play()
-            self.reset_ball(to_right=False)
-            return self._check_game_end(scorer)
+            points_total.inc()
+            publish(PointScored(
+                self.frame, int(scorer == self.player2), scorer, self.rally,
+                min(max(ball.rect.centerx, 0), self.width), ball.rect.centery
+            ))
+            self.rally = 0
+            self.reset_ball(to_right=to_right, ball=ball)
+            winner = self._check_game_end(scorer)
+            if winner:
+                update_seconds.observe(time.perf_counter() - start)
+                return winner
+        update_seconds.observe(time.perf_counter() - start)
         return None
 
     def _check_game_end(self, scorer: str) -> str|None:
@@ -152,6 +378,7 @@ class Game:
         """
         if self.points[scorer] >= self.settings["points_to_win"]:
             self.games_won[scorer] += 1
+            self.bus.publish(GameWon(self.frame, int(scorer == self.player2), scorer))
             return scorer
         return None
 
@@ -164,10 +391,97 @@ class Game:
         self.current_server = 1 - self.current_server
         self.reset_ball(to_right=(self.current_server==1))
 
-    def draw(self) -> None:
+    def set_sprite_alpha(self, enabled: bool) -> None:
+        """
+        Draw balls with per-pixel alpha (smooth, blended) or colour-keyed
+        (cheaper to blit). Call between updates, not while one runs.
+        """
+        if enabled == self.sprite_alpha:
+            return
+        self.sprite_alpha = enabled
+        self.sprite_version += 1
+        for ball in self.ball_grp:
+            ball.image = self.ball_images[enabled]
+        self._blit_seq = [(spr.image, spr.rect) for spr in self.all_sprites]
+
+    def render_state(self) -> RenderState:
+        """A new RenderState sized for this game's sprites."""
+        state = RenderState([(image, rect.copy()) for image, rect in self._blit_seq])
+        self.capture(state)
+        return state
+
+    def capture(self, state: RenderState) -> None:
+        """Copy the current positions and scores into `state`."""
+        if state.sprites != self.sprite_version:
+            state.blits = [(image, dst) for (image, _), (_, dst) in zip(self._blit_seq, state.blits)]
+            state.sprites = self.sprite_version
+        for (_, dst), (_, src) in zip(state.blits, self._blit_seq):
+            dst.update(src)
+        state.frame  = self.frame
+        state.points = (self.points[self.player1], self.points[self.player2])
+
+    def draw(
+        self,
+        state: RenderState|None = None,
+        target: pygame.Surface|None = None,
+        sprites: GameSprites|None = None
+    ) -> None:
         """
-        Draw paddles, ball, and the two point scores at quarter widths.
+        Draw paddles, balls, and the two point scores at quarter widths.
+        All sprites go out in one batched blit. With `state`, the frame
+        it captured is drawn instead of the live sprites.
+        With `target` and `sprites` pre-scaled for it, the field is drawn
+        onto `target` at that scale (see display.py): positions are
+        scaled, images and font swapped for the pre-scaled ones.
         """
-        self.all_sprites.draw(self.surface)
-        draw_text(self.surface, str(self.points[self.player1]),  (self.width*0.25, 50), self.font)
-        draw_text(self.surface, str(self.points[self.player2]),  (self.width*0.75, 50), self.font)
+        if state is None:
+            blits  = self._blit_seq
+            points = (self.points[self.player1], self.points[self.player2])
+        else:
+            blits, points = state.blits, state.points
+        surface, font, k = self.surface, self.font, 1.0
+        if target is None:
+            surface.blits(blits, doreturn=False)
+        else:
+            surface, font, k = target, sprites.font, sprites.scale / self.sprites.scale
+            images = self._scaled_images(sprites)
+            surface.blits(
+                [(images[image], (round(rect.x * k), round(rect.y * k))) for image, rect in blits],
+                doreturn=False
+            )
+        y = self.height // 12 * k
+        draw_text(surface, str(points[0]), (self.width*0.25*k, y), font)
+        draw_text(surface, str(points[1]), (self.width*0.75*k, y), font)
+
+    def _scaled_images(self, sprites: GameSprites) -> dict[pygame.Surface, pygame.Surface]:
+        """This game's sprite images mapped to their versions in `sprites`."""
+        if self._scaled is None or self._scaled[0] is not sprites:
+            own = self.sprites
+            self._scaled = (sprites, {
+                own.paddle: sprites.paddle,
+                own.balls[True]: sprites.balls[True],
+                own.balls[False]: sprites.balls[False],
+            })
+        return self._scaled[1]
+
+
+if __name__ == "__main__":
+    import sys
+    from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+    # Chaos-mode frame cost: python game.py [balls] [frames]
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    balls  = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    game = Game(screen, ["A", "B"], {"points_to_win": 10**9, "games_per_match": 1, "balls": balls}, first_player=0)
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.update()
+        screen.fill((0, 0, 0))
+        game.draw()
+    elapsed = time.perf_counter() - start
+    print(f"balls: {len(game.ball_grp)}")
+    print(f"candidate_pairs: {sum(1 for _ in game.grid.candidate_pairs())}")
+    print(f"frame_ms: {elapsed / frames * 1000:.2f}")
+    print(f"budget_ms: {1000 / FPS:.2f}")
+    pygame.quit()
@@ -0,0 +1,137 @@
+# governor.py
+
+import time
+import logging
+
+from constants import FPS
+
+class FrameGovernor:
+    """
+    Keeps frames inside the FPS budget by shedding optional rendering
+    work, so physics (which advances once per frame) keeps real time
+    when the machine is busy.
+
+    Each frame's work (update, draw, present) is measured against the
+    budget. After `down_after` frames in a row over `high` x budget, the
+    quality level steps down one notch; after `up_after` frames in a row
+    where the next level up is predicted to fit under `low` x budget, it
+    steps back up. Levels, from full quality:
+
+      0  everything drawn every frame
+      1  HUD redrawn only when its values change
+      2  no per-pixel alpha: sprites drawn colour-keyed
+      3  text rendered without antialiasing
+      4  render every 2nd frame (physics still runs every frame)
+      5  render every 3rd frame
+
+    A level that was shed again soon after being restored has to wait
+    twice as long before the next attempt, so the governor does not
+    oscillate around a level that only just fits.
+    """
+    LEVELS = (
+        "full quality",
+        "skip unchanged HUD",
+        "skip alpha blending",
+        "no text antialiasing",
+        "render every 2nd frame",
+        "render every 3rd frame",
+    )
+    RENDER_EVERY = (1, 1, 1, 1, 2, 3)
+
+    def __init__(
+        self,
+        target_fps: int = FPS,
+        high: float = 0.9,
+        low: float = 0.6,
+        down_after: int = 30,
+        up_after: int = 180,
+        max_level: int = len(LEVELS) - 1
+    ):
+        self.budget     = 1.0 / target_fps
+        self.high       = high
+        self.low        = low
+        self.down_after = down_after
+        self.up_after   = up_after
+        self.max_level  = max_level
+        self.level      = 0
+        self.changes    = 0
+
+        self.frame        = 0
+        self.render_cost  = 0.0   # smoothed seconds per rendered frame
+        self.update_cost  = 0.0   # smoothed seconds per frame that skipped rendering
+        self._start       = 0.0
+        self._over        = 0
+        self._under       = 0
+        self._up_wait     = [up_after] * len(self.LEVELS)
+        self._raised_at   = -10**9
+
+    # ——— What the current level allows ———
+    @property
+    def hud_cache(self) -> bool:
+        return self.level >= 1
+
+    @property
+    def alpha(self) -> bool:
+        return self.level < 2
+
+    @property
+    def antialias(self) -> bool:
+        return self.level < 3
+
+    @property
+    def render_every(self) -> int:
+        return self.RENDER_EVERY[self.level]
+
+    # ——— Per frame ———
+    def begin_frame(self) -> None:
+        self._start = time.perf_counter()
+        self.frame += 1
+
+    def should_render(self) -> bool:
+        return self.frame % self.render_every == 0
+
+    def end_frame(self, rendered: bool) -> None:
+        work = time.perf_counter() - self._start
+        if rendered:
+            self.render_cost = work if not self.render_cost else 0.9 * self.render_cost + 0.1 * work
+        else:
+            self.update_cost = work if not self.update_cost else 0.9 * self.update_cost + 0.1 * work
+        self._judge()
+
+    def cost(self, level: int|None = None) -> float:
+        """Predicted seconds per frame at `level` (default: current)."""
+        every = self.RENDER_EVERY[self.level if level is None else level]
+        if every == 1:
+            return self.render_cost
+        return self.update_cost + (self.render_cost - self.update_cost) / every
+
+    def _judge(self) -> None:
+        if self.cost() > self.high * self.budget:
+            self._over += 1
+            self._under = 0
+            if self._over >= self.down_after and self.level < self.max_level:
+                if self.frame - self._raised_at < self._up_wait[self.level]:
+                    # Restored too early: wait longer before the next try
+                    self._up_wait[self.level] = min(self._up_wait[self.level] * 2, 64 * self.up_after)
+                self._set(self.level + 1)
+            return
+        self._over = 0
+        if self.level and self.cost(self.level - 1) < self.low * self.budget:
+            self._under += 1
+            if self._under >= self._up_wait[self.level - 1]:
+                self._raised_at = self.frame
+                self._set(self.level - 1)
+        else:
+            self._under = 0
+
+    def _set(self, level: int) -> None:
+        shedding = level > self.level
+        (logging.warning if shedding else logging.info)(
+            "Frame budget %s: %.1f ms per frame vs %.1f ms budget; level %d -> %d (%s)",
+            "exceeded" if shedding else "has headroom",
+            self.cost() * 1000, self.budget * 1000,
+            self.level, level, self.LEVELS[level]
+        )
+        self.level   = level
+        self.changes += 1
+        self._over = self._under = 0
@@ -1,27 +1,83 @@
 import pygame
-from pygame.locals import K_BACKSPACE, K_RETURN, K_KP_ENTER, MOUSEBUTTONDOWN, KEYDOWN
+from typing import Callable
+from pygame.locals import K_BACKSPACE, K_RETURN, K_KP_ENTER, K_TAB, MOUSEBUTTONDOWN, KEYDOWN
 from constants import COLOR_FG, COLOR_INACTIVE, COLOR_ACTIVE
 from utils     import draw_text
+from widgets   import Widget
 
-class InputBox:
+class InputBox(Widget):
     """
-    A rectangular text-entry box.
+    A rectangular text-entry box (the widget toolkit's text field).
     Click to activate, type to enter text, Enter to submit.
+    With a `suggest` callback, completions for the typed prefix are
+    listed under the box and Tab accepts the first one.
+    The box is re-rendered only when its text, focus or suggestions change.
     """
 
     def __init__(
         self,
         rect: tuple[int,int,int,int],
-        font: pygame.font.Font
+        font: pygame.font.Font,
+        suggest: Callable[[str], list[str]]|None = None
     ):
         """
         :param rect: (x, y, width, height) of the box
         :param font: font used to render the text
+        :param suggest: returns completions for a prefix (e.g. PlayerRegistry.complete)
         """
-        self.rect   = pygame.Rect(rect)
-        self.font   = font
-        self.text   = ""        # current contents
-        self.active = False     # True when clicked into
+        super().__init__(rect)
+        self.font    = font
+        self._text   = ""       # current contents
+        self._active = False    # True when clicked into
+        self.suggest = suggest
+        self.suggestions: list[str] = []   # refreshed per keystroke, not per frame
+        self._bounds = self.rect.copy()
+        self._suggestion_rects: list[pygame.Rect] = []
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        if text != self._text:
+            self._text = text
+            self.invalidate()
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @active.setter
+    def active(self, active: bool) -> None:
+        if active != self._active:
+            self._active = active
+            self.invalidate()
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        # Suggestions are drawn below the box, outside the clickable rect
+        return self._bounds
+
+    def _set_suggestions(self, suggestions: list[str]) -> None:
+        if suggestions == self.suggestions:
+            return
+        old = self._bounds.copy()
+        self.suggestions = suggestions
+        self._suggestion_rects = []
+        for i, name in enumerate(suggestions):
+            rect = pygame.Rect((0, 0), self.font.size(name))
+            rect.center = (self.rect.centerx, self.rect.bottom + (i + 0.5) * self.rect.height * 0.7)
+            self._suggestion_rects.append(rect)
+        self._bounds = self.rect.unionall(self._suggestion_rects)
+        self.invalidate(old)
+
+    def _refresh_suggestions(self) -> None:
+        if self.suggest is None:
+            return
+        self._set_suggestions([
+            s for s in self.suggest(self.text) if s != self.text
+        ] if self.text else [])
 
     def handle_event(self, event: pygame.event.Event) -> str|None:
         """
@@ -37,24 +93,39 @@ class InputBox:
                 # Submit current text
                 submitted = self.text
                 self.text = ""
+                self._set_suggestions([])
                 return submitted
+            elif event.key == K_TAB:
+                # Accept the best completion
+                if self.suggestions:
+                    self.text = self.suggestions[0]
+                    self._set_suggestions([])
             elif event.key == K_BACKSPACE:
                 self.text = self.text[:-1]
+                self._refresh_suggestions()
             else:
                 # Append typed character
                 self.text += event.unicode
+                self._refresh_suggestions()
 
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def render(self) -> pygame.Surface:
         """
-        Render the current text (or placeholder) and border.
-        Active box is drawn in bright; inactive in muted color.
+        The current text (or placeholder) and border, with completions
+        muted underneath. Active box is drawn in bright; inactive in muted color.
         """
+        image = self.canvas(self._bounds.size)
+        dx, dy = -self._bounds.x, -self._bounds.y
+        box = self.rect.move(dx, dy)
         display_text = self.text if self.text else "..."
         color = COLOR_ACTIVE if self.active else COLOR_INACTIVE
         # Draw text centered in the box
-        draw_text(surface, display_text, self.rect.center, self.font, color=color)
+        draw_text(image, display_text, box.center, self.font, color=color)
         # Draw border
         border_color = COLOR_FG if self.active else COLOR_INACTIVE
-        pygame.draw.rect(surface, border_color, self.rect, width=2)
+        pygame.draw.rect(image, border_color, box, width=2)
+        # Completions, muted, under the box
+        for name, rect in zip(self.suggestions, self._suggestion_rects):
+            draw_text(image, name, rect.move(dx, dy).center, self.font, color=COLOR_INACTIVE)
+        return image
@@ -0,0 +1,203 @@
+# journal.py
+
+import os
+import copy
+import json
+import queue
+import logging
+import threading
+
+from constants import JOURNAL_FILE
+from events    import EventBus, PointScored, GameWon, MatchWon
+
+# Each journal line is one JSON record with a "t" (type) field:
+#   series      new series: names, settings, tournament (format + players),
+#               tables (multi-table mode when above 1)
+#   match       a match starts: n, names, first (serving player)
+#   point       p scored a point
+#   game        p won a game
+#   match_won   p won the match, games = [winner games, loser games]
+#   result      multi-table mode: winner beat loser, games as above
+#   settings    settings changed mid-series
+#   end         the series is over
+#   checkpoint  state: the full replayed state at this point
+
+def new_state() -> dict:
+    return {
+        "names": [], "settings": {}, "current_match": 0,
+        "series_wins": {}, "games_won": {}, "points": [0, 0], "server": 0,
+        "in_match": False, "tournament": None, "finished": True, "tables": 1,
+    }
+
+def apply(state: dict, record: dict) -> dict:
+    """Fold one journal record into `state` (in place) and return it."""
+    kind = record["t"]
+    if kind == "checkpoint":
+        state.clear()
+        state.update(copy.deepcopy(record["state"]))
+    elif kind == "series":
+        state.clear()
+        state.update(new_state())
+        state.update(
+            names=list(record["names"]), settings=dict(record["settings"]),
+            tournament=record.get("tournament"), finished=False,
+            tables=record.get("tables", 1),
+        )
+        if state["tournament"] is not None:
+            state["tournament"]["results"] = []
+    elif kind == "match":
+        names = list(record["names"])
+        state.update(
+            current_match=record["n"], names=names, points=[0, 0],
+            server=record["first"], in_match=True,
+            games_won={n: 0 for n in names},
+        )
+        if not state["series_wins"] or set(state["series_wins"]) != set(names):
+            state["series_wins"] = {n: 0 for n in names}
+    elif kind == "point":
+        state["points"][record["p"]] += 1
+    elif kind == "game":
+        state["games_won"][state["names"][record["p"]]] += 1
+        state["points"] = [0, 0]
+        state["server"] = 1 - state["server"]
+    elif kind == "match_won":
+        names = state["names"]
+        winner, loser = names[record["p"]], names[1 - record["p"]]
+        state["series_wins"][winner] = state["series_wins"].get(winner, 0) + 1
+        state["in_match"] = False
+        if state["tournament"] is not None:
+            state["tournament"]["results"].append([winner, loser, *record["games"]])
+    elif kind == "result":
+        state["current_match"] += 1
+        state["tournament"]["results"].append([record["winner"], record["loser"], *record["games"]])
+    elif kind == "settings":
+        state["settings"] = dict(record["settings"])
+    elif kind == "end":
+        state["finished"] = True
+    return state
+
+
+class SeriesJournal:
+    """
+    Append-only, crash-safe record of series progress.
+
+    On construction the existing journal is replayed into `state`, from
+    which a crashed series can be resumed at the exact score. Appending
+    from the game loop only updates `state` and queues the record; a
+    background thread writes and fsyncs. Every `checkpoint_every` records
+    the file is atomically rewritten as a single checkpoint, so replay
+    never reads more than that many records.
+    """
+    def __init__(self, path: str = JOURNAL_FILE, checkpoint_every: int = 200):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.state = self._replay()
+        self._since_checkpoint = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="journal", daemon=True)
+        self._writer.start()
+
+    # ——— Recovery ———
+    def _replay(self) -> dict:
+        state = new_state()
+        if not os.path.isfile(self.path):
+            return state
+        try:
+            with open(self.path, "rb+") as f:
+                good = 0
+                for line in f:
+                    try:
+                        # A record is only complete with its newline
+                        if not line.endswith(b"\n"):
+                            raise ValueError("no newline")
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    apply(state, record)
+                    good += len(line)
+                # Cut off a torn final line from a crash mid-write, so
+                # the writer appends after the last complete record
+                size = f.seek(0, os.SEEK_END)
+                if good < size:
+                    logging.warning("Dropping %d torn bytes at the end of journal %s", size - good, self.path)
+                    f.truncate(good)
+        except OSError:
+            logging.exception("Could not read journal %s", self.path)
+        return state
+
+    @property
+    def resumable(self) -> bool:
+        """True when the journal holds an unfinished series."""
+        st = self.state
+        return not st["finished"] and (st["current_match"] > 0 or st["tables"] > 1)
+
+    # ——— Recording ———
+    def append(self, record: dict) -> None:
+        apply(self.state, record)
+        self._queue.put(record)
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_every:
+            self._since_checkpoint = 0
+            self._queue.put({"t": "checkpoint", "state": copy.deepcopy(self.state)})
+
+    def attach(self, bus: EventBus) -> None:
+        bus.subscribe(PointScored, lambda e: self.append({"t": "point", "p": e.player}))
+        bus.subscribe(GameWon,     lambda e: self.append({"t": "game", "p": e.player}))
+        bus.subscribe(MatchWon,    lambda e: self.append({"t": "match_won", "p": e.player, "games": list(e.games)}))
+
+    def series_started(self, names: list[str], settings: dict, tournament=None, tables: int = 1) -> None:
+        info = None
+        if tournament is not None:
+            info = {"format": tournament.name, "players": list(tournament.players)}
+        self.append({
+            "t": "series", "names": list(names), "settings": dict(settings),
+            "tournament": info, "tables": tables,
+        })
+
+    def match_started(self, number: int, names: list[str], first_player: int) -> None:
+        self.append({"t": "match", "n": number, "names": list(names), "first": first_player})
+
+    def match_reported(self, winner: str, loser: str, games: tuple[int,int]) -> None:
+        """A match finished at one of several tables (see TablesScene)."""
+        self.append({"t": "result", "winner": winner, "loser": loser, "games": list(games)})
+
+    def settings_changed(self, settings: dict) -> None:
+        self.append({"t": "settings", "settings": dict(settings)})
+
+    def series_ended(self) -> None:
+        self.append({"t": "end"})
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._writer.join()
+
+    # ——— Writer thread ———
+    def _write_loop(self) -> None:
+        f = open(self.path, "a")
+        try:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    return
+                try:
+                    if record["t"] == "checkpoint":
+                        f.close()
+                        self._compact(record)
+                        f = open(self.path, "a")
+                    else:
+                        f.write(json.dumps(record) + "\n")
+                        f.flush()
+                        os.fsync(f.fileno())
+                except OSError:
+                    logging.exception("Could not write journal %s", self.path)
+        finally:
+            f.close()
+
+    def _compact(self, checkpoint: dict) -> None:
+        """Replace the journal with just `checkpoint`, atomically."""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as out:
+            out.write(json.dumps(checkpoint) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, self.path)
@@ -1,46 +1,210 @@
+import io
 import os
 import json
 import csv
+import time
+import logging
+import numpy as np
 import pygame
 from datetime import datetime
 
 from constants import (
     LEADER_JSON, LEADER_CSV,
     SCREEN_WIDTH, SCREEN_HEIGHT,
-    COLOR_FG, FONT_PATH, FONT_TITLE_SIZE
+    FONT_PATH, FONT_TITLE_SIZE
+)
+from utils     import get_font
+from filelock  import locked
+import metrics
+import retention
+from widgets   import Button, Label, Panel, Table
+from players   import PlayerRegistry
+from analytics import MatchAnalytics
+
+record_seconds = metrics.histogram(
+    "pong_leaderboard_record_seconds", "Time to persist one result, lock wait included."
+)
+lock_wait_seconds = metrics.histogram(
+    "pong_leaderboard_lock_wait_seconds", "Time spent waiting for the shared store's write lock."
+)
+recorded_total = metrics.counter("pong_matches_recorded_total", "Matches recorded by this cabinet.")
+merged_total   = metrics.counter(
+    "pong_matches_merged_total", "Matches recorded by other cabinets and read from the shared store."
 )
-from utils     import get_font, draw_text
 
 class Leaderboard:
     """
     Aggregates all historical match results, displays:
      - Total matches won per player (all time)
      - Recent-match table
+     - Head-to-head, win streaks and form views (from `analytics`)
     Also persists to JSON + CSV.
+    Players are interned to ids in `players` (built from the full
+    history), and the all-time tally is `analytics.won`, keyed by id.
+    The JSON keeps the latest 100 matches for the recent table.
+
+    Several cabinets may share one store. Every write holds an exclusive
+    lock on LEADER_CSV + ".lock", first folds in matches the others
+    appended since this board last looked (the CSV tail past
+    `_csv_pos`), then appends its own, so no result is lost and the
+    JSON each one rewrites always holds everyone's. refresh() picks up
+    other cabinets' matches between writes, reading only the new tail.
+
+    Old matches are compacted out of the CSV into rollups by
+    `compactor` in the background, once started (see retention.py);
+    when the CSV is replaced that way, every board reloads the history
+    from the two.
     """
     def __init__(self, screen: pygame.Surface, font: pygame.font.Font, max_items:int=10):
         self.screen      = screen
         self.font        = font
         self.title_font  = get_font(FONT_TITLE_SIZE)
         self.max_items   = max_items
-        self.back_button = pygame.Rect(20,20,100,40)
 
-        # Load or initialize
-        self.entries = self._load_json()
-        if self._migrate_old_format():
-            self._save_json(); self._write_csv()
+        # Views, cycled with ←/→ (or Tab) or by clicking the view name
+        self.views = ["All-Time Matches Won", "Head-to-Head", "Win Streaks", "Form (last 10)"]
+        self.view  = 0
+        # Formatted analytics tables per view, rebuilt after a new result
+        self._tables: dict[int, tuple[list[int], list[str], list[list[str]]]] = {}
+
+        # Widgets; tables are refilled when a result or the view changes
+        self.panel = Panel()
+        self.panel.add(Label("Leaderboard", self.title_font, (SCREEN_WIDTH//2, 50)))
+        self.view_button = self.panel.add(Button(
+            "", font, (SCREEN_WIDTH//2, 100), size=(360, 30), name="view", border=False
+        ))
+        self.wins_table   = self.panel.add(Table(font, 140))
+        self.recent_table = self.panel.add(Table(font, 140))
+        self.view_table   = self.panel.add(Table(font, 150))
+        self.back_button  = self.panel.add(Button("Back", font, (70, 40), size=(100, 40), name="BACK"))
+
+        # Dimming overlay, built once
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.overlay.set_alpha(200); self.overlay.fill((0,0,0))
+
+        # Load or initialize; locked, so another cabinet can't write mid-load
+        self.players   = PlayerRegistry()
+        self.analytics = MatchAnalytics(self.players)
+        self._csv_pos  = 0      # bytes of LEADER_CSV folded into this board
+        self._csv_id: tuple[int,int]|None = None    # (device, inode) they were read from
+        with locked(self._lock_path()):
+            self.entries = self._load_json()
+            if self._migrate_old_format():
+                self._save_json(); self._write_csv()
+            self._load_players()
+        self._refresh_top()
+        # Started (and stopped) by main(), so a board can be built without a thread
+        self.compactor = retention.Compactor(LEADER_CSV, self._lock_path())
+
+    @property
+    def match_wins(self) -> np.ndarray:
+        """Matches won per player id, all time."""
+        return self.analytics.won
+
+    @staticmethod
+    def _lock_path() -> str:
+        return LEADER_CSV + ".lock"
+
+    def _load_players(self) -> None:
+        """
+        Load the full match history into `analytics`: the rollups of
+        compacted matches, then the rows the CSV still holds (fall back
+        to the JSON entries when there are neither), registering every
+        player and counting matches played to rank name completions.
+        Call with the lock held.
+        """
+        rollup = retention.load(retention.rollup_path(LEADER_CSV))
+        self.analytics.load_rollup(rollup)
+        if os.path.isfile(LEADER_CSV):
+            st = os.stat(LEADER_CSV)
+            self.analytics.load_csv(LEADER_CSV, retention.skip(rollup, LEADER_CSV))
+            self._csv_pos, self._csv_id = st.st_size, (st.st_dev, st.st_ino)
+        if not self.analytics.n and not rollup["matches"]:
+            self.analytics.load_entries(self.entries)
+        for pid in self.analytics.ranked(limit=None):
+            self.players.bump(int(pid), int(self.analytics.played[pid]))
+
+    def _refresh_top(self) -> None:
+        """
+        Re-rank the all-time tally and format the recent-match rows
+        (only when they change, not per frame).
+        """
+        won = self.analytics.won
+        ranked = np.argsort(-won, kind="stable")[:self.max_items]
+        self.top = [(self.players.name_of(int(pid)), int(won[pid])) for pid in ranked if won[pid]]
+        self.top_lines = [f"{name}: {count}" for name, count in self.top]
+        self.recent = [
+            (e["when"], e["winner"], f"{e['winner_games']}-{e['loser_games']}", e["loser"])
+            for e in self.entries[:self.max_items]
+        ]
+        self._tables.clear()
+        self._show_view()
+
+    def _show_view(self) -> None:
+        """Fill the tables for the current view (on change, not per frame)."""
+        self.view_button.text = f"<  {self.views[self.view]}  >"
+        if self.view:
+            xs, headings, rows = self._table(self.view)
+            self.view_table.set(xs, rows, headings)
+            self.wins_table.set([], [])
+            self.recent_table.set([], [])
+            return
+        self.view_table.set([], [])
+        # Total matches won, then the recent matches table below it
+        self.wins_table.set([SCREEN_WIDTH//2], [[line] for line in self.top_lines])
+        self.recent_table.set(
+            [100,300,500,650], self.recent, ["When","Winner","Score","Loser"],
+            y=140 + 30*len(self.top_lines) + 20
+        )
+
+    def _table(self, view: int) -> tuple[list[int], list[str], list[list[str]]]:
+        """Column x-positions, headings and rows for an analytics view."""
+        table = self._tables.get(view)
+        if table is not None:
+            return table
+        a = self.analytics
+        def name(pid) -> str:
+            return self.players.name_of(int(pid))[:12]
+        if view == 1:
+            ids = a.ranked(6)
+            matrix = a.head_to_head(ids)
+            xs = [110] + [240 + j*100 for j in range(len(ids))]
+            headings = ["Wins vs."] + [name(pid)[:8] for pid in ids]
+            rows = [
+                [name(pid)] + ["-" if i == j else str(matrix[i, j]) for j in range(len(ids))]
+                for i, pid in enumerate(ids)
+            ]
+        elif view == 2:
+            ids = a.ranked(self.max_items)
+            rate, margin = a.win_rate(), a.average_margin()
+            xs = [110, 250, 360, 460, 570, 700]
+            headings = ["Player", "Played", "Win %", "Best", "Current", "Margin"]
+            rows = [[
+                name(pid), str(a.played[pid]), f"{rate[pid]*100:.0f}%", str(a.best_streak[pid]),
+                f"W{a.streak[pid]}" if a.streak[pid] > 0 else f"L{-a.streak[pid]}",
+                f"{margin[pid]:+.1f}",
+            ] for pid in ids]
+        else:
+            ids = a.ranked(self.max_items)
+            xs = [130, 330, 520, 660]
+            headings = ["Player", "Last 10", "Form", "Trend"]
+            rows = []
+            for pid in ids:
+                form = a.form(int(pid))
+                last = "".join("W" if r else "L" for r in a.results(int(pid))[-10:])
+                trend = form[-1] - form[max(0, len(form) - 11)]
+                rows.append([name(pid), last, f"{form[-1]*100:.0f}%", f"{trend*100:+.0f}"])
+        table = self._tables[view] = (xs, headings, rows)
+        return table
 
     def _load_json(self) -> list[dict]:
         if os.path.isfile(LEADER_JSON):
             try:
                 return json.load(open(LEADER_JSON))
             except Exception:
-                pass
+                logging.exception("Could not load %s", LEADER_JSON)
         return []
 
-    def _save_json(self) -> None:
-        json.dump(self.entries, open(LEADER_JSON,"w"), indent=2)
-
     def _migrate_old_format(self) -> bool:
         """
         If old entries used 'score' instead of 'winner_games'/'loser_games',
@@ -90,61 +254,205 @@ class Leaderboard:
             "winner_games": wg,
             "loser_games":  lg
         }
-        # Prepend and cap history
+        start = time.perf_counter()
+        with locked(self._lock_path()):
+            lock_wait_seconds.observe(time.perf_counter() - start)
+            # Other cabinets' results first, so ours lands after them everywhere
+            self._read_tail()
+            self._append_csv(entry)
+            self._apply(entry)
+            self._save_json()
+        record_seconds.observe(time.perf_counter() - start)
+        recorded_total.inc()
+        self._refresh_top()
+
+    def refresh(self) -> int:
+        """
+        Fold in matches other cabinets recorded since this board last
+        looked. Returns how many; costs one stat() when there are none.
+        """
+        try:
+            st = os.stat(LEADER_CSV)
+        except OSError:
+            return 0
+        if st.st_size == self._csv_pos and (st.st_dev, st.st_ino) == self._csv_id:
+            return 0
+        with locked(self._lock_path(), shared=True):
+            added = self._read_tail()
+        if added:
+            self._refresh_top()
+        return added
+
+    def _apply(self, entry: dict) -> None:
+        """Add one match to entries, analytics and the registry."""
+        # Prepend and cap the recent history
         self.entries.insert(0, entry)
         self.entries = self.entries[:100]
-        self._save_json()
 
-        # Append to CSV
-        new_file = not os.path.isfile(LEADER_CSV)
-        with open(LEADER_CSV,"a",newline="") as fout:
-            writer = csv.writer(fout)
-            if new_file:
-                writer.writerow(["when","player","matches_won","matches_lost","games_won","games_lost"])
-            writer.writerow([entry["when"], winner,1,0,wg,lg])
-            writer.writerow([entry["when"], loser,0,1,lg,wg])
-
-    def draw(self) -> None:
-        """Overlay, show total wins, recent-table, and Back button."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200); overlay.fill((0,0,0))
-        self.screen.blit(overlay,(0,0))
-
-        # Title
-        draw_text(self.screen, "Leaderboard", (SCREEN_WIDTH//2,50), self.title_font)
-
-        # Total matches won
-        tally: dict[str,int] = {}
-        for e in self.entries:
-            tally[e["winner"]] = tally.get(e["winner"],0)+1
-        y = 100
-        draw_text(self.screen, "All-Time Matches Won", (SCREEN_WIDTH//2,y), self.font)
-        y+=40
-        for name,count in sorted(tally.items(),key=lambda x:-x[1])[:self.max_items]:
-            draw_text(self.screen, f"{name}: {count}", (SCREEN_WIDTH//2,y), self.font)
-            y+=30
-
-        # Recent matches table
-        cols = ["When","Winner","Score","Loser"]
-        xs   = [100,300,500,650]
-        header_y = y+20
-        for i,heading in enumerate(cols):
-            draw_text(self.screen, heading, (xs[i],header_y), self.font)
-        for idx, e in enumerate(self.entries[:self.max_items]):
-            row_y = header_y + (idx+1)*30
-            score = f"{e['winner_games']}-{e['loser_games']}"
-            draw_text(self.screen, e["when"], (xs[0],row_y), self.font)
-            draw_text(self.screen, e["winner"], (xs[1],row_y), self.font)
-            draw_text(self.screen, score,        (xs[2],row_y), self.font)
-            draw_text(self.screen, e["loser"],  (xs[3],row_y), self.font)
-
-        # Back button
-        pygame.draw.rect(self.screen, COLOR_FG, self.back_button, 2)
-        draw_text(self.screen, "Back", self.back_button.center, self.font)
+        winner, loser = entry["winner"], entry["loser"]
+        self.analytics.add(entry["when"], winner, loser, entry["winner_games"], entry["loser_games"])
+        wid, lid = self.players.intern(winner), self.players.intern(loser)
+        self.players.bump(wid); self.players.bump(lid)
+
+    def _append_csv(self, entry: dict) -> None:
+        """
+        Append the match's two rows with a single write, flushed to disk,
+        so a reader never sees half a match. Call with the lock held.
+        """
+        rows = io.StringIO()
+        writer = csv.writer(rows)
+        new_file = not os.path.isfile(LEADER_CSV) or os.path.getsize(LEADER_CSV) == 0
+        if new_file:
+            writer.writerow(["when","player","matches_won","matches_lost","games_won","games_lost"])
+        w, l = entry["winner"], entry["loser"]
+        wg, lg = entry["winner_games"], entry["loser_games"]
+        writer.writerow([entry["when"], w,1,0,wg,lg])
+        writer.writerow([entry["when"], l,0,1,lg,wg])
+        with open(LEADER_CSV, "a", newline="") as fout:
+            fout.write(rows.getvalue())
+            fout.flush()
+            os.fsync(fout.fileno())
+            st = os.fstat(fout.fileno())
+            self._csv_pos, self._csv_id = fout.tell(), (st.st_dev, st.st_ino)
+
+    def _read_tail(self) -> int:
+        """
+        Apply the matches appended to LEADER_CSV past `_csv_pos`, reading
+        only those bytes. Call with the lock (shared or exclusive) held.
+        """
+        try:
+            st = os.stat(LEADER_CSV)
+        except OSError:
+            return 0
+        if (st.st_dev, st.st_ino) != self._csv_id:
+            if self._csv_id is not None:
+                return self._reload()
+            self._csv_id = (st.st_dev, st.st_ino)     # created since this board loaded
+        size = st.st_size
+        if size < self._csv_pos:
+            # Rewritten from scratch by someone else; appends are all we track
+            logging.warning("%s shrank; restart to reload the history", LEADER_CSV)
+            self._csv_pos = size
+            return 0
+        if size == self._csv_pos:
+            return 0
+        with open(LEADER_CSV, "rb") as fin:
+            fin.seek(self._csv_pos)
+            data = fin.read(size - self._csv_pos)
+        # Whole lines only: a torn line from a crashed writer waits
+        end = data.rfind(b"\n") + 1
+        rows = [
+            row for row in csv.reader(io.StringIO(data[:end].decode(), newline=""))
+            if row and row[0] != "when"
+        ]
+        self._csv_pos += end
+        if len(rows) % 2:
+            logging.warning("%s has an unpaired row; ignoring it", LEADER_CSV)
+        for a, b in zip(rows[0::2], rows[1::2]):
+            won, lost = (a, b) if a[2] == "1" else (b, a)
+            self._apply({
+                "when": won[0],
+                "winner": won[1],
+                "loser":  lost[1],
+                "winner_games": int(won[4]),
+                "loser_games":  int(won[5])
+            })
+        merged_total.inc(len(rows) // 2)
+        return len(rows) // 2
+
+    def _reload(self) -> int:
+        """
+        Load the history afresh after LEADER_CSV was replaced (compacted,
+        see retention.py). Returns how many matches that added. Call with
+        the lock held.
+        """
+        before = int(self.analytics.won.sum())
+        self.entries   = self._load_json()
+        self.analytics = MatchAnalytics(self.players)
+        self.players.counts = [0] * len(self.players)
+        self._load_players()
+        added = int(self.analytics.won.sum()) - before
+        merged_total.inc(max(added, 0))
+        return added
+
+    def _save_json(self) -> None:
+        """Rewrite the JSON atomically, so readers never see it half-written."""
+        tmp = f"{LEADER_JSON}.{os.getpid()}.tmp"
+        with open(tmp, "w") as fout:
+            fout.write(json.dumps(self.entries, indent=2))
+        os.replace(tmp, LEADER_JSON)
+
+    def draw(self, dim: bool = True) -> None:
+        """
+        Overlay (unless `dim` is False), the current view (total wins and
+        recent-table, or an analytics table), and Back button.
+        """
+        if dim:
+            self.screen.blit(self.overlay,(0,0))
+        self.panel.draw(self.screen)
+
+    def _cycle(self, step: int) -> None:
+        self.view = (self.view + step) % len(self.views)
+        self._show_view()
 
     def handle_event(self, event: pygame.event.Event) -> str|None:
-        """Return 'BACK' if the back-button was clicked."""
-        if event.type==pygame.MOUSEBUTTONDOWN and event.button==1:
-            if self.back_button.collidepoint(event.pos):
-                return "BACK"
+        """
+        Return 'BACK' if the back-button was clicked.
+        ←/→, Tab, or a click on the view name switch views.
+        """
+        if event.type==pygame.KEYDOWN:
+            if event.key in (pygame.K_RIGHT, pygame.K_TAB):
+                self._cycle(+1)
+            elif event.key == pygame.K_LEFT:
+                self._cycle(-1)
+        widget, result = self.panel.handle_event(event)
+        if result == "BACK":
+            return "BACK"
+        if result == "view":
+            self._cycle(+1)
         return None
+
+
+def _bench_writer(directory: str, n: int, matches: int, start) -> None:
+    """One cabinet of benchmark(): record `matches` results in `directory`'s store."""
+    global LEADER_JSON, LEADER_CSV
+    pygame.init()
+    LEADER_JSON = os.path.join(directory, "leaderboard.json")
+    LEADER_CSV  = os.path.join(directory, "leaderboard.csv")
+    board = Leaderboard(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), pygame.font.Font(None, 20))
+    start.wait()
+    for m in range(matches):
+        board.record([f"cab{n}", f"guest{n}-{m}"], (3, m % 3))
+
+
+def benchmark(writers: int = 8, matches: int = 25) -> dict[str, float]:
+    """
+    Several cabinets (processes) recording into one fresh store at once:
+    records per second through the shared write lock.
+    """
+    import tempfile
+    import multiprocessing
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        start = ctx.Barrier(writers + 1)
+        procs = [
+            ctx.Process(target=_bench_writer, args=(directory, n, matches, start))
+            for n in range(writers)
+        ]
+        for p in procs:
+            p.start()
+        start.wait()
+        began = time.perf_counter()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - began
+    return {"writers": writers, "records": writers * matches, "records_per_s": writers * matches / elapsed}
+
+
+if __name__ == "__main__":
+    import sys
+    # Shared-store write throughput: python leaderboard.py [writers] [matches each]
+    writers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    matches = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    for name, value in benchmark(writers, matches).items():
+        print(f"{name}: {value:.0f}")
@@ -0,0 +1,178 @@
+# logsetup.py
+
+import io
+import sys
+import time
+import queue
+import logging
+import logging.handlers
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(state)s f=%(frame)d m=%(match)d] %(message)s"
+
+class LogContext:
+    """
+    Where the game is right now. The main loop updates these fields once
+    per frame; every log record is stamped with them.
+    """
+    __slots__ = ("state", "frame", "match")
+
+    def __init__(self):
+        self.state = "-"
+        self.frame = 0
+        self.match = 0
+
+context = LogContext()
+
+
+class ContextFilter(logging.Filter):
+    """Adds state/frame/match to each record (three attribute copies)."""
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.state = context.state
+        record.frame = context.frame
+        record.match = context.match
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread, so the
+    calling thread only creates the record and enqueues it. Pass
+    immutable values as log arguments; they are formatted later.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RateLimitedLogger:
+    """
+    Wraps a logger for per-frame call sites: at most one record per
+    `interval` seconds (or per `every` calls) gets through; the rest are
+    counted and reported as `suppressed=N` on the next one that does.
+    A suppressed call costs a level check and a clock read.
+    """
+    def __init__(self, logger: logging.Logger, interval: float = 1.0, every: int = 0):
+        self.logger   = logger
+        self.interval = interval
+        self.every    = every
+        self._next    = 0.0
+        self._calls   = 0
+        self.suppressed = 0
+
+    def _allow(self) -> bool:
+        if self.every:
+            self._calls += 1
+            if self._calls < self.every:
+                return False
+            self._calls = 0
+            return True
+        now = time.monotonic()
+        if now < self._next:
+            return False
+        self._next = now + self.interval
+        return True
+
+    def log(self, level: int, msg: str, *args, stacklevel: int = 1) -> None:
+        """Like Logger.log; records point at the caller, not this module."""
+        if not self.logger.isEnabledFor(level):
+            return
+        if not self._allow():
+            self.suppressed += 1
+            return
+        if self.suppressed:
+            msg = f"{msg} (suppressed={self.suppressed})"
+            self.suppressed = 0
+        self.logger.log(level, msg, *args, stacklevel=stacklevel + 1)
+
+    def debug(self, msg: str, *args) -> None:
+        self.log(logging.DEBUG, msg, *args, stacklevel=2)
+
+    def info(self, msg: str, *args) -> None:
+        self.log(logging.INFO, msg, *args, stacklevel=2)
+
+    def warning(self, msg: str, *args) -> None:
+        self.log(logging.WARNING, msg, *args, stacklevel=2)
+
+
+def setup_logging(
+    level: int = logging.DEBUG,
+    stream=None,
+    fmt: str = LOG_FORMAT
+) -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue to a listener thread that owns the
+    (blocking) stream handler. Returns the started listener; call stop()
+    on it at exit to flush.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter(fmt))
+
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    for old in list(root.handlers):
+        root.removeHandler(old)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+class _SlowStream(io.StringIO):
+    """A console that takes a millisecond per write, like a busy terminal."""
+    def write(self, s: str) -> int:
+        time.sleep(0.001)
+        return super().write(s)
+
+
+def benchmark(calls: int = 2000) -> dict[str, float]:
+    """
+    Microseconds per log call from the frame thread against a slow
+    console: blocking handler vs. queued vs. queued + rate-limited.
+    """
+    log = logging.getLogger("bench")
+    results: dict[str, float] = {}
+
+    root = logging.getLogger()
+    saved = list(root.handlers), root.level
+    try:
+        blocking = logging.StreamHandler(_SlowStream())
+        blocking.setFormatter(logging.Formatter(LOG_FORMAT))
+        blocking.addFilter(ContextFilter())
+        for old in list(root.handlers):
+            root.removeHandler(old)
+        root.addHandler(blocking)
+        root.setLevel(logging.DEBUG)
+        n = max(1, calls // 20)   # the blocking case is slow; time fewer calls
+        start = time.perf_counter()
+        for i in range(n):
+            log.debug("ball at %d,%d", i, i)
+        results["blocking_us"] = (time.perf_counter() - start) / n * 1e6
+
+        listener = setup_logging(logging.DEBUG, stream=_SlowStream())
+        start = time.perf_counter()
+        for i in range(calls):
+            log.debug("ball at %d,%d", i, i)
+        results["queued_us"] = (time.perf_counter() - start) / calls * 1e6
+
+        sampled = RateLimitedLogger(log, interval=1.0)
+        start = time.perf_counter()
+        for i in range(calls):
+            sampled.debug("ball at %d,%d", i, i)
+        results["sampled_us"] = (time.perf_counter() - start) / calls * 1e6
+        listener.stop()
+    finally:
+        for old in list(root.handlers):
+            root.removeHandler(old)
+        for handler in saved[0]:
+            root.addHandler(handler)
+        root.setLevel(saved[1])
+    return results
+
+
+if __name__ == "__main__":
+    for name, micros in benchmark().items():
+        print(f"{name}: {micros:.2f} µs per call")
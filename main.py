@@ -1,29 +1,54 @@
 # main.py
 
 import os
+import sys
+import time
 import json
 import pygame
 import logging
 
 from constants         import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
-    SETTINGS_FILE, FONT_PATH, FONT_TITLE_SIZE, FONT_HUD_SIZE
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FRAME_PACING, SPECTATOR_PORT, ALLOC_PROFILE, PIPELINE,
+    FRAME_GOVERNOR, METRICS_PORT, PARTICLES, TABLES, COLOR_BG, DISPLAY_SIZE, RENDER_MODE,
+    SETTINGS_FILE, ENTRANTS_FILE, CAPTURE_FORMAT, FONT_PATH, FONT_TITLE_SIZE, FONT_HUD_SIZE
 )
+import utils
 from utils             import get_font, draw_text
 from menu              import MainMenu
 from inputbox          import InputBox
 from game              import Game
+from display           import Display
+from tables            import MultiTable, MAX_TABLES
+from pipeline          import SimulationPipeline
 from leaderboard       import Leaderboard
 from win_screen        import WinScreen
 from pause_menu        import PauseMenu
 from settings_screen   import SettingsScreen
 from states            import GameState
 from transition_screen import TransitionScreen
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s %(levelname)s: %(message)s"
-)
+from scenes            import Scene, SceneStack
+from tournament        import Tournament, FORMATS, make_tournament
+from pacing            import FramePacer
+from governor          import FrameGovernor
+from particles         import ParticleSystem
+from events            import EventBus, PaddleHit, PointScored, MatchWon
+from sound             import SoundEffects
+from telemetry         import TelemetrySink
+from spectator         import SpectatorServer
+from capture           import FrameRecorder
+from journal           import SeriesJournal
+from logsetup          import setup_logging, context as log_context
+from allocations       import AllocationTracker
+import metrics
+from metrics           import MetricsServer
+
+frames_total   = metrics.counter("pong_frames_total", "Frames run; physics steps once per frame.")
+rendered_total = metrics.counter("pong_frames_rendered_total", "Frames drawn and presented.")
+frame_interval = metrics.histogram("pong_frame_interval_seconds", "Time between consecutive presented frames.")
+frame_work     = metrics.histogram("pong_frame_work_seconds", "Update, draw and present time per frame.")
+fps_gauge      = metrics.gauge("pong_fps", "Frames per second, over the last second.")
+state_gauge    = metrics.gauge("pong_state", "1 for the current GameState, 0 for the others.", label="state")
+quality_gauge  = metrics.gauge("pong_quality_level", "Frame governor level; 0 is full quality.")
 
 def draw_hud(
     surface: pygame.Surface,
@@ -34,19 +59,25 @@ def draw_hud(
     current_match: int,
     games_won: dict[str,int],
     series_wins: dict[str,int],
+    heading: str|None = None,
+    rally: "RallyCounter|None" = None,
 ) -> None:
     """
     Draw the HUD with three lines:
-     1) Match X/Y
+     1) Match X/Y (or `heading`, e.g. the tournament round)
      2) Games won this match
      3) Series wins tally
+    plus the live rally length along the bottom when `rally` is given.
+    Laid out for `surface`'s size, so it can be drawn at any resolution
+    with a font to match.
     """
-    cx = SCREEN_WIDTH // 2
+    cx = surface.get_width() // 2
+    k  = surface.get_height() / SCREEN_HEIGHT
 
     # Line 1: match counter
     draw_text(surface,
-              f"Match {current_match}/{settings['num_matches']}",
-              (cx, 20),
+              heading or f"Match {current_match}/{settings['num_matches']}",
+              (cx, 20 * k),
               font)
 
     # Line 2: games-won within this match
@@ -55,23 +86,769 @@ def draw_hud(
     best_of  = settings["games_per_match"]
     draw_text(surface,
               f"{p1}: {gw1} — {p2}: {gw2}   (best of {best_of})",
-              (cx, 50),
+              (cx, 50 * k),
               font)
 
     # Line 3: series-wins tally
     sw1, sw2 = series_wins.get(p1, 0), series_wins.get(p2, 0)
     draw_text(surface,
               f"{p1} series-wins: {sw1}    {p2} series-wins: {sw2}",
-              (cx, 80),
+              (cx, 80 * k),
               font)
 
+    if rally is not None:
+        draw_text(surface,
+                  f"Rally: {rally.current}    Best this match: {rally.best}",
+                  (cx, (SCREEN_HEIGHT - 20) * k),
+                  font)
+
+
+class HudLayer:
+    """
+    draw_hud's output kept on a colour-keyed layer and redrawn only when
+    the values it shows change; otherwise the HUD costs one blit.
+    """
+    def __init__(self, size: tuple[int,int]):
+        self.surface = pygame.Surface(size)
+        self.surface.set_colorkey(COLOR_BG, pygame.RLEACCEL)
+        self.key: tuple|None = None
+
+    def draw(self, surface: pygame.Surface, key: tuple, *args, **kwargs) -> None:
+        """Blit the HUD for `key` (the values shown), drawing it only if `key` changed."""
+        if key != self.key:
+            self.surface.fill(COLOR_BG)
+            draw_hud(self.surface, *args, **kwargs)
+            self.key = key
+        surface.blit(self.surface, (0, 0))
+
+
+class RallyCounter:
+    """HUD subscriber: live rally length and the longest rally this match."""
+    def __init__(self, bus: EventBus):
+        self.current = 0
+        self.best    = 0
+        bus.subscribe(PaddleHit,   self.on_hit)
+        bus.subscribe(PointScored, self.on_point)
+        bus.subscribe(MatchWon,    self.on_match)
+
+    def on_hit(self, event: PaddleHit) -> None:
+        self.current += 1
+        self.best = max(self.best, self.current)
+
+    def on_point(self, event: PointScored) -> None:
+        self.current = 0
+
+    def on_match(self, event: MatchWon) -> None:
+        self.current = self.best = 0
+
+
+class Session:
+    """
+    Everything the scenes share: the window, fonts, reusable screens
+    and the progress of the current series.
+    """
+    def __init__(self, screen: pygame.Surface, saved_settings: dict, display: Display|None = None):
+        self.screen         = screen
+        # The window `screen` is fitted to (see display.py)
+        self.display        = display or Display(screen)
+        self.saved_settings = saved_settings
+        self.running        = True
+
+        # Gameplay events outlive each Game; sound and HUD listen here
+        self.bus   = EventBus()
+        SoundEffects().attach(self.bus)
+        self.rally = RallyCounter(self.bus)
+        # Ball trails and impact sparks, thinned out when over budget
+        self.particles: ParticleSystem|None = None
+        if PARTICLES:
+            self.particles = ParticleSystem()
+            self.particles.attach(self.bus)
+        # Sheds optional rendering work when frames run over budget
+        self.governor = FrameGovernor(FPS, max_level=len(FrameGovernor.LEVELS) - 1 if FRAME_GOVERNOR else 0)
+        # Optional live broadcast to venue screens
+        self.spectators: SpectatorServer|None = None
+        # Crash-safe record of series progress (set up by main())
+        self.journal: SeriesJournal|None = None
+
+        # Fonts
+        self.title_font = get_font(FONT_TITLE_SIZE, FONT_PATH)
+        self.hud_font   = get_font(FONT_HUD_SIZE, FONT_PATH)
+
+        # Screens & Menus (built once, reused on every visit)
+        self.main_menu     = MainMenu(screen, self.title_font)
+        self.leaderboard   = Leaderboard(screen, self.hud_font)
+        self.pause_menu    = PauseMenu(screen, self.title_font)
+        self.settings_view = SettingsScreen(
+            screen,
+            self.title_font,
+            initial_settings=saved_settings or None
+        )
+
+        # InputBoxes (name boxes complete from known players)
+        complete = self.leaderboard.players.complete
+        self.name1_box = InputBox((250, 200, 300, 50), self.title_font, suggest=complete)
+        self.name2_box = InputBox((250, 260, 300, 50), self.title_font, suggest=complete)
+        self.serve_box = InputBox((250, 300, 300, 50), self.title_font)
+
+        # Series progress
+        self.player_names: list[str]     = []
+        self.tournament_settings: dict   = {}
+        self.series_wins: dict[str,int]  = {}
+        self.games_won: dict[str,int]    = {}
+        self.current_match: int          = 0
+        self.game: Game|None             = None
+        self.result_text: str            = ""
+        self.next_label: str             = ""
+        self.tournament: Tournament|None = None
+
+    def reset_series(self) -> None:
+        """Forget names, settings and tallies before a new series."""
+        self.player_names.clear()
+        self.tournament_settings = {}
+        self.series_wins   = {}
+        self.games_won     = {}
+        self.current_match = 0
+        self.game          = None
+        self.tournament    = None
+
+    def start_tournament(self, tournament: Tournament) -> None:
+        """Begin a many-player event; each pairing plays one match."""
+        self.reset_series()
+        self.tournament = tournament
+        self.next_pairing()
+
+    def next_pairing(self) -> bool:
+        """
+        Load the tournament's next pairing into player_names.
+        Returns False once the tournament is over.
+        """
+        pairing = self.tournament.next_match()
+        if pairing is None:
+            return False
+        self.player_names[:] = pairing
+        self.series_wins = {}
+        return True
+
+    def advance_after_match(self) -> GameState:
+        """
+        After a match: load the next pairing/match and return TRANSITION,
+        or set the final result and return SERIES_END.
+        """
+        if self.tournament is not None:
+            if self.next_pairing():
+                self.next_label = f"{self.player_names[0]} vs {self.player_names[1]}"
+                return GameState.TRANSITION
+            self.result_text = f"{self.tournament.champion()} wins the {self.tournament.name} event"
+            return GameState.SERIES_END
+        if self.current_match < self.tournament_settings["num_matches"]:
+            self.next_label = f"Match {self.current_match+1}/{self.tournament_settings['num_matches']}"
+            return GameState.TRANSITION
+        winner = max(self.series_wins, key=self.series_wins.get)
+        self.result_text = f"{winner} wins series {self.series_wins[winner]}"
+        return GameState.SERIES_END
+
+    def resume(self) -> GameState:
+        """
+        Rebuild the series recorded in the journal and return the state to
+        continue from: PLAYING at the exact score if a match was under way.
+        """
+        st = self.journal.state
+        self.reset_series()
+        self.player_names[:]     = st["names"]
+        self.tournament_settings = dict(st["settings"])
+        self.series_wins   = dict(st["series_wins"])
+        self.games_won     = dict(st["games_won"])
+        self.current_match = st["current_match"]
+        if st["tournament"] is not None:
+            info = st["tournament"]
+            self.tournament = make_tournament(info["format"], info["players"])
+            # Pairing is deterministic, so replaying results rebuilds the rounds
+            self.tournament.replay(info["results"])
+            if st["tables"] > 1:
+                # TablesScene seats every pairing still to be played
+                self.player_names.clear()
+                return GameState.TABLES
+            if st["in_match"]:
+                self.tournament.next_match()
+        if not st["in_match"]:
+            return self.advance_after_match()
+        self.game = Game(
+            self.screen,
+            self.player_names,
+            self.tournament_settings,
+            first_player=st["server"],
+            bus=self.bus
+        )
+        self.game.points.update(zip(self.player_names, st["points"]))
+        return GameState.PLAYING
+
+    def match_heading(self) -> str|None:
+        """HUD line 1 during a tournament; None for a plain series."""
+        if self.tournament is None:
+            return None
+        return f"{self.tournament.name} round {self.tournament.round} — match {self.current_match}"
+
+    def save_settings(self, values: dict) -> None:
+        """Adopt `values` for this series and persist them to disk."""
+        self.tournament_settings = dict(values)
+        if self.game is not None:
+            self.game.settings = self.tournament_settings
+        if self.journal is not None and self.current_match:
+            self.journal.settings_changed(self.tournament_settings)
+        try:
+            with open(SETTINGS_FILE, 'w') as f:
+                json.dump(self.tournament_settings, f, indent=2)
+        except Exception:
+            logging.exception("Failed to save settings.json")
+
+
+class SessionScene(Scene):
+    """Base for the game's scenes: gives each one the shared Session."""
+    def __init__(self, session: Session):
+        super().__init__()
+        self.session = session
+
+
+class MenuScene(SessionScene):
+    state = GameState.MENU
+    options = ["Start", "Tournament", "Settings", "Leaderboard"]
+
+    def enter(self) -> None:
+        # Offer to pick up a series the journal says was never finished
+        s = self.session
+        resumable = s.journal is not None and s.journal.resumable
+        s.main_menu.set_options(["Resume"] * resumable + self.options)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        s = self.session
+        choice = s.main_menu.handle_event(event)
+        if choice == "resume":
+            self.stack.reset(s.resume())
+        elif choice == "start":
+            s.reset_series()
+            self.stack.replace(GameState.ENTER_NAME1)
+        elif choice == "tournament":
+            self.stack.replace(GameState.TOURNAMENT_SETUP)
+        elif choice == "settings":
+            s.settings_view.load(s.tournament_settings or s.saved_settings or None)
+            self.stack.push(GameState.SETTINGS)
+        elif choice == "leaderboard":
+            self.stack.push(GameState.LEADERBOARD)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.session.main_menu.draw()
+
+
+class NameEntryScene(SessionScene):
+    """Prompt for one player's name, then move on to the next entry step."""
+    def __init__(
+        self,
+        session: Session,
+        state: GameState,
+        prompt: str,
+        box: InputBox,
+        prompt_y: int
+    ):
+        super().__init__(session)
+        self.state    = state
+        self.prompt   = prompt
+        self.box      = box
+        self.prompt_y = prompt_y
+        self.message  = ""
+
+    def enter(self) -> None:
+        self.message = ""
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        s = self.session
+        name = self.box.handle_event(event)
+        if not name:
+            return
+        # Known players keep their registered spelling
+        players = s.leaderboard.players
+        name = players.canonical(name)
+        if any(players.same(name, other) for other in s.player_names):
+            # Names match case-insensitively, so "bryan" is Player 1 "Bryan"
+            self.message = f"{name} is already playing"
+            self.box.active = True
+            return
+        s.player_names.append(name)
+        if self.state == GameState.ENTER_NAME1:
+            self.stack.replace(GameState.ENTER_NAME2)
+        else:
+            s.settings_view.load(s.tournament_settings or s.saved_settings or None)
+            self.stack.replace(GameState.SETTINGS)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        draw_text(surface, self.prompt, (SCREEN_WIDTH//2, self.prompt_y), self.session.title_font)
+        self.box.draw(surface)
+        if self.message:
+            draw_text(surface, self.message, (SCREEN_WIDTH//2, self.box.rect.bottom + 30), self.session.hud_font)
+
+
+class TournamentSetupScene(SessionScene):
+    """
+    Collect entrants (pre-filled from ENTRANTS_FILE if present) and a format.
+    Enter adds the typed name; Enter on an empty box starts the event.
+    """
+    state = GameState.TOURNAMENT_SETUP
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self.box = InputBox(
+            (250, 200, 300, 50), session.title_font,
+            suggest=session.leaderboard.players.complete
+        )
+        self.format_index = 0
+        self.entrants: list[str] = []
+
+    def enter(self) -> None:
+        self.entrants = []
+        if os.path.isfile(ENTRANTS_FILE):
+            try:
+                with open(ENTRANTS_FILE, 'r') as f:
+                    names = (line.strip() for line in f)
+                    self.entrants = list(dict.fromkeys(n for n in names if n))
+            except Exception:
+                logging.exception("Could not load entrants.txt")
+        self.box.text   = ""
+        self.box.active = True
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        s = self.session
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.stack.replace(GameState.MENU)
+            return
+        # Tab completes a name when there is a suggestion, else cycles format
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB and not self.box.suggestions:
+            self.format_index = (self.format_index + 1) % len(FORMATS)
+            return
+        name = self.box.handle_event(event)
+        if name is None:
+            return
+        name = s.leaderboard.players.canonical(name)
+        if name:
+            if name not in self.entrants:
+                self.entrants.append(name)
+        elif len(self.entrants) >= 2:
+            s.start_tournament(make_tournament(FORMATS[self.format_index], self.entrants))
+            s.settings_view.load(s.saved_settings or None)
+            self.stack.replace(GameState.SETTINGS)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        s = self.session
+        cx = SCREEN_WIDTH // 2
+        draw_text(surface, "Tournament", (cx, 60), s.title_font)
+        draw_text(surface, f"Format: {FORMATS[self.format_index]}  (Tab to change)", (cx, 130), s.hud_font)
+        draw_text(surface, "Add entrant:", (cx, 170), s.hud_font)
+        self.box.draw(surface)
+        draw_text(surface, f"{len(self.entrants)} entrants", (cx, 290), s.hud_font)
+        for i, name in enumerate(self.entrants[-5:]):
+            draw_text(surface, name, (cx, 330 + i*30), s.hud_font)
+        draw_text(surface, "Enter on an empty box to start, Esc to cancel", (cx, SCREEN_HEIGHT - 40), s.hud_font)
+
+
+class SettingsScene(SessionScene):
+    """
+    Overlay: when pushed over another scene (menu, pause) it pops back
+    to it; when it replaced name entry it continues to serve selection.
+    """
+    state      = GameState.SETTINGS
+    is_overlay = True
+    dim_alpha  = 200
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        s = self.session
+        result = s.settings_view.handle_event(event)
+        if result is None:
+            return
+        if isinstance(result, dict):
+            s.save_settings(result)
+        if len(self.stack) > 1:
+            self.stack.pop()
+        elif len(s.player_names) < 2:
+            self.stack.replace(GameState.MENU)
+        elif s.tournament is not None and TABLES > 1:
+            self.stack.replace(GameState.TABLES)
+        else:
+            self.stack.replace(GameState.CHOOSE_SERVER)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.session.settings_view.draw(dim=False)
+
+
+class LeaderboardScene(SessionScene):
+    """
+    Shows the leaderboard, picking up results other cabinets record on
+    a shared store while it is open.
+    """
+    state = GameState.LEADERBOARD
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self.frames = 0
+
+    def enter(self) -> None:
+        self.session.leaderboard.refresh()
+
+    def update(self) -> None:
+        # About once a second; a stat() when nothing changed
+        self.frames += 1
+        if self.frames % FPS == 0:
+            self.session.leaderboard.refresh()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if self.session.leaderboard.handle_event(event) == "BACK":
+            self.stack.pop()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        # Drawn over a cleared screen, so the dimming overlay would be wasted
+        self.session.leaderboard.draw(dim=False)
+
+
+class ChooseServerScene(SessionScene):
+    state = GameState.CHOOSE_SERVER
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        s = self.session
+        if len(s.player_names) < 2:
+            self.stack.replace(GameState.MENU)
+            return
+        val = s.serve_box.handle_event(event)
+        if val in ("1", "2"):
+            starter = int(val) - 1
+            if s.journal is not None and s.current_match == 0:
+                s.journal.series_started(s.player_names, s.tournament_settings, s.tournament)
+            s.current_match += 1
+            if s.journal is not None:
+                s.journal.match_started(s.current_match, s.player_names, starter)
+            # reset per-match trackers
+            s.games_won   = {n: 0 for n in s.player_names}
+            s.series_wins = s.series_wins or {n: 0 for n in s.player_names}
+            s.game = Game(
+                s.screen,
+                s.player_names,
+                s.tournament_settings,
+                first_player=starter,
+                bus=s.bus
+            )
+            self.stack.replace(GameState.PLAYING)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        s = self.session
+        if len(s.player_names) < 2:
+            return
+        draw_text(
+            surface,
+            f"Who serves first? 1={s.player_names[0]}  2={s.player_names[1]}",
+            (SCREEN_WIDTH//2, 260),
+            s.title_font
+        )
+        s.serve_box.draw(surface)
+
+
+class PlayScene(SessionScene):
+    """
+    A match in progress. With PIPELINE on, physics for the next frame
+    runs on a worker thread while this one is drawn (see pipeline.py).
+    """
+    state = GameState.PLAYING
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self.pipeline: SimulationPipeline|None = None
+        self.hud = HudLayer(session.screen.get_size())
+
+    def enter(self) -> None:
+        if PIPELINE:
+            self.pipeline = SimulationPipeline(self.session.game)
+
+    def exit(self) -> None:
+        if self.pipeline is not None:
+            self.pipeline.stop()
+            self.pipeline = None
+        if self.session.particles is not None:
+            self.session.particles.clear()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        # Pause toggle
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            # The pause menu freezes `screen`; bring it the frame on show
+            self.session.display.capture_native()
+            self.stack.push(GameState.PAUSED)
+
+    def update(self) -> None:
+        s = self.session
+        # 1) update positions and detect point wins
+        if self.pipeline is not None:
+            point_winner = self.pipeline.finish_step()
+        else:
+            point_winner = s.game.update()
+        if s.spectators is not None:
+            s.spectators.publish(s.game)
+        if s.particles is not None:
+            # Between steps, so the worker is not moving the balls
+            s.particles.trail(s.game.ball_grp)
+            s.particles.update()
+
+        # 2) if a player won the game (points_to_win)
+        if point_winner:
+            s.games_won[point_winner] += 1
+            threshold = (s.tournament_settings["games_per_match"] // 2) + 1
+            # match-win?
+            if s.games_won[point_winner] >= threshold:
+                winner = point_winner
+                s.series_wins[winner] += 1
+                p1, p2 = s.player_names
+                s.bus.publish(MatchWon(
+                    s.game.frame,
+                    int(winner == p2),
+                    winner,
+                    (s.games_won[winner], s.games_won[p2 if winner == p1 else p1])
+                ))
+                s.result_text = f"{winner} wins match {s.current_match}"
+                s.leaderboard.record(
+                    s.player_names,
+                    (s.games_won[s.player_names[0]], s.games_won[s.player_names[1]])
+                )
+                if s.tournament is not None:
+                    loser = next(n for n in s.player_names if n != winner)
+                    s.tournament.report(winner, loser, s.games_won[winner], s.games_won[loser])
+                self.stack.replace(GameState.MATCH_END)
+            else:
+                # reset for next game in same match
+                s.game.prepare_next_round()
+
+        # Sprites follow the frame governor's quality level; switched
+        # between steps, never while the pipeline's worker runs one
+        if s.game is not None:
+            s.game.set_sprite_alpha(s.governor.alpha)
+
+        # 3) start the next frame's physics; it runs while this one is drawn
+        #    (a match that just ended has already stopped the pipeline)
+        if self.pipeline is not None:
+            self.pipeline.start_step(pygame.key.get_pressed())
+
+    def draw(self, surface: pygame.Surface) -> None:
+        s = self.session
+        front = self.pipeline.front if self.pipeline is not None else None
+        # A window larger than the layout is drawn at its own resolution
+        target = s.display.native_target()
+        if target is None:
+            scale, hud_font = 1.0, s.hud_font
+            if s.particles is not None:
+                s.particles.draw(surface)   # under the sprites
+            s.game.draw(front)
+        else:
+            surface = target
+            surface.fill(COLOR_BG)
+            scale, hud_font = s.display.scale, s.display.font(FONT_HUD_SIZE)
+            if s.particles is not None:
+                s.particles.draw(surface, scale)
+            s.game.draw(front, surface, s.display.game_sprites(s.game.sprites.physics))
+        heading = s.match_heading()
+        hud = (
+            hud_font,
+            s.game,
+            s.player_names,
+            s.tournament_settings,
+            s.current_match,
+            s.games_won,
+            s.series_wins,
+        )
+        if s.governor.hud_cache:
+            # Everything the HUD shows, so an unchanged HUD is one blit
+            key = (
+                heading, s.current_match, s.tournament_settings["num_matches"],
+                tuple(s.games_won.values()), tuple(s.series_wins.values()),
+                s.rally.current, s.rally.best, utils.text_antialias,
+            )
+            if self.hud.surface.get_size() != surface.get_size():
+                self.hud = HudLayer(surface.get_size())
+            self.hud.draw(surface, key, *hud, heading=heading, rally=s.rally)
+        else:
+            draw_hud(surface, *hud, heading=heading, rally=s.rally)
+
+
+class TablesScene(SessionScene):
+    """
+    Multi-table mode (PONG_TABLES > 1): the tournament's pairings are
+    played several at once, one per table (see tables.py). A table
+    takes the next pairing as soon as its match ends; results go to the
+    leaderboard, the tournament and the series journal as each match
+    finishes, so a crashed event resumes with its unplayed pairings.
+    """
+    state = GameState.TABLES
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self.tables: MultiTable|None = None
+        # Kept off the session bus, whose listeners (journal, rally HUD,
+        # particles) follow a single match
+        self.bus = EventBus()
+        SoundEffects().attach(self.bus)
+
+    def enter(self) -> None:
+        s = self.session
+        n = min(max(TABLES, 2), MAX_TABLES)
+        self.tables = MultiTable(s.screen, n, s.tournament_settings, self.bus)
+        if s.player_names:
+            # A new event: start_tournament() loaded the first pairing.
+            # (A resumed one has none; _fill() seats what is left.)
+            if s.journal is not None:
+                s.journal.series_started(s.player_names, s.tournament_settings, s.tournament, tables=n)
+            self.tables.seat(s.player_names)
+        self._fill()
+
+    def exit(self) -> None:
+        self.tables = None
+
+    def _fill(self) -> None:
+        """Seat pairings at free tables while the tournament has some to play now."""
+        while any(table.free for table in self.tables.tables):
+            pairing = self.session.tournament.next_match()
+            if pairing is None:
+                return
+            self.tables.seat(list(pairing))
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.stack.push(GameState.PAUSED)
+
+    def update(self) -> None:
+        s = self.session
+        if self.tables.settings is not s.tournament_settings:
+            self.tables.set_settings(s.tournament_settings)     # changed from the pause menu
+        finished = self.tables.update()
+        for winner, loser, winner_games, loser_games in finished:
+            s.current_match += 1
+            if s.journal is not None:
+                s.journal.match_reported(winner, loser, (winner_games, loser_games))
+            s.leaderboard.record([winner, loser], (winner_games, loser_games))
+            s.tournament.report(winner, loser, winner_games, loser_games)
+        if finished:
+            self._fill()
+        if not self.tables.playing:
+            s.result_text = f"{s.tournament.champion()} wins the {s.tournament.name} event"
+            self.stack.replace(GameState.SERIES_END)
+            return
+        self.tables.set_sprite_alpha(s.governor.alpha)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.tables.draw(surface)
+
+
+class PauseScene(SessionScene):
+    """Overlay over the frozen game frame; the match itself is not drawn."""
+    state      = GameState.PAUSED
+    is_overlay = True
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        s = self.session
+        action = s.pause_menu.handle_event(event)
+        if action == "resume":
+            self.stack.pop()
+        elif action == "settings":
+            s.settings_view.load(s.tournament_settings)
+            self.stack.push(GameState.SETTINGS)
+        elif action == "main_menu":
+            self.stack.reset(GameState.MENU)
+        elif action == "quit":
+            s.running = False
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.session.pause_menu.draw(dim=False)
+
+
+class MatchEndScene(SessionScene):
+    state = GameState.MATCH_END
+
+    def enter(self) -> None:
+        s = self.session
+        self.win_screen = WinScreen(
+            s.screen,
+            s.title_font,
+            s.result_text,
+            prompt="Press any key to continue"
+        )
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        s = self.session
+        if event.type not in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            return
+        self.stack.replace(s.advance_after_match())
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.win_screen.draw()
+
+
+class TransitionScene(SessionScene):
+    state = GameState.TRANSITION
+
+    def enter(self) -> None:
+        s = self.session
+        self.transition = TransitionScreen(
+            s.screen,
+            "Next Match",
+            s.next_label,
+            s.title_font, s.hud_font
+        )
+
+    def update(self) -> None:
+        if self.transition.tick():
+            self.stack.replace(GameState.CHOOSE_SERVER)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.transition.draw()
+
+
+class SeriesEndScene(SessionScene):
+    state = GameState.SERIES_END
+
+    def enter(self) -> None:
+        s = self.session
+        self.win_screen = WinScreen(s.screen, s.title_font, s.result_text)
+        if s.journal is not None:
+            s.journal.series_ended()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            self.stack.reset(GameState.MENU)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.win_screen.draw()
+
+
+def build_scenes(session: Session) -> SceneStack:
+    """Create every scene once and register it on a new stack."""
+    stack = SceneStack(session.screen)
+    for scene in (
+        MenuScene(session),
+        NameEntryScene(session, GameState.ENTER_NAME1, "Player 1 Name:", session.name1_box, 170),
+        NameEntryScene(session, GameState.ENTER_NAME2, "Player 2 Name:", session.name2_box, 230),
+        TournamentSetupScene(session),
+        SettingsScene(session),
+        LeaderboardScene(session),
+        ChooseServerScene(session),
+        PlayScene(session),
+        TablesScene(session),
+        PauseScene(session),
+        MatchEndScene(session),
+        TransitionScene(session),
+        SeriesEndScene(session),
+    ):
+        stack.register(scene)
+    return stack
+
 
 def main() -> None:
-    """Initialize Pygame and run the main state machine."""
+    """Initialize Pygame and run the scene stack."""
+    log_listener = setup_logging(logging.DEBUG)
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    display = Display(pygame.display.set_mode(DISPLAY_SIZE), RENDER_MODE)
+    screen  = display.surface
     pygame.display.set_caption("Pong Tournament")
-    clock = pygame.time.Clock()
+    pacer = FramePacer(FPS, mode=FRAME_PACING)
 
     # Load persisted settings (JSON)
     saved_settings: dict = {}
@@ -82,261 +859,116 @@ def main() -> None:
         except Exception:
             logging.exception("Could not load settings.json")
 
-    # Fonts
-    title_font = get_font(FONT_TITLE_SIZE, FONT_PATH)
-    hud_font   = get_font(FONT_HUD_SIZE, FONT_PATH)
-
-    # Screens & Menus
-    main_menu     = MainMenu(screen, title_font)
-    leaderboard   = Leaderboard(screen, hud_font)
-    pause_menu    = PauseMenu(screen, title_font)
-    settings_view = SettingsScreen(
-        screen,
-        title_font,
-        initial_settings=saved_settings or None
-    )
-
-    # InputBoxes
-    name1_box = InputBox((250, 200, 300, 50), title_font)
-    name2_box = InputBox((250, 260, 300, 50), title_font)
-    serve_box = InputBox((250, 300, 300, 50), title_font)
-
-    # State variables
-    player_names: list[str]     = []
-    tournament_settings: dict   = {}
-    series_wins: dict[str,int]  = {}
-    games_won: dict[str,int]    = {}
-    current_match: int          = 0
-    game: Game|None             = None
-    win_screen: WinScreen|None  = None
-    transition: TransitionScreen|None = None
-
-    state = GameState.MENU
-
-    while True:
-        # Event handling
+    session = Session(screen, saved_settings, display)
+    session.journal = SeriesJournal()
+    session.journal.attach(session.bus)
+    session.leaderboard.compactor.start()
+    telemetry = TelemetrySink()
+    telemetry.attach(session.bus)
+    if SPECTATOR_PORT:
+        session.spectators = SpectatorServer("0.0.0.0", SPECTATOR_PORT)
+        session.spectators.start()
+    stack   = build_scenes(session)
+    stack.reset(GameState.MENU)
+    state_gauge.set_function(lambda: {state.name: int(state == stack.state) for state in GameState})
+    quality_gauge.set_function(lambda: session.governor.level)
+    exporter: MetricsServer|None = None
+    if METRICS_PORT:
+        exporter = MetricsServer(host="127.0.0.1", port=METRICS_PORT)
+        exporter.start()
+    fps_since, fps_frames = time.perf_counter(), 0
+
+    recorder: FrameRecorder|None = None
+    allocs: AllocationTracker|None = None
+    if ALLOC_PROFILE:
+        if sys.version_info < (3, 12) and pygame.mixer.get_init():
+            # A sound ending while tracing can crash the interpreter (see AllocationTracker)
+            logging.warning("Sound is off while profiling allocations on Python < 3.12")
+            pygame.mixer.set_num_channels(0)
+        allocs = AllocationTracker().start()
+
+    while session.running:
+        # Wait first, so events and key state are as fresh as possible
+        pacer.wait()
+        frame_start = time.perf_counter()
+        log_context.frame += 1
+        log_context.state = stack.state.name
+        log_context.match = session.current_match
+
+        # Event handling: only the top scene sees events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                return
-
-            # Pause toggle
-            if state == GameState.PLAYING and event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                state = GameState.PAUSED
-
-            # Dispatch by current state
-            if state == GameState.MENU:
-                choice = main_menu.handle_event(event)
-                if choice == "start":
-                    player_names.clear()
-                    tournament_settings.clear()
-                    state = GameState.ENTER_NAME1
-                elif choice == "settings":
-                    settings_view = SettingsScreen(
-                        screen,
-                        title_font,
-                        initial_settings=tournament_settings or saved_settings or None
-                    )
-                    state = GameState.SETTINGS
-                elif choice == "leaderboard":
-                    state = GameState.LEADERBOARD
-
-            elif state == GameState.ENTER_NAME1:
-                name = name1_box.handle_event(event)
-                if name:
-                    player_names.append(name)
-                    state = GameState.ENTER_NAME2
-
-            elif state == GameState.ENTER_NAME2:
-                name = name2_box.handle_event(event)
-                if name:
-                    player_names.append(name)
-                    settings_view = SettingsScreen(
-                        screen,
-                        title_font,
-                        initial_settings=tournament_settings or saved_settings or None
-                    )
-                    state = GameState.SETTINGS
-
-            elif state == GameState.SETTINGS:
-                result = settings_view.handle_event(event)
-                if result == "BACK":
-                    # return to main menu if names not set
-                    state = GameState.MENU if len(player_names) < 2 else GameState.CHOOSE_SERVER
-                elif isinstance(result, dict):
-                    tournament_settings = result
-                    # save to disk
-                    try:
-                        with open(SETTINGS_FILE, 'w') as f:
-                            json.dump(result, f, indent=2)
-                    except Exception:
-                        logging.exception("Failed to save settings.json")
-                    state = GameState.CHOOSE_SERVER
-
-            elif state == GameState.LEADERBOARD:
-                if leaderboard.handle_event(event) == "BACK":
-                    state = GameState.MENU
-
-            elif state == GameState.CHOOSE_SERVER:
-                if len(player_names) < 2:
-                    state = GameState.MENU
+                session.running = False
+                break
+            # F9 starts/stops recording a highlight clip, from any screen
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                if recorder is None:
+                    recorder = FrameRecorder(display.window, fmt=CAPTURE_FORMAT)
+                    logging.info("Recording to %s", recorder.out_dir)
                 else:
-                    val = serve_box.handle_event(event)
-                    if val in ("1", "2"):
-                        starter = int(val) - 1
-                        current_match += 1
-                        # reset per-match trackers
-                        games_won   = {n: 0 for n in player_names}
-                        series_wins = series_wins or {n: 0 for n in player_names}
-                        game = Game(
-                            screen,
-                            player_names,
-                            tournament_settings,
-                            first_player=starter
-                        )
-                        state = GameState.PLAYING
-
-            elif state == GameState.PLAYING:
-                # leave logic to per-frame update below
-                pass
-
-            elif state == GameState.PAUSED:
-                action = pause_menu.handle_event(event)
-                if action == "resume":
-                    state = GameState.PLAYING
-                elif action == "settings":
-                    settings_view = SettingsScreen(
-                        screen,
-                        title_font,
-                        initial_settings=tournament_settings
-                    )
-                    state = GameState.SETTINGS
-                elif action == "main_menu":
-                    state = GameState.MENU
-                elif action == "quit":
-                    pygame.quit()
-                    return
-
-            elif state == GameState.MATCH_END:
-                if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-                    if current_match < tournament_settings["num_matches"]:
-                        transition = TransitionScreen(
-                            screen,
-                            "Next Match",
-                            f"Match {current_match+1}/{tournament_settings['num_matches']}",
-                            title_font, hud_font
-                        )
-                        state = GameState.TRANSITION
-                    else:
-                        winner = max(series_wins, key=series_wins.get)
-                        text = f"{winner} wins series {series_wins[winner]}"
-                        win_screen = WinScreen(screen, title_font, text)
-                        state = GameState.SERIES_END
-
-            elif state == GameState.TRANSITION:
-                # no event-based transitions here
-                pass
-
-            elif state == GameState.SERIES_END:
-                if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-                    state = GameState.MENU
-
-        # Per-frame update & draw
-        screen.fill((0, 0, 0))
-
-        if state == GameState.MENU:
-            main_menu.draw()
-
-        elif state == GameState.ENTER_NAME1:
-            draw_text(screen, "Player 1 Name:", (SCREEN_WIDTH//2, 170), title_font)
-            name1_box.draw(screen)
-
-        elif state == GameState.ENTER_NAME2:
-            draw_text(screen, "Player 2 Name:", (SCREEN_WIDTH//2, 230), title_font)
-            name2_box.draw(screen)
-
-        elif state == GameState.SETTINGS:
-            settings_view.draw()
-
-        elif state == GameState.LEADERBOARD:
-            leaderboard.draw()
-
-        elif state == GameState.CHOOSE_SERVER:
-            draw_text(
-                screen,
-                f"Who serves first? 1={player_names[0]}  2={player_names[1]}",
-                (SCREEN_WIDTH//2, 260),
-                title_font
-            )
-            serve_box.draw(screen)
-
-        elif state == GameState.PLAYING:
-            # 1) update positions and detect point wins
-            point_winner = game.update()
-
-            # 2) if a player won the game (points_to_win)
-            if point_winner:
-                games_won[point_winner] += 1
-                threshold = (tournament_settings["games_per_match"] // 2) + 1
-                # match-win?
-                if games_won[point_winner] >= threshold:
-                    winner = point_winner
-                    series_wins[winner] += 1
-                    win_screen = WinScreen(
-                        screen,
-                        title_font,
-                        f"{winner} wins match {current_match}",
-                        prompt="Press any key to continue"
-                    )
-                    leaderboard.record(
-                        player_names,
-                        (games_won[player_names[0]], games_won[player_names[1]])
-                    )
-                    state = GameState.MATCH_END
-                else:
-                    # reset for next game in same match
-                    game.prepare_next_round()
-
-            # draw game and HUD
-            game.draw()
-            draw_hud(
-                screen,
-                hud_font,
-                game,
-                player_names,
-                tournament_settings,
-                current_match,
-                games_won,
-                series_wins
-            )
-
-        elif state == GameState.PAUSED:
-            game.draw()
-            draw_hud(
-                screen,
-                hud_font,
-                game,
-                player_names,
-                tournament_settings,
-                current_match,
-                games_won,
-                series_wins
-            )
-            pause_menu.draw()
-
-        elif state == GameState.MATCH_END:
-            win_screen.draw()
-
-        elif state == GameState.TRANSITION:
-            transition.draw()
-            if transition.tick():
-                state = GameState.CHOOSE_SERVER
-
-        elif state == GameState.SERIES_END:
-            win_screen.draw()
-
-        pygame.display.flip()
-        clock.tick(FPS)
+                    recorder.close()
+                    recorder = None
+                continue
+            if display.scaled and hasattr(event, "pos"):
+                # Screens lay out (and hit-test) in logical coordinates
+                event = pygame.event.Event(event.type, event.dict, pos=display.to_logical(event.pos))
+            stack.handle_event(event)
+            if not session.running:
+                break
+        if not session.running:
+            break
+        pacer.mark_input()
+
+        # Per-frame update & draw; the governor may skip drawing, but
+        # physics runs every frame
+        governor = session.governor
+        governor.begin_frame()
+        rendered = governor.should_render()
+        if allocs is not None:
+            allocs.begin_frame(stack.state.name)
+        stack.update()
+        if rendered:
+            stack.draw()
+        if allocs is not None:
+            allocs.end_frame()
+
+        if rendered:
+            display.present()
+            pacer.mark_present()
+        if rendered and recorder is not None:
+            recorder.capture(display.window)
+        governor.end_frame(rendered)
+        utils.text_antialias = governor.antialias
+        # Every frame, presented or not: hybrid pacing schedules the next deadline
+        pacer.end_frame()
+
+        # Metrics: a few additions per frame; the exporter thread renders them
+        now = time.perf_counter()
+        frame_work.observe(now - frame_start)
+        frames_total.inc()
+        if rendered:
+            rendered_total.inc()
+            if pacer.intervals:
+                frame_interval.observe(pacer.intervals[-1])
+        if now - fps_since >= 1.0:
+            fps_gauge.set((frames_total.value - fps_frames) / (now - fps_since))
+            fps_since, fps_frames = now, frames_total.value
+
+    pacer.log_report()
+    if allocs is not None:
+        allocs.stop()
+        allocs.log_report()
+    if recorder is not None:
+        recorder.close()
+    telemetry.close()
+    session.journal.close()
+    session.leaderboard.compactor.stop()
+    if session.spectators is not None:
+        session.spectators.stop()
+    if exporter is not None:
+        exporter.stop()
+    log_listener.stop()
+    pygame.quit()
 
 
 if __name__ == "__main__":
@@ -1,32 +1,41 @@
 import pygame
-from utils import draw_text
+from widgets import Button, Panel
 
 class MainMenu:
     """
-    The main menu: displays options (Start, Settings, Leaderboard)
+    The main menu: displays options (Start, Tournament, Settings, Leaderboard)
     and allows navigation via arrows or mouse.
     """
     def __init__(self, surface: pygame.Surface, font: pygame.font.Font):
         self.surface = surface
         self.font    = font
+        self.panel   = Panel()
+        self.options: list[str] = []
 
-        self.options = ["Start", "Settings", "Leaderboard"]
+        self.set_options(["Start", "Tournament", "Settings", "Leaderboard"])
+
+    def set_options(self, options: list[str]) -> None:
+        """Replace the option list (e.g. to offer Resume) and re-layout."""
+        if list(options) != self.options:
+            self.options = list(options)
+            self.panel.clear()
+            width, height = self.surface.get_size()
+            self.buttons = [
+                self.panel.add(Button(label, self.font, (width//2, 200 + i*60), border=False))
+                for i, label in enumerate(self.options)
+            ]
         self.selected_index = 0
+        for idx, button in enumerate(self.buttons):
+            button.selected = idx == 0
 
-        # Precompute bounding rects for mouse clicks
-        self.option_rects = []
-        width, height = surface.get_size()
-        for i, label in enumerate(self.options):
-            text_surf = font.render(label, True, (255,255,255))
-            rect = text_surf.get_rect(center=(width//2, 200 + i*60))
-            self.option_rects.append((label, rect))
+    def _select(self, idx: int) -> None:
+        self.buttons[self.selected_index].selected = False
+        self.selected_index = idx
+        self.buttons[idx].selected = True
 
     def draw(self) -> None:
         """Render all menu options, highlighting the selected one."""
-        for idx, (label, rect) in enumerate(self.option_rects):
-            is_selected = (idx == self.selected_index)
-            color = (255,255,0) if is_selected else (255,255,255)
-            draw_text(self.surface, label, rect.center, self.font, color=color)
+        self.panel.draw(self.surface)
 
     def handle_event(self, event: pygame.event.Event) -> str|None:
         """
@@ -35,16 +44,15 @@ class MainMenu:
         """
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_DOWN, pygame.K_s):
-                self.selected_index = (self.selected_index + 1) % len(self.options)
+                self._select((self.selected_index + 1) % len(self.options))
             elif event.key in (pygame.K_UP, pygame.K_w):
-                self.selected_index = (self.selected_index - 1) % len(self.options)
+                self._select((self.selected_index - 1) % len(self.options))
             elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                return self.options[self.selected_index].lower()
+                return self.buttons[self.selected_index].name
 
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for idx, (label, rect) in enumerate(self.option_rects):
-                if rect.collidepoint(event.pos):
-                    self.selected_index = idx
-                    return label.lower()
+        button, choice = self.panel.handle_event(event)
+        if choice is not None:
+            self._select(self.buttons.index(button))
+            return choice
 
         return None
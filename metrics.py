@@ -0,0 +1,235 @@
+# metrics.py
+
+import logging
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Sequence
+
+# Seconds; spans a fast physics step to a slow shared-volume write
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.002, 0.004, 0.008, 0.0125, 0.0167, 0.025, 0.033, 0.05, 0.1, 0.25, 0.5, 1.0
+)
+
+def _number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class Counter:
+    """A value that only goes up (frames, matches, points)."""
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        self.name  = name
+        self.help  = help
+        self.value = 0
+
+    def inc(self, amount: int|float = 1) -> None:
+        self.value += amount
+
+    def samples(self) -> list[str]:
+        return [f"{self.name} {_number(self.value)}"]
+
+
+class Gauge:
+    """
+    A value that goes up and down. Either set() from the loop, or give
+    it a function that is called at scrape time instead; a function may
+    return {label value: value} to export one series per value of `label`.
+    """
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        fn: Callable[[], float|dict[str, float]]|None = None,
+        label: str|None = None
+    ):
+        self.name  = name
+        self.help  = help
+        self.label = label
+        self.value: float = 0
+        self.fn = fn
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def set_function(self, fn: Callable[[], float|dict[str, float]]|None) -> None:
+        self.fn = fn
+
+    def samples(self) -> list[str]:
+        value = self.fn() if self.fn is not None else self.value
+        if isinstance(value, dict):
+            return [
+                f'{self.name}{{{self.label}="{_escape(str(key))}"}} {_number(v)}'
+                for key, v in value.items()
+            ]
+        return [f"{self.name} {_number(value)}"]
+
+
+class Histogram:
+    """
+    Counts observations into buckets (upper bounds, ascending). observe()
+    is one binary search and three additions, cheap enough for every frame.
+    A scrape may land between those additions and be one observation
+    out; the next scrape catches up.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name   = name
+        self.help   = help
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)   # per bucket, last is +Inf
+        self.sum    = 0.0
+        self.count  = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum   += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate of the q-quantile (0..1), interpolated within its bucket
+        as Prometheus' histogram_quantile() does.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, n in zip(self.bounds, self.counts):
+            if n and seen + n >= rank:
+                return lower + (bound - lower) * (rank - seen) / n
+            seen += n
+            lower = bound
+        return self.bounds[-1]
+
+    def samples(self) -> list[str]:
+        lines = []
+        total = 0
+        for bound, n in zip(self.bounds + (float("inf"),), self.counts):
+            total += n
+            lines.append(f'{self.name}_bucket{{le="{_number(bound)}"}} {total}')
+        lines.append(f"{self.name}_sum {_number(self.sum)}")
+        lines.append(f"{self.name}_count {total}")
+        return lines
+
+
+class Registry:
+    """Metrics by name, in registration order, rendered for scraping."""
+    def __init__(self):
+        self.metrics: dict[str, Counter|Gauge|Histogram] = {}
+
+    def _add(self, metric):
+        existing = self.metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"metric {metric.name} already registered as a {existing.kind}")
+            return existing
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._add(Counter(name, help))
+
+    def gauge(self, name: str, help: str, fn=None, label: str|None = None) -> Gauge:
+        return self._add(Gauge(name, help, fn, label))
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, buckets))
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text format (version 0.0.4)."""
+        lines = []
+        for metric in list(self.metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            try:
+                lines.extend(metric.samples())
+            except Exception:
+                # A failing gauge function must not take the endpoint down
+                logging.exception("Metric %s failed", metric.name)
+        return "\n".join(lines) + "\n"
+
+
+# The game's metrics; modules register theirs here at import
+REGISTRY = Registry()
+counter   = REGISTRY.counter
+gauge     = REGISTRY.gauge
+histogram = REGISTRY.histogram
+
+
+class MetricsServer:
+    """
+    Serves a Registry at http://host:port/metrics from a background
+    thread. Rendering happens on that thread, so a scrape costs the
+    frame loop nothing; it reads the values as they are.
+    """
+    def __init__(self, registry: Registry = REGISTRY, host: str = "127.0.0.1", port: int = 0):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.scrapes = 0
+        self._server: ThreadingHTTPServer|None = None
+        self._thread: threading.Thread|None = None
+
+    def start(self) -> None:
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.registry.exposition().encode()
+                exporter.scrapes += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                logging.debug("Metrics %s: " + fmt, self.client_address[0], *args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+        logging.info("Metrics on http://%s:%d/metrics", self.host, self.port)
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    # Per-update cost from the frame loop: python metrics.py [updates]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    reg = Registry()
+    frames = reg.counter("c", "C.")
+    hist = reg.histogram("h", "H.")
+    start = time.perf_counter()
+    for i in range(n):
+        frames.inc()
+        hist.observe(i * 1e-7)
+    elapsed = time.perf_counter() - start
+    print(f"updates: {n}")
+    print(f"per_update_us: {elapsed / n * 1e6:.3f}")
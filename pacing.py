@@ -0,0 +1,163 @@
+# pacing.py
+
+import time
+import logging
+import statistics
+from collections import deque
+
+import pygame
+
+from constants import FPS
+
+class FramePacer:
+    """
+    Decides when each frame starts and measures how well frames land.
+
+    Modes:
+      - "tick":   pygame.time.Clock.tick (coarse OS sleep, the old behaviour)
+      - "busy":   Clock.tick_busy_loop (spins for accuracy)
+      - "hybrid": sleeps most of the way, spins the last `spin_ms`, and
+                  starts the frame as late as the measured work allows, so
+                  input is sampled just before the physics step and the
+                  frame is presented close to its deadline.
+
+    Call wait() at the top of the loop, mark_input() right after reading
+    events, mark_present() right after display.flip() on frames that were
+    presented, and end_frame() at the end of every frame.
+    """
+    MODES = ("tick", "busy", "hybrid")
+
+    def __init__(
+        self,
+        target_fps: int = FPS,
+        mode: str = "hybrid",
+        spin_ms: float = 2.0,
+        history: int = 600,
+        report_every: float = 10.0
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown pacing mode: {mode}")
+        self.target_fps   = target_fps
+        self.period       = 1.0 / target_fps
+        self.mode         = mode
+        self.spin         = spin_ms / 1000.0
+        self.report_every = report_every
+        self.clock        = pygame.time.Clock()
+
+        # Measured samples (seconds), most recent `history` frames
+        self.intervals: deque[float] = deque(maxlen=history)
+        self.latencies: deque[float] = deque(maxlen=history)
+
+        self._work_estimate = 0.0
+        self._deadline: float|None = None
+        self._frame_start  = 0.0
+        self._input_time   = 0.0
+        self._last_present: float|None = None
+        self._last_report  = time.perf_counter()
+
+    # ——— Loop hooks ———
+    def wait(self) -> None:
+        """Block until the next frame should begin."""
+        if self.mode == "tick":
+            self.clock.tick(self.target_fps)
+        elif self.mode == "busy":
+            self.clock.tick_busy_loop(self.target_fps)
+        else:
+            now = time.perf_counter()
+            if self._deadline is None:
+                self._deadline = now + self.period
+            # Latest start that still finishes the frame by its deadline
+            start_at = self._deadline - self._work_estimate
+            remaining = start_at - now
+            if remaining > self.spin:
+                time.sleep(remaining - self.spin)
+            while time.perf_counter() < start_at:
+                pass
+        self._frame_start = time.perf_counter()
+
+    def mark_input(self) -> None:
+        """Input has just been sampled for this frame."""
+        self._input_time = time.perf_counter()
+
+    def mark_present(self) -> None:
+        """The frame has just been presented (not called for skipped frames)."""
+        now = time.perf_counter()
+        if self._last_present is not None:
+            self.intervals.append(now - self._last_present)
+        self._last_present = now
+        self.latencies.append(now - self._input_time)
+
+    def end_frame(self) -> None:
+        """The frame's work is done, presented or not: schedule the next one."""
+        now = time.perf_counter()
+        if self.mode == "hybrid":
+            # Smoothed work time plus a margin, never more than a frame
+            work = now - self._frame_start
+            self._work_estimate = min(
+                self.period,
+                max(work * 1.25, 0.9 * self._work_estimate + 0.1 * work * 1.25)
+            )
+            self._deadline += self.period
+            if self._deadline < now:
+                # Missed: resynchronise rather than rushing to catch up
+                self._deadline = now + self.period
+
+        if self.report_every and now - self._last_report >= self.report_every:
+            self._last_report = now
+            self.log_report()
+
+    # ——— Reporting ———
+    @staticmethod
+    def _percentile(samples: list[float], pct: float) -> float:
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100.0 * len(ordered)))]
+
+    def report(self) -> dict[str, float]:
+        """
+        Frame-interval and input-to-present statistics, in milliseconds.
+        Jitter is the standard deviation of the frame interval.
+        """
+        ms = 1000.0
+        stats: dict[str, float] = {"target_ms": self.period * ms}
+        if len(self.intervals) >= 2:
+            iv = list(self.intervals)
+            stats.update(
+                interval_mean_ms=statistics.fmean(iv) * ms,
+                interval_p99_ms=self._percentile(iv, 99) * ms,
+                jitter_ms=statistics.pstdev(iv) * ms,
+            )
+        if self.latencies:
+            lat = list(self.latencies)
+            stats.update(
+                latency_p50_ms=self._percentile(lat, 50) * ms,
+                latency_p99_ms=self._percentile(lat, 99) * ms,
+            )
+        return stats
+
+    def log_report(self) -> None:
+        stats = self.report()
+        logging.info(
+            "Frame pacing (%s): %s",
+            self.mode,
+            ", ".join(f"{k}={v:.2f}" for k, v in stats.items())
+        )
+
+
+if __name__ == "__main__":
+    import sys
+    # Real frame pacing on this machine: python pacing.py [mode] [fps] [work_ms] [frames]
+    mode    = sys.argv[1] if len(sys.argv) > 1 else "hybrid"
+    fps     = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    work_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 2.0
+    frames  = int(sys.argv[4]) if len(sys.argv) > 4 else 300
+    pacer = FramePacer(fps, mode=mode, report_every=0)
+    for _ in range(frames):
+        pacer.wait()
+        pacer.mark_input()
+        end = time.perf_counter() + work_ms / 1000.0
+        while time.perf_counter() < end:
+            pass
+        pacer.mark_present()
+        pacer.end_frame()
+    for name, value in pacer.report().items():
+        print(f"{name}: {value:.2f}")
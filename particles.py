@@ -0,0 +1,244 @@
+# particles.py
+
+import math
+import time
+
+import numpy as np
+import pygame
+
+import metrics
+from constants import FPS, COLOR_BG, PARTICLE_CAPACITY, PARTICLE_BUDGET
+from events    import EventBus, PaddleHit, WallBounce, BallCollision, PointScored
+
+particle_seconds = metrics.histogram(
+    "pong_particles_seconds", "Time spent updating and drawing particles, per frame."
+)
+particles_live  = metrics.gauge("pong_particles", "Live particles.")
+particles_limit = metrics.gauge("pong_particles_limit", "Particles allowed within the frame budget.")
+
+# Stamp colour per effect
+TRAIL, SPARK, BURST, FLASH = range(4)
+COLORS: tuple[tuple[int,int,int], ...] = (
+    (200, 200, 200),    # ball trail
+    (255, 220, 80),     # paddle hit
+    (255, 110, 60),     # point scored
+    (120, 200, 255),    # wall bounce, ball collision
+)
+
+class ParticleSystem:
+    """
+    Ball trails and impact sparks from a fixed-capacity pool.
+
+    The pool is a set of NumPy arrays (position, velocity, life left,
+    starting life, colour) with the live particles packed at the front,
+    so a frame's update is a few whole-array operations and expired
+    particles are dropped by one compaction; nothing is allocated per
+    particle. Drawing blits pre-rendered stamps, one per colour and fade
+    step, in a single Surface.blits() call.
+
+    Update and draw are timed every frame. The measured cost per
+    particle sets `limit`, how many fit in `budget` seconds: emitters
+    are thinned out in proportion, and when the pool is over the limit
+    the particles closest to expiring go first.
+    """
+    FADE_STEPS = 8
+
+    def __init__(
+        self,
+        capacity: int = PARTICLE_CAPACITY,
+        budget: float = PARTICLE_BUDGET / FPS,
+        radius: int = 2,
+        drag: float = 0.94,
+        seed: int|None = None
+    ):
+        self.capacity = capacity
+        self.budget   = budget
+        self.radius   = radius
+        self.drag     = drag
+        self.minimum  = min(64, capacity)   # never thinned below this
+        self.limit    = capacity
+        self.n        = 0
+        self.rng      = np.random.default_rng(seed)
+
+        self.pos      = np.zeros((capacity, 2), np.float32)
+        self.vel      = np.zeros((capacity, 2), np.float32)
+        self.life     = np.zeros(capacity, np.float32)   # frames left
+        self.max_life = np.ones(capacity, np.float32)
+        self.color    = np.zeros(capacity, np.intp)
+        # Scratch space, so a frame allocates no arrays
+        self._alive   = np.zeros(capacity, bool)
+        self._fade    = np.zeros(capacity, np.float32)
+        self._stamp_i = np.zeros(capacity, np.intp)
+        self._topleft = np.zeros((capacity, 2), np.int32)
+        self._scaled  = np.zeros((capacity, 2), np.float32)
+        self._spare   = {id(arr): np.empty_like(arr) for arr in self._pool()}
+
+        self.cost         = 0.0     # smoothed seconds per frame
+        self.per_particle = 0.0     # smoothed seconds per live particle
+        self._spent       = 0.0     # this frame so far
+        self._stamps: dict[float, list[pygame.Surface]] = {}    # per draw scale
+
+    def stamps(self, scale: float = 1.0) -> list[pygame.Surface]:
+        """One stamp per colour and fade step, drawn once per scale."""
+        stamps = self._stamps.get(scale)
+        if stamps is None:
+            radius = max(1, round(self.radius * scale))
+            stamps = self._stamps[scale] = [
+                self._stamp(color, (step + 1) / self.FADE_STEPS, radius)
+                for color in COLORS for step in range(self.FADE_STEPS)
+            ]
+        return stamps
+
+    @staticmethod
+    def _stamp(color: tuple[int,int,int], fade: float, radius: int) -> pygame.Surface:
+        """
+        A dot dimmed towards the background by `fade`, colour-keyed
+        (not per-pixel alpha) so it blits without blending.
+        """
+        size = radius * 2
+        image = pygame.Surface((size, size))
+        image.fill(COLOR_BG)
+        image.set_colorkey(COLOR_BG, pygame.RLEACCEL)
+        dimmed = [int(bg + (c - bg) * fade) for c, bg in zip(color, COLOR_BG)]
+        pygame.draw.circle(image, dimmed, (radius, radius), radius)
+        return image
+
+    def _pool(self) -> tuple[np.ndarray, ...]:
+        return (self.pos, self.vel, self.life, self.max_life, self.color)
+
+    def attach(self, bus: EventBus) -> None:
+        bus.subscribe(PaddleHit,     self.on_hit)
+        bus.subscribe(PointScored,   self.on_point)
+        bus.subscribe(WallBounce,    self.on_bounce)
+        bus.subscribe(BallCollision, self.on_bounce)
+
+    # ——— Effects ———
+    def on_hit(self, event: PaddleHit) -> None:
+        # Sparks fly back the way the ball now travels, faster for faster balls
+        heading = 0.0 if event.player == 0 else math.pi
+        self.emit(event.x, event.y, 24, SPARK, (1.0, 1.0 + event.speed), (12, 30), heading, math.pi / 2)
+
+    def on_point(self, event: PointScored) -> None:
+        heading = math.pi if event.player == 0 else 0.0
+        self.emit(event.x, event.y, 80, BURST, (1.0, 7.0), (20, 50), heading, math.pi)
+
+    def on_bounce(self, event: WallBounce|BallCollision) -> None:
+        self.emit(event.x, event.y, 8, FLASH, (0.5, 2.5), (8, 18))
+
+    def trail(self, balls) -> None:
+        """One slow, short-lived particle behind each ball."""
+        for ball in balls:
+            self.emit(*ball.rect.center, 1, TRAIL, (0.0, 0.3), (8, 14))
+
+    def emit(
+        self,
+        x: float, y: float,
+        count: int,
+        color: int,
+        speed: tuple[float,float] = (1.0, 3.0),
+        life: tuple[int,int] = (10, 30),
+        heading: float = 0.0,
+        spread: float = math.pi
+    ) -> int:
+        """
+        Start up to `count` particles at (x, y), moving within `spread`
+        radians either side of `heading` at `speed` (low, high) pixels per
+        frame, for `life` (low, high) frames. Fewer are started while the
+        pool is thinned, and a full pool makes room by dropping the
+        particles closest to expiring; returns how many.
+        """
+        if self.limit < self.capacity:
+            count = math.ceil(count * self.limit / self.capacity)
+        count = min(count, self.limit)
+        if count <= 0:
+            return 0
+        if self.n + count > self.limit:
+            self._cull(self.limit - count)
+        rng, new = self.rng, slice(self.n, self.n + count)
+        angle = heading + rng.uniform(-spread, spread, count)
+        v = rng.uniform(*speed, count)
+        self.pos[new] = (x, y)
+        self.vel[new, 0] = np.cos(angle) * v
+        self.vel[new, 1] = np.sin(angle) * v
+        self.life[new] = self.max_life[new] = rng.integers(life[0], life[1], count, endpoint=True)
+        self.color[new] = color
+        self.n += count
+        return count
+
+    def clear(self) -> None:
+        self.n = 0
+
+    # ——— Per frame ———
+    def update(self) -> None:
+        """Judge the previous frame's cost, then advance every particle one frame."""
+        self._judge()
+        start = time.perf_counter()
+        n = self.n
+        if n:
+            self.pos[:n] += self.vel[:n]
+            self.vel[:n] *= self.drag
+            self.life[:n] -= 1
+            self._keep(np.greater(self.life[:n], 0, out=self._alive[:n]))
+        self._spent += time.perf_counter() - start
+
+    def draw(self, surface: pygame.Surface, scale: float = 1.0) -> None:
+        """
+        Every live particle, as its faded stamp, in one batched blit;
+        positions and stamps at `scale` for a window drawn natively
+        (see display.py).
+        """
+        start = time.perf_counter()
+        n = self.n
+        if n:
+            stamps = self.stamps(scale)
+            fade, stamp, topleft = self._fade[:n], self._stamp_i[:n], self._topleft[:n]
+            np.multiply(self.life[:n], self.FADE_STEPS, out=fade)
+            np.divide(fade, self.max_life[:n], out=fade)
+            np.minimum(fade, self.FADE_STEPS - 1, out=fade)
+            np.multiply(self.color[:n], self.FADE_STEPS, out=stamp)
+            np.add(stamp, fade, out=stamp, casting="unsafe")
+            pos = self.pos[:n]
+            if scale != 1.0:
+                pos = np.multiply(pos, scale, out=self._scaled[:n])
+            np.subtract(pos, stamps[0].get_width() // 2, out=topleft, casting="unsafe")
+            surface.blits(
+                zip(map(stamps.__getitem__, stamp.tolist()), topleft.tolist()), doreturn=False
+            )
+        self._spent += time.perf_counter() - start
+
+    def _keep(self, mask: np.ndarray) -> None:
+        """Pack the particles where `mask` is set to the front of the pool."""
+        kept = int(np.count_nonzero(mask))
+        if kept == self.n:
+            return
+        for arr in self._pool():
+            spare = self._spare[id(arr)][:kept]
+            np.compress(mask, arr[:self.n], axis=0, out=spare)
+            arr[:kept] = spare
+        self.n = kept
+
+    def _cull(self, keep: int) -> None:
+        """Keep only the `keep` particles with the most life left."""
+        if self.n <= keep:
+            return
+        mask = self._alive[:self.n]
+        mask[:] = False
+        if keep:
+            mask[np.argpartition(self.life[:self.n], self.n - keep)[self.n - keep:]] = True
+        self._keep(mask)
+
+    def _judge(self) -> None:
+        spent, self._spent = self._spent, 0.0
+        if not spent:
+            return
+        particle_seconds.observe(spent)
+        self.cost = spent if not self.cost else 0.9 * self.cost + 0.1 * spent
+        # Fixed overheads dominate a handful of particles; learn from busier frames
+        if self.n >= self.minimum:
+            each = spent / self.n
+            self.per_particle = each if not self.per_particle else 0.9 * self.per_particle + 0.1 * each
+        if self.per_particle:
+            self.limit = int(min(self.capacity, max(self.minimum, self.budget / self.per_particle)))
+        self._cull(self.limit)
+        particles_live.set(self.n)
+        particles_limit.set(self.limit)
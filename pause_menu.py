@@ -1,5 +1,5 @@
 import pygame
-from utils import draw_text
+from widgets import Button, Panel
 
 class PauseMenu:
     """
@@ -12,26 +12,33 @@ class PauseMenu:
         self.options = ["Resume", "Settings", "Main Menu", "Quit"]
         self.selected = 0
 
-        # Layout
+        # Layout, once
         w, h = surface.get_size()
-        self.rects = []
-        for i, opt in enumerate(self.options):
-            rect = pygame.Rect(0, 0, 200, 40)
-            rect.center = (w//2, 200 + i*60)
-            self.rects.append((opt.lower().replace(" ", "_"), rect))
-
-    def draw(self) -> None:
-        """Draw transparent overlay and menu options."""
-        overlay = pygame.Surface(self.surface.get_size())
-        overlay.set_alpha(180)
-        overlay.fill((0,0,0))
-        self.surface.blit(overlay, (0,0))
-
-        for idx, (key, rect) in enumerate(self.rects):
-            label = self.options[idx]
-            color = (255,255,0) if idx == self.selected else (255,255,255)
-            pygame.draw.rect(self.surface, color, rect, width=2)
-            draw_text(self.surface, label, rect.center, self.font, color=color)
+        self.panel = Panel()
+        self.buttons = [
+            self.panel.add(Button(
+                opt, font, (w//2, 200 + i*60), size=(200, 40),
+                name=opt.lower().replace(" ", "_")
+            ))
+            for i, opt in enumerate(self.options)
+        ]
+        self.buttons[self.selected].selected = True
+
+        # Built once; skipped entirely when drawn over a pre-dimmed backdrop
+        self.overlay = pygame.Surface((w, h))
+        self.overlay.set_alpha(180)
+        self.overlay.fill((0,0,0))
+
+    def _select(self, idx: int) -> None:
+        self.buttons[self.selected].selected = False
+        self.selected = idx
+        self.buttons[idx].selected = True
+
+    def draw(self, dim: bool = True) -> None:
+        """Draw transparent overlay (unless `dim` is False) and menu options."""
+        if dim:
+            self.surface.blit(self.overlay, (0,0))
+        self.panel.draw(self.surface)
 
     def handle_event(self, event: pygame.event.Event) -> str|None:
         """
@@ -41,16 +48,15 @@ class PauseMenu:
         """
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_DOWN, pygame.K_s):
-                self.selected = (self.selected + 1) % len(self.options)
+                self._select((self.selected + 1) % len(self.options))
             elif event.key in (pygame.K_UP, pygame.K_w):
-                self.selected = (self.selected - 1) % len(self.options)
+                self._select((self.selected - 1) % len(self.options))
             elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                return self.rects[self.selected][0]
+                return self.buttons[self.selected].name
 
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for idx, (_, rect) in enumerate(self.rects):
-                if rect.collidepoint(event.pos):
-                    self.selected = idx
-                    return self.rects[idx][0]
+        button, choice = self.panel.handle_event(event)
+        if choice is not None:
+            self._select(self.buttons.index(button))
+            return choice
 
         return None
@@ -0,0 +1,173 @@
+# pipeline.py
+
+import time
+import threading
+
+import pygame
+
+from game   import Game, RenderState
+from events import EventBus, EventBuffer
+
+class SimulationPipeline:
+    """
+    Overlaps physics with rendering: while frame N is drawn and
+    presented on the main thread, a worker thread runs Game.update for
+    frame N+1. Blitting and flipping release the GIL inside SDL, which
+    is the time the worker gets to run in.
+
+    Hand-off is deterministic. Each step uses the keys sampled when it
+    was started, and finish_step() always returns that step's result
+    before the next one can start, so the match plays out exactly as in
+    the serial loop, one frame later. The two RenderStates are swapped
+    at hand-off: the worker only writes the back one, and `front` is
+    read-only for the renderer until the next finish_step().
+
+    Events raised by the worker are buffered and published on the
+    game's real bus from finish_step(), so subscribers (sound, HUD,
+    journal, telemetry) still run on the main thread, in order.
+    """
+    def __init__(self, game: Game):
+        self.game   = game
+        self._buffers = (game.render_state(), game.render_state())
+        self._back  = 1
+        self.front: RenderState = self._buffers[0]
+
+        self._bus: EventBus = game.bus
+        self._events = EventBuffer()
+        game.bus = self._events
+
+        self.pending = False
+        self.steps   = 0
+        self.wait_time = 0.0    # seconds the main thread spent waiting on physics
+        self._keys   = None
+        self._result: str|None = None
+        self._error: BaseException|None = None
+        self._running = True
+        self._go   = threading.Semaphore(0)
+        self._done = threading.Semaphore(0)
+        self._worker = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._worker.start()
+
+    def start_step(self, keys: pygame.key.ScancodeWrapper) -> None:
+        """Start simulating the next frame with `keys` as its input."""
+        if self.pending:
+            raise RuntimeError("previous step not finished")
+        self._keys = keys
+        self.pending = True
+        self._go.release()
+
+    def finish_step(self) -> str|None:
+        """
+        Wait for the step in flight (if any), make its frame the front
+        state and publish its events. Returns Game.update()'s result.
+        """
+        if not self.pending:
+            return None
+        start = time.perf_counter()
+        self._done.acquire()
+        self.wait_time += time.perf_counter() - start
+        self.pending = False
+        self.steps += 1
+        if self._error is not None:
+            error, self._error = self._error, None
+            self._events.clear()
+            raise error
+        self.front = self._buffers[self._back]
+        self._back = 1 - self._back
+        self._events.flush(self._bus)
+        return self._result
+
+    def stop(self) -> None:
+        """
+        Stop the worker and give the game its bus back. A step still in
+        flight is waited for and dropped, events included: the match is
+        being left, and nothing has observed that frame.
+        """
+        if self.pending:
+            self._done.acquire()
+            self.pending = False
+            self._events.clear()
+        self._running = False
+        self._go.release()
+        self._worker.join()
+        self.game.bus = self._bus
+
+    def _run(self) -> None:
+        while True:
+            self._go.acquire()
+            if not self._running:
+                return
+            try:
+                self._result = self.game.update(self._keys)
+                self.game.capture(self._buffers[self._back])
+            except BaseException as error:
+                self._error = error
+            finally:
+                self._done.release()
+
+
+def benchmark(frames: int = 600, balls: int = 250, present_ms: float = 0.0) -> dict[str, float]:
+    """
+    Serial vs. pipelined loop, unpaced, on the current display: frames
+    per second, and input-to-present latency (from sampling the keys
+    to presenting the frame they moved). `present_ms` adds that much
+    GIL-free waiting to every flip, standing in for a cabinet whose
+    driver takes time to present (the dummy driver's flip is free).
+    """
+    def present() -> None:
+        pygame.display.flip()
+        if present_ms:
+            time.sleep(present_ms / 1000)
+
+    screen = pygame.display.get_surface()
+    settings = {"points_to_win": 10**6, "games_per_match": 1, "balls": balls}
+    keys = pygame.key.get_pressed()
+    results: dict[str, float] = {}
+
+    game = Game(screen, ["A", "B"], settings, bus=EventBus())
+    game.rng.seed(0)
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.update(keys)
+        screen.fill((0, 0, 0))
+        game.draw()
+        present()
+    elapsed = time.perf_counter() - start
+    results["serial_fps"] = frames / elapsed
+    results["serial_latency_ms"] = elapsed / frames * 1000
+
+    game = Game(screen, ["A", "B"], settings, bus=EventBus())
+    game.rng.seed(0)
+    pipeline = SimulationPipeline(game)
+    sampled: list[float] = []
+    latency = 0.0
+    start = time.perf_counter()
+    for _ in range(frames):
+        pipeline.finish_step()
+        sampled.append(time.perf_counter())
+        pipeline.start_step(keys)
+        screen.fill((0, 0, 0))
+        game.draw(pipeline.front)
+        present()
+        if len(sampled) > 1:
+            # The front state came from the keys sampled one frame ago
+            latency += time.perf_counter() - sampled[-2]
+    pipeline.finish_step()
+    elapsed = time.perf_counter() - start
+    pipeline.stop()
+    results["pipelined_fps"] = frames / elapsed
+    results["pipelined_latency_ms"] = latency / (frames - 1) * 1000
+    results["pipelined_wait_ms"] = pipeline.wait_time / pipeline.steps * 1000
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+    from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    balls = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    present_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    for name, value in benchmark(balls=balls, present_ms=present_ms).items():
+        print(f"{name}: {value:.2f}")
+    pygame.quit()
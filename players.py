@@ -0,0 +1,117 @@
+# players.py
+
+import heapq
+from bisect import bisect_left
+from typing import Iterable
+
+class PlayerRegistry:
+    """
+    Interns player names to integer ids.
+
+    Names are matched case-insensitively, so "bryan" resolves to an
+    existing "Bryan" instead of starting a second record. A sorted array
+    of case-folded names is the prefix index: a completion is two binary
+    searches plus a bounded scan to rank candidates by matches played.
+    """
+    def __init__(self, names: Iterable[str] = ()):
+        self.names:  list[str]      = []   # id -> display name (first spelling seen)
+        self.counts: list[int]      = []   # id -> matches played
+        self.ids:    dict[str, int] = {}   # case-folded name -> id
+        self._keys:    list[str] = []      # sorted case-folded names
+        self._key_ids: list[int] = []      # ids parallel to _keys
+        self.extend(names)
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.strip().casefold()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_of(self, name: str) -> int|None:
+        return self.ids.get(self._key(name))
+
+    def name_of(self, pid: int) -> str:
+        return self.names[pid]
+
+    def canonical(self, name: str) -> str:
+        """The registered spelling of `name`, or `name` itself if new."""
+        pid = self.id_of(name)
+        return self.names[pid] if pid is not None else name.strip()
+
+    def same(self, a: str, b: str) -> bool:
+        """True when `a` and `b` name the same player (known or not)."""
+        return self._key(a) == self._key(b)
+
+    def intern(self, name: str) -> int:
+        """Id for `name`, registering it if it is new."""
+        key = self._key(name)
+        pid = self.ids.get(key)
+        if pid is None:
+            pid = self._add(key, name.strip())
+            at = bisect_left(self._keys, key)
+            self._keys.insert(at, key)
+            self._key_ids.insert(at, pid)
+        return pid
+
+    def extend(self, names: Iterable[str]) -> None:
+        """Register many names at once, sorting the index only once."""
+        added = False
+        for name in names:
+            key = self._key(name)
+            if key and key not in self.ids:
+                self._add(key, name.strip())
+                added = True
+        if added:
+            order = sorted(self.ids.items())
+            self._keys    = [k for k, _ in order]
+            self._key_ids = [pid for _, pid in order]
+
+    def _add(self, key: str, name: str) -> int:
+        pid = len(self.names)
+        self.names.append(name)
+        self.counts.append(0)
+        self.ids[key] = pid
+        return pid
+
+    def bump(self, pid: int, matches: int = 1) -> None:
+        """Count matches played, which ranks completions."""
+        self.counts[pid] += matches
+
+    def complete(self, prefix: str, limit: int = 3, scan: int = 2000) -> list[str]:
+        """
+        Up to `limit` registered names starting with `prefix`, most
+        active first. At most `scan` index entries are considered, which
+        bounds the cost for very short prefixes.
+        """
+        key = self._key(prefix)
+        if not key:
+            return []
+        lo = bisect_left(self._keys, key)
+        hi = bisect_left(self._keys, key + "\U0010ffff", lo, min(len(self._keys), lo + scan))
+        counts = self.counts
+        best = heapq.nlargest(limit, self._key_ids[lo:hi], key=counts.__getitem__)
+        return [self.names[pid] for pid in best]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import random
+    import string
+    # Completion cost: python players.py [names] [lookups]
+    n       = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    rng = random.Random(0)
+    reg = PlayerRegistry(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(n)
+    )
+    for pid in range(len(reg)):
+        reg.bump(pid, rng.randrange(100))
+    prefixes = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 3))) for _ in range(lookups)]
+    start = time.perf_counter()
+    for prefix in prefixes:
+        reg.complete(prefix)
+    elapsed = time.perf_counter() - start
+    print(f"names: {len(reg)}")
+    print(f"complete_us: {elapsed / lookups * 1e6:.1f}")
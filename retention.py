@@ -0,0 +1,285 @@
+# retention.py
+
+import os
+import csv
+import json
+import time
+import hashlib
+import logging
+import threading
+from bisect   import bisect_left
+from datetime import datetime, timedelta
+from typing import Callable
+
+import metrics
+from constants import LEADER_DETAIL_DAYS, LEADER_DAILY_DAYS
+from filelock  import locked
+
+# Latest results kept per player from compacted matches: the form view's
+# last 10, and the 10 before them for its trend
+TAIL = 20
+
+compacted_total = metrics.counter(
+    "pong_matches_compacted_total", "Matches folded from the leaderboard CSV into rollups."
+)
+compact_seconds = metrics.histogram(
+    "pong_leaderboard_compact_seconds", "Time one compaction step held the write lock."
+)
+
+def rollup_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + "_rollup.json"
+
+def empty() -> dict:
+    """
+    A rollup holds the compacted matches:
+      pairs    [period, winner, loser, matches, winner_games, loser_games],
+               period being a day ("2025-01-31") or, once old, a month ("2025-01")
+      players  case-folded name -> [name, best streak, streak, latest results "WLW..."]
+      matches  how many matches were compacted
+      skip     {"bytes", "file", "tail"}: the CSV's leading bytes already in
+               the rollup but not yet trimmed, or None
+    """
+    return {"version": 1, "matches": 0, "pairs": [], "players": {}, "skip": None}
+
+def load(path: str) -> dict:
+    if os.path.isfile(path):
+        try:
+            with open(path) as fin:
+                return json.load(fin)
+        except Exception:
+            logging.exception("Could not load %s", path)
+    return empty()
+
+def save(path: str, rollup: dict) -> None:
+    """Replace the rollup atomically, flushed to disk before the CSV is trimmed."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as fout:
+        fout.write(json.dumps(rollup, separators=(",", ":")))
+        fout.flush()
+        os.fsync(fout.fileno())
+    os.replace(tmp, path)
+
+def _fingerprint(fin, end: int) -> str:
+    """Hash of the 256 bytes before `end`, which pins a skip mark to its file."""
+    fin.seek(max(0, end - 256))
+    return hashlib.sha1(fin.read(end - fin.tell())).hexdigest()
+
+def skip(rollup: dict, csv_path: str) -> int:
+    """
+    Where the CSV's unread rows start: past the rows `rollup` already
+    holds if the CSV still has them (a compaction step folded them in but
+    has not trimmed them yet), else 0.
+    """
+    mark = rollup.get("skip")
+    if not mark:
+        return 0
+    try:
+        st = os.stat(csv_path)
+        if [st.st_dev, st.st_ino] != mark["file"] or st.st_size < mark["bytes"]:
+            return 0
+        with open(csv_path, "rb") as fin:
+            if _fingerprint(fin, mark["bytes"]) != mark["tail"]:
+                return 0
+    except OSError:
+        return 0
+    return mark["bytes"]
+
+def rebucket(rollup: dict, daily_from: str) -> bool:
+    """Merge per-day totals from before `daily_from` into per-month ones."""
+    if not any(len(row[0]) == 10 and row[0] < daily_from for row in rollup["pairs"]):
+        return False
+    pairs: dict[tuple, list[int]] = {}
+    for period, w, l, *totals in rollup["pairs"]:
+        if len(period) == 10 and period < daily_from:
+            period = period[:7]
+        into = pairs.setdefault((period, w, l), [0, 0, 0])
+        for i, value in enumerate(totals):
+            into[i] += value
+    rollup["pairs"] = [list(key) + totals for key, totals in sorted(pairs.items())]
+    return True
+
+def fold(rollup: dict, matches: list[tuple[str,str,str,int,int]], daily_from: str) -> None:
+    """
+    Add `matches` (when, winner, loser, winner_games, loser_games),
+    oldest first, to `rollup`: to their pair's totals for the day, or
+    for the month before `daily_from`, and to each player's streaks.
+    """
+    def period(when: str) -> str:
+        return when[:10] if when[:10] >= daily_from else when[:7]
+
+    # Rows are sorted by period and matches arrive in time order, so
+    # only the rows from the earliest period being added can change
+    rows = rollup["pairs"]
+    keep = bisect_left(rows, [min(period(m[0]) for m in matches)])
+    pairs = {tuple(row[:3]): row[3:] for row in rows[keep:]}
+    players = rollup["players"]
+    for when, w, l, wg, lg in matches:
+        totals = pairs.setdefault((period(when), w, l), [0, 0, 0])
+        totals[0] += 1; totals[1] += wg; totals[2] += lg
+        for name, won in ((w, True), (l, False)):
+            # Keyed the way PlayerRegistry matches names
+            state = players.setdefault(name.strip().casefold(), [name.strip(), 0, 0, ""])
+            _, best, streak, tail = state
+            if won:
+                streak = streak + 1 if streak > 0 else 1
+                best = max(best, streak)
+            else:
+                streak = streak - 1 if streak < 0 else -1
+            state[1:] = [best, streak, (tail + ("W" if won else "L"))[-TAIL:]]
+    rows[keep:] = [list(key) + totals for key, totals in sorted(pairs.items())]
+    rollup["matches"] += len(matches)
+    rebucket(rollup, daily_from)
+
+
+class Compactor:
+    """
+    Keeps the leaderboard's storage and load time bounded while its
+    all-time statistics stay exact. Matches older than `detail_days`
+    are folded out of the CSV into the rollup (see empty()), whose size
+    grows with the pairs that meet per day, not with matches played.
+
+    Compaction runs on a background thread, in steps of at most `batch`
+    matches, each under the store's write lock so cabinets keep
+    recording between steps. A step first saves the rollup with a mark
+    of the CSV bytes it now covers, so loaders skip them; once nothing
+    old is left, the CSV is rewritten without them and replaced. A crash
+    between the two is harmless: the mark is tied to the file it names,
+    which the replacement retires. Other boards see the new file and
+    reload (Leaderboard._reload).
+    """
+    def __init__(
+        self,
+        csv_path: str,
+        lock_path: str,
+        detail_days: int = LEADER_DETAIL_DAYS,
+        daily_days: int = LEADER_DAILY_DAYS,
+        batch: int = 2000,
+        delay: float = 60.0,
+        interval: float = 3600.0,
+        now: Callable[[], datetime] = datetime.now
+    ):
+        self.csv_path    = csv_path
+        self.rollup_path = rollup_path(csv_path)
+        self.lock_path   = lock_path
+        self.detail_days = detail_days
+        self.daily_days  = daily_days
+        self.batch       = batch
+        self.delay       = delay        # seconds after start() before the first check
+        self.interval    = interval     # seconds between checks for newly old matches
+        self.now         = now
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread|None = None
+
+    def start(self) -> None:
+        """
+        Compact on a background thread, `delay` seconds from now (clear
+        of startup's disk reads) and every `interval` after that.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="compactor", daemon=True)
+            self._thread.start()
+
+    def request(self) -> None:
+        """Compact now, on the background thread."""
+        self.start()
+        self._wake.set()
+
+    def stop(self) -> None:
+        """End the background thread, after the step under way, and wait for it."""
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        self._stopping = False
+
+    def _run(self) -> None:
+        wait = self.delay
+        while True:
+            self._wake.wait(wait)
+            self._wake.clear()
+            if self._stopping:
+                return
+            wait = self.interval
+            try:
+                while not self._stopping and self.step():
+                    time.sleep(0.01)    # let waiting writers have the lock
+            except Exception:
+                logging.exception("Compacting %s failed", self.csv_path)
+
+    def drain(self) -> int:
+        """Compact everything due now, on this thread. Returns matches compacted."""
+        total = 0
+        while (n := self.step()):
+            total += n
+        return total
+
+    def step(self) -> int:
+        """
+        One locked step: fold up to `batch` old matches into the rollup,
+        or, with none left, trim the folded rows from the CSV. Returns
+        how many matches were folded.
+        """
+        now = self.now()
+        cutoff = (now - timedelta(days=self.detail_days)).strftime("%Y-%m-%d %H:%M")
+        daily_from = (now - timedelta(days=self.daily_days)).strftime("%Y-%m-%d")
+        start = time.perf_counter()
+        with locked(self.lock_path):
+            if not os.path.isfile(self.csv_path):
+                return 0
+            rollup = load(self.rollup_path)
+            offset = skip(rollup, self.csv_path)
+            with open(self.csv_path, "rb") as fin:
+                if offset:
+                    fin.seek(offset)
+                else:
+                    fin.readline()      # header
+                matches, end = self._read_old(fin, cutoff)
+                if matches:
+                    st = os.fstat(fin.fileno())
+                    mark = {"bytes": end, "file": [st.st_dev, st.st_ino], "tail": _fingerprint(fin, end)}
+            if matches:
+                fold(rollup, matches, daily_from)
+                rollup["skip"] = mark
+                save(self.rollup_path, rollup)
+            elif offset:
+                self._trim(offset)
+                rollup["skip"] = None
+                save(self.rollup_path, rollup)
+            elif rebucket(rollup, daily_from):
+                save(self.rollup_path, rollup)
+        compact_seconds.observe(time.perf_counter() - start)
+        if matches:
+            compacted_total.inc(len(matches))
+            logging.info("Compacted %d matches older than %s from %s", len(matches), cutoff, self.csv_path)
+        return len(matches)
+
+    def _read_old(self, fin, cutoff: str) -> tuple[list[tuple[str,str,str,int,int]], int]:
+        """Matches from `fin`'s position played before `cutoff`, and the offset after them."""
+        matches = []
+        end = fin.tell()
+        while len(matches) < self.batch:
+            a, b = fin.readline(), fin.readline()
+            if not b.endswith(b"\n"):
+                break       # end of the file, or a pair still being written
+            a, b = next(csv.reader([a.decode()])), next(csv.reader([b.decode()]))
+            if a[0] >= cutoff:
+                break
+            won, lost = (a, b) if a[2] == "1" else (b, a)
+            matches.append((won[0], won[1], lost[1], int(won[4]), int(won[5])))
+            end = fin.tell()
+        return matches, end
+
+    def _trim(self, offset: int) -> None:
+        """Replace the CSV with its header and the rows from `offset` on."""
+        tmp = f"{self.csv_path}.{os.getpid()}.tmp"
+        with open(self.csv_path, "rb") as fin, open(tmp, "wb") as fout:
+            fout.write(fin.readline())
+            fin.seek(offset)
+            while chunk := fin.read(1 << 20):
+                fout.write(chunk)
+            fout.flush()
+            os.fsync(fout.fileno())
+        os.replace(tmp, self.csv_path)
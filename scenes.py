@@ -0,0 +1,131 @@
+# scenes.py
+
+import logging
+import pygame
+
+from constants import COLOR_BG
+from states    import GameState
+
+class Scene:
+    """
+    One screen of the application.
+    The SceneStack calls the hooks below; subclasses override what they need.
+    Overlay scenes (pause, settings) are drawn on top of a frozen copy
+    of whatever was on screen when they were entered.
+    """
+    state: GameState
+    is_overlay: bool = False
+    dim_alpha:  int  = 180
+
+    def __init__(self):
+        self.stack: "SceneStack|None" = None
+        self.backdrop: pygame.Surface|None = None
+
+    def enter(self) -> None:
+        """Called when the scene becomes part of the stack."""
+
+    def exit(self) -> None:
+        """Called when the scene is removed from the stack."""
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Process one event (only the top scene receives events)."""
+
+    def update(self) -> None:
+        """Advance one frame (only the top scene is updated)."""
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Render the scene onto `surface`."""
+
+    def freeze(self, surface: pygame.Surface) -> None:
+        """
+        Capture `surface` once into a pre-dimmed backdrop, so an overlay
+        costs a single blit per frame instead of redrawing what is below it.
+        """
+        if self.backdrop is None or self.backdrop.get_size() != surface.get_size():
+            self.backdrop = pygame.Surface(surface.get_size()).convert(surface)
+        self.backdrop.blit(surface, (0, 0))
+        shade = pygame.Surface(surface.get_size())
+        shade.set_alpha(self.dim_alpha)
+        shade.fill(COLOR_BG)
+        self.backdrop.blit(shade, (0, 0))
+
+
+class SceneStack:
+    """
+    A stack of scenes: the top one receives events, updates and draws.
+    Scenes are registered once by their GameState and reused, so moving
+    between states never rebuilds screen objects.
+    """
+    def __init__(self, surface: pygame.Surface):
+        self.surface = surface
+        self.scenes: dict[GameState, Scene] = {}
+        self._stack: list[Scene] = []
+
+    def register(self, scene: Scene) -> None:
+        scene.stack = self
+        self.scenes[scene.state] = scene
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
+    def __contains__(self, state: GameState) -> bool:
+        return any(s.state == state for s in self._stack)
+
+    @property
+    def top(self) -> Scene|None:
+        return self._stack[-1] if self._stack else None
+
+    @property
+    def state(self) -> GameState|None:
+        """GameState of the top scene, or None when empty."""
+        return self._stack[-1].state if self._stack else None
+
+    def _enter(self, state: GameState) -> None:
+        logging.info("Scene %s (depth %d)", state.name, len(self._stack) + 1)
+        scene = self.scenes[state]
+        if scene.is_overlay:
+            scene.freeze(self.surface)
+        self._stack.append(scene)
+        scene.enter()
+
+    def push(self, state: GameState) -> None:
+        """Put a scene on top of the current one."""
+        self._enter(state)
+
+    def pop(self) -> None:
+        """Remove the top scene, revealing the one below."""
+        self._stack.pop().exit()
+
+    def replace(self, state: GameState) -> None:
+        """Swap the top scene for another."""
+        if self._stack:
+            self.pop()
+        self._enter(state)
+
+    def reset(self, state: GameState) -> None:
+        """Drop every scene and start over from `state`."""
+        while self._stack:
+            self.pop()
+        self._enter(state)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if self._stack:
+            self._stack[-1].handle_event(event)
+
+    def update(self) -> None:
+        if self._stack:
+            self._stack[-1].update()
+
+    def draw(self) -> None:
+        """
+        Draw the top scene. Overlays start from their frozen backdrop;
+        full screens start from a cleared surface.
+        """
+        if not self._stack:
+            return
+        top = self._stack[-1]
+        if top.is_overlay and top.backdrop is not None:
+            self.surface.blit(top.backdrop, (0, 0))
+        else:
+            self.surface.fill(COLOR_BG)
+        top.draw(self.surface)
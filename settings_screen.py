@@ -1,7 +1,7 @@
 # settings_screen.py
 
 import pygame
-from utils import draw_text
+from widgets import Button, Panel, Stepper
 
 class SettingsScreen:
     """
@@ -9,6 +9,7 @@ class SettingsScreen:
       - Number of matches
       - Games per match
       - Points needed per game
+      - Balls in play (more than one is chaos mode)
     """
 
     def __init__(
@@ -20,21 +21,19 @@ class SettingsScreen:
         self.surface = surface
         self.font    = font
 
-        # Default values or load provided ones
-        self.values = {
-            "num_matches":     3,
-            "games_per_match": 5,
-            "points_to_win":  11
-        }
-        if initial_settings:
-            self.values.update(initial_settings)
+        self.values: dict = {}
 
         # Fields and their display labels
-        self.fields = ["num_matches", "games_per_match", "points_to_win"]
+        self.fields = ["num_matches", "games_per_match", "points_to_win", "balls"]
         self.labels = {
             "num_matches":     "Matches:",
             "games_per_match": "Games/Match:",
-            "points_to_win":   "Points/Game:"
+            "points_to_win":   "Points/Game:",
+            "balls":           "Balls:"
+        }
+        # Fields that jump between preset values instead of counting by one
+        self.steps = {
+            "balls": [1, 2, 5, 10, 25, 50, 100, 250, 500]
         }
 
         # Vertical spacing
@@ -44,56 +43,53 @@ class SettingsScreen:
         # Center the block vertically
         self.start_y = (h // 2) - (total_height // 2)
 
-        # Back button in top-left
-        self.back_rect = pygame.Rect(20, 20, 100, 40)
-
-    def draw(self) -> None:
-        """
-        Render labels, values, and +/- buttons without overlap,
-        by measuring text widths at runtime.
-        """
-        # Dim background
-        overlay = pygame.Surface(self.surface.get_size())
-        overlay.set_alpha(200)
-        overlay.fill((0,0,0))
-        self.surface.blit(overlay, (0,0))
-
-        w, _ = self.surface.get_size()
-
+        # Widgets are laid out here, once; a stepper re-lays itself out
+        # when its value changes
+        self.panel = Panel()
+        self.steppers: dict[str, Stepper] = {}
         for i, field in enumerate(self.fields):
-            y_center = self.start_y + i * self.spacing
-
-            # 1) Draw label
-            label_text = self.labels[field]
-            label_surf = self.font.render(label_text, True, (255,255,255))
-            label_rect = label_surf.get_rect(midleft=(w//2 - 200, y_center))
-            self.surface.blit(label_surf, label_rect)
+            self.steppers[field] = self.panel.add(Stepper(
+                self.labels[field], 1, self.font,
+                (w//2 - 200, self.start_y + i * self.spacing),
+                name=field, presets=self.steps.get(field)
+            ))
 
-            # 2) Draw minus button to the right of label
-            minus_rect = pygame.Rect(0, 0, 30, 30)
-            minus_rect.center = (label_rect.right + 30, y_center)
-            pygame.draw.rect(self.surface, (255,255,255), minus_rect, 2)
-            draw_text(self.surface, "-", minus_rect.center, self.font)
+        # Back button in top-left
+        self.back = self.panel.add(Button("Back", self.font, (70, 40), size=(100, 40), name="BACK"))
+        self.back_rect = self.back.rect
 
-            # 3) Draw current value to the right of minus
-            val_text = str(self.values[field])
-            val_surf = self.font.render(val_text, True, (255,255,255))
-            val_rect = val_surf.get_rect(midleft=(minus_rect.right + 20, y_center))
-            self.surface.blit(val_surf, val_rect)
+        self.load(initial_settings)
 
-            # 4) Draw plus button to the right of value
-            plus_rect = pygame.Rect(0, 0, 30, 30)
-            plus_rect.center = (val_rect.right + 30, y_center)
-            pygame.draw.rect(self.surface, (255,255,255), plus_rect, 2)
-            draw_text(self.surface, "+", plus_rect.center, self.font)
+        # Dimming overlay, built once
+        self.overlay = pygame.Surface((w, h))
+        self.overlay.set_alpha(200)
+        self.overlay.fill((0,0,0))
 
-            # Save button rects for click detection
-            setattr(self, f"{field}_minus_rect", minus_rect)
-            setattr(self, f"{field}_plus_rect", plus_rect)
+    def load(self, initial_settings: dict | None = None) -> None:
+        """
+        Reset to the defaults, then apply `initial_settings` if given.
+        Lets one screen be reused instead of rebuilt for every visit.
+        """
+        self.values = {
+            "num_matches":     3,
+            "games_per_match": 5,
+            "points_to_win":  11,
+            "balls":           1
+        }
+        if initial_settings:
+            self.values.update(initial_settings)
+        for field, stepper in self.steppers.items():
+            stepper.set_value(self.values[field])
 
-        # Draw Back button
-        pygame.draw.rect(self.surface, (255,255,255), self.back_rect, 2)
-        draw_text(self.surface, "Back", self.back_rect.center, self.font)
+    def draw(self, dim: bool = True) -> None:
+        """
+        Blit the labels, values, +/- buttons and Back button, each
+        rendered once per change. The dimming overlay is skipped when
+        `dim` is False.
+        """
+        if dim:
+            self.surface.blit(self.overlay, (0,0))
+        self.panel.draw(self.surface)
 
     def handle_event(self, event: pygame.event.Event) -> dict | str | None:
         """
@@ -104,23 +100,9 @@ class SettingsScreen:
         if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE):
             return self.values
 
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            pos = event.pos
-
-            # Back button?
-            if self.back_rect.collidepoint(pos):
-                return "BACK"
-
-            # Check each field's minus/plus rect
-            for field in self.fields:
-                minus_rect = getattr(self, f"{field}_minus_rect")
-                plus_rect  = getattr(self, f"{field}_plus_rect")
-
-                if minus_rect.collidepoint(pos) and self.values[field] > 1:
-                    self.values[field] -= 1
-                    return None
-                if plus_rect.collidepoint(pos):
-                    self.values[field] += 1
-                    return None
-
+        widget, result = self.panel.handle_event(event)
+        if widget is self.back:
+            return result
+        if result is not None:
+            self.values[widget.name] = result
         return None
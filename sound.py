@@ -0,0 +1,32 @@
+# sound.py
+
+import os
+import pygame
+
+from constants import SOUND_DIR
+from events    import EventBus, PaddleHit, WallBounce, BallCollision, PointScored
+
+class SoundEffects:
+    """
+    Plays the bounce and score sounds in response to gameplay events.
+    At most one bounce sound per frame, however many balls bounced.
+    """
+    def __init__(self):
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        self.snd_bounce = pygame.mixer.Sound(os.path.join(SOUND_DIR, "Bounce.mp3"))
+        self.snd_score  = pygame.mixer.Sound(os.path.join(SOUND_DIR, "Score.wav"))
+        self._last_bounce_frame = -1
+
+    def attach(self, bus: EventBus) -> None:
+        for event_type in (PaddleHit, WallBounce, BallCollision):
+            bus.subscribe(event_type, self.on_bounce)
+        bus.subscribe(PointScored, self.on_point)
+
+    def on_bounce(self, event: PaddleHit|WallBounce|BallCollision) -> None:
+        if event.frame != self._last_bounce_frame:
+            self._last_bounce_frame = event.frame
+            self.snd_bounce.play()
+
+    def on_point(self, event: PointScored) -> None:
+        self.snd_score.play()
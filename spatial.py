@@ -0,0 +1,79 @@
+# spatial.py
+
+from typing import Iterable, Iterator
+
+# Forward half of the 8-neighbourhood: visiting only these from every cell
+# yields each pair of adjacent cells exactly once.
+_HALF_NEIGHBOURS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+class SpatialHash:
+    """
+    Uniform grid broad phase for sprites with a `rect`.
+    Each item is filed under the cell holding its centre; with a cell size
+    of at least one item diameter, any two overlapping items are in the
+    same or adjacent cells, so only those pairs need a narrow-phase test.
+    """
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int,int], list] = {}
+
+    def rebuild(self, items: Iterable) -> None:
+        """Re-file every item under its current cell."""
+        cells = self.cells
+        cells.clear()
+        size = self.cell_size
+        for item in items:
+            cx, cy = item.rect.center
+            key = (cx // size, cy // size)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [item]
+            else:
+                bucket.append(item)
+
+    def candidate_pairs(self) -> Iterator[tuple]:
+        """Yield every pair of items in the same or neighbouring cells once."""
+        cells = self.cells
+        for (cx, cy), bucket in cells.items():
+            n = len(bucket)
+            for i in range(n - 1):
+                a = bucket[i]
+                for j in range(i + 1, n):
+                    yield a, bucket[j]
+            for dx, dy in _HALF_NEIGHBOURS:
+                other = cells.get((cx + dx, cy + dy))
+                if other:
+                    for a in bucket:
+                        for b in other:
+                            yield a, b
+
+
+class RectIndex:
+    """
+    Uniform grid over items with a `rect`, for point queries (hit-testing).
+    Unlike SpatialHash, an item is filed under every cell its rect
+    overlaps, so the cell holding a point lists every item that might
+    contain it.
+    """
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int,int], list] = {}
+
+    def rebuild(self, items: Iterable) -> None:
+        """Re-file every item under the cells its current rect covers."""
+        cells = self.cells
+        cells.clear()
+        size = self.cell_size
+        for item in items:
+            r = item.rect
+            if not r.w or not r.h:
+                continue
+            for cx in range(r.left // size, (r.right - 1) // size + 1):
+                for cy in range(r.top // size, (r.bottom - 1) // size + 1):
+                    cells.setdefault((cx, cy), []).append(item)
+
+    def at(self, pos: tuple[int,int]) -> list:
+        """Items whose rect contains `pos`, in the order they were filed."""
+        x, y = pos
+        bucket = self.cells.get((x // self.cell_size, y // self.cell_size), ())
+        return [item for item in bucket if item.rect.collidepoint(pos)]
@@ -0,0 +1,231 @@
+# spectator.py
+
+import json
+import struct
+import asyncio
+import logging
+import threading
+
+# ——— Wire format ———
+# Every message is a 5-byte header (type, payload length) and a payload.
+#   b"K" keyframe: uint16 meta length, JSON meta (names, field and sprite
+#        sizes), uint16 value count, then that many int16 state values.
+#   b"D" delta:    uint16 change count, then (uint16 index, int16 value) pairs.
+# State values: [paddle1 y, paddle2 y, points1, points2, ball count,
+#                then x, y, speed_x, speed_y for every ball].
+HEADER   = struct.Struct(">cI")
+U16      = struct.Struct(">H")
+CHANGE   = struct.Struct(">Hh")
+KEYFRAME = b"K"
+DELTA    = b"D"
+BALL_FIELDS = 4
+BALLS_AT    = 5
+
+def snapshot(game) -> tuple[int, ...]:
+    """Flatten the parts of a Game that viewers need into int16 values."""
+    left, right = game.paddle_index
+    values = [
+        left.rect.y, right.rect.y,
+        game.points[game.player1], game.points[game.player2],
+        len(game.ball_grp),
+    ]
+    for ball in game.ball_grp:
+        values += (ball.rect.centerx, ball.rect.centery, ball.speed_x, ball.speed_y)
+    return tuple(values)
+
+def describe(game) -> dict:
+    """Static facts a viewer needs to draw the match."""
+    left, right = game.paddle_index
+    ball = next(iter(game.ball_grp))
+    return {
+        "names":  [game.player1, game.player2],
+        "size":   [game.width, game.height],
+        "paddle": [left.rect.width, left.rect.height],
+        "paddle_x": [left.rect.x, right.rect.x],
+        "radius": ball.radius,
+    }
+
+def encode_keyframe(meta: dict, state: tuple[int, ...]) -> bytes:
+    blob = json.dumps(meta).encode()
+    payload = (
+        U16.pack(len(blob)) + blob
+        + U16.pack(len(state)) + struct.pack(f">{len(state)}h", *state)
+    )
+    return HEADER.pack(KEYFRAME, len(payload)) + payload
+
+def encode_delta(prev: tuple[int, ...], state: tuple[int, ...]) -> bytes:
+    changes = [(i, v) for i, (p, v) in enumerate(zip(prev, state)) if p != v]
+    payload = U16.pack(len(changes)) + b"".join(CHANGE.pack(i, v) for i, v in changes)
+    return HEADER.pack(DELTA, len(payload)) + payload
+
+
+class StateDecoder:
+    """
+    Viewer side: feed raw bytes as they arrive; `meta` and `state` hold
+    the latest complete picture once the first keyframe has been seen.
+    """
+    def __init__(self):
+        self.meta:  dict|None = None
+        self.state: list[int] = []
+        self.bytes_in = 0
+        self._pending = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        self.bytes_in += len(data)
+        buf = self._pending
+        buf += data
+        offset = 0
+        while len(buf) - offset >= HEADER.size:
+            kind, length = HEADER.unpack_from(buf, offset)
+            start = offset + HEADER.size
+            if len(buf) - start < length:
+                break
+            self._apply(kind, memoryview(buf)[start:start + length])
+            offset = start + length
+        del buf[:offset]
+
+    def _apply(self, kind: bytes, payload: memoryview) -> None:
+        if kind == KEYFRAME:
+            (meta_len,) = U16.unpack_from(payload, 0)
+            self.meta = json.loads(bytes(payload[2:2 + meta_len]))
+            at = 2 + meta_len
+            (count,) = U16.unpack_from(payload, at)
+            self.state = list(struct.unpack_from(f">{count}h", payload, at + 2))
+        elif kind == DELTA and self.meta is not None:
+            (count,) = U16.unpack_from(payload, 0)
+            state = self.state
+            for n in range(count):
+                i, v = CHANGE.unpack_from(payload, 2 + n * CHANGE.size)
+                state[i] = v
+
+    def balls(self) -> list[tuple[int, int, int, int]]:
+        s = self.state
+        n = s[BALLS_AT - 1] if len(s) >= BALLS_AT else 0
+        return [tuple(s[BALLS_AT + k*BALL_FIELDS : BALLS_AT + (k+1)*BALL_FIELDS]) for k in range(n)]
+
+
+class SpectatorServer:
+    """
+    Streams live Game state to read-only TCP viewers.
+
+    The game thread calls publish(game) once per tick; it only builds an
+    immutable snapshot. An asyncio loop on a background thread turns each
+    snapshot into one keyframe or delta message and writes the same bytes
+    to every viewer, so encoding cost does not grow with the audience.
+    A viewer whose socket backs up is skipped until it drains, then
+    resynchronised with a fresh keyframe.
+    """
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keyframe_every: int = 300,
+        max_buffer: int = 256 * 1024
+    ):
+        self.host = host
+        self.port = port
+        self.keyframe_every = keyframe_every
+        self.max_buffer     = max_buffer
+        self.messages_encoded = 0
+        self.bytes_sent       = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="spectator", daemon=True)
+        self._server: asyncio.AbstractServer|None = None
+        self._viewers: dict[asyncio.StreamWriter, bool] = {}   # writer -> needs keyframe
+        self._meta:  dict|None = None
+        self._state: tuple[int, ...]|None = None
+        self._since_key = 0
+
+    # ——— Game thread ———
+    def start(self) -> None:
+        self._thread.start()
+        self._ready.wait()
+        logging.info("Spectator server listening on %s:%d", self.host, self.port)
+
+    def publish(self, game) -> None:
+        """Queue the current tick of `game` for broadcast."""
+        self._loop.call_soon_threadsafe(self._broadcast, describe(game), snapshot(game))
+
+    @property
+    def viewer_count(self) -> int:
+        return len(self._viewers)
+
+    def stop(self) -> None:
+        if not self._thread.is_alive():
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    # ——— Loop thread ———
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._on_viewer, self.host, self.port)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        for writer in list(self._viewers):
+            writer.close()
+        self._viewers.clear()
+        await self._server.wait_closed()
+
+    async def _on_viewer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._viewers[writer] = True
+        if self._state is not None:
+            self._send_keyframe(writer)
+        try:
+            # Viewers are read-only; wait for them to hang up
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self._viewers.pop(writer, None)
+            writer.close()
+
+    def _send_keyframe(self, writer: asyncio.StreamWriter) -> None:
+        message = encode_keyframe(self._meta, self._state)
+        self.messages_encoded += 1
+        self._write(writer, message)
+        self._viewers[writer] = False
+
+    def _write(self, writer: asyncio.StreamWriter, message: bytes) -> None:
+        writer.write(message)
+        self.bytes_sent += len(message)
+
+    def _broadcast(self, meta: dict, state: tuple[int, ...]) -> None:
+        prev = self._state
+        new_meta = meta != self._meta
+        self._meta, self._state = meta, state
+        self._since_key += 1
+
+        if prev is None or new_meta or len(prev) != len(state) or self._since_key >= self.keyframe_every:
+            message = encode_keyframe(meta, state)
+            self._since_key = 0
+            for writer in self._viewers:
+                self._viewers[writer] = True
+        else:
+            message = encode_delta(prev, state)
+        self.messages_encoded += 1
+
+        is_key = message[:1] == KEYFRAME
+        for writer, needs_key in list(self._viewers.items()):
+            if writer.is_closing():
+                continue
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                # Too slow: skip deltas and resync once the socket drains
+                self._viewers[writer] = True
+                continue
+            if needs_key and not is_key:
+                self._send_keyframe(writer)
+            else:
+                self._write(writer, message)
+                self._viewers[writer] = False
@@ -0,0 +1,85 @@
+# spectator_viewer.py
+
+import sys
+import socket
+import pygame
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH, FONT_HUD_SIZE
+from utils     import get_font, draw_text
+from game      import Paddle, Ball
+from spectator import StateDecoder
+
+class SpectatorView:
+    """
+    Draws a decoded match with the same Paddle/Ball visuals as the game.
+    Sprites are rebuilt only when the match description changes.
+    """
+    def __init__(self, surface: pygame.Surface, font: pygame.font.Font):
+        self.surface = surface
+        self.font    = font
+        self._meta: dict|None = None
+        self.paddles: list[Paddle] = []
+        self.ball_image: pygame.Surface|None = None
+
+    def _build(self, meta: dict) -> None:
+        pw, ph = meta["paddle"]
+        # Where the game put them; paddle_w is configurable (PHYSICS)
+        self.paddles = [Paddle(x, 0, pw, ph, 0, 0, 0) for x in meta["paddle_x"]]
+        self.ball_image = Ball.make_image(meta["radius"])
+        self._meta = meta
+
+    def draw(self, decoder: StateDecoder) -> None:
+        self.surface.fill((0, 0, 0))
+        meta, state = decoder.meta, decoder.state
+        w, _ = self.surface.get_size()
+        if meta is None:
+            draw_text(self.surface, "Waiting for a match…", (w//2, SCREEN_HEIGHT//2), self.font)
+            return
+        if meta is not self._meta:
+            self._build(meta)
+        for paddle, y in zip(self.paddles, state[:2]):
+            paddle.rect.y = y
+        r = meta["radius"]
+        seq = [(p.image, p.rect) for p in self.paddles]
+        seq += [(self.ball_image, (x - r, y - r)) for x, y, _, _ in decoder.balls()]
+        self.surface.blits(seq, doreturn=False)
+        p1, p2 = meta["names"]
+        draw_text(self.surface, f"{p1}  {state[2]}", (w*0.25, 30), self.font)
+        draw_text(self.surface, f"{state[3]}  {p2}", (w*0.75, 30), self.font)
+
+
+def main(host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Connect to a SpectatorServer and mirror its match until closed."""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(f"Pong Spectator — {host}:{port}")
+    clock = pygame.time.Clock()
+
+    sock = socket.create_connection((host, port))
+    sock.setblocking(False)
+    decoder = StateDecoder()
+    view    = SpectatorView(screen, get_font(FONT_HUD_SIZE, FONT_PATH))
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        try:
+            while chunk := sock.recv(65536):
+                decoder.feed(chunk)
+            running = False   # server hung up
+        except BlockingIOError:
+            pass
+        view.draw(decoder)
+        pygame.display.flip()
+        clock.tick(FPS)
+
+    sock.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    host = sys.argv[1] if len(sys.argv) > 1 else "127.0.0.1"
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+    main(host, port)
@@ -15,3 +15,5 @@ class GameState(Enum):
     MATCH_END      = auto()
     TRANSITION     = auto()
     SERIES_END     = auto()
+    TOURNAMENT_SETUP = auto()
+    TABLES         = auto()
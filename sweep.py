@@ -0,0 +1,222 @@
+# sweep.py
+
+import os
+import sys
+import time
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pygame
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PHYSICS
+from events    import EventBus, PointScored
+from game      import Game, GameSprites
+
+# Values tried for each PHYSICS parameter: every combination in a grid
+# sweep, anywhere between the lowest and highest in a random one
+SPACE: dict[str, tuple[int, ...]] = {
+    "paddle_w":     (6, 10, 14),
+    "paddle_h":     (60, 80, 100, 120, 140),
+    "paddle_speed": (3, 4, 5, 6, 8),
+    "ball_speed":   (3, 4, 5, 6, 8),
+    "ball_radius":  (5, 8, 11),
+}
+
+# Measured for each configuration, one column each in the results
+METRICS = (
+    "rally_mean",       # paddle hits per point
+    "rally_p90",
+    "point_seconds",    # mean time from serve to point, at FPS
+    "first_share",      # points won by the game's first_player
+    "serve_share",      # points won by the player served to
+    "stalled",          # points cut off at max_seconds
+)
+
+class Keys(set):
+    """Pressed-key state holding just the keys the bots press."""
+    __getitem__ = set.__contains__
+
+
+class Bot:
+    """
+    Plays one paddle through its keys, like a player would. It follows
+    the ball coming its way, aiming a random offset of up to `error`
+    pixels from the paddle's centre (drawn again for every return), so
+    small or slow paddles miss more; otherwise it drifts back to the
+    middle.
+    """
+    def __init__(self, paddle: pygame.sprite.Sprite, side: int, error: float, rng: np.random.Generator):
+        self.paddle = paddle
+        self.toward = -1 if side == 0 else 1    # ball's x direction when coming
+        self.error  = error
+        self.rng    = rng
+        self.offset = 0.0
+        self.coming = False
+
+    def press(self, keys: Keys, balls, middle: int) -> None:
+        toward, x = self.toward, self.paddle.rect.centerx
+        ball = min(
+            (b for b in balls if b.speed_x * toward > 0),
+            key=lambda b: abs(b.rect.centerx - x), default=None
+        )
+        if ball is None:
+            self.coming = False
+            target = middle
+        else:
+            if not self.coming:
+                self.coming = True
+                self.offset = self.rng.uniform(-self.error, self.error)
+            target = ball.rect.centery + self.offset
+        y, step = self.paddle.rect.centery, self.paddle.speed
+        if y < target - step:
+            keys.add(self.paddle.key_down)
+        elif y > target + step:
+            keys.add(self.paddle.key_up)
+
+
+def measure(
+    params: dict,
+    points: int = 40,
+    points_to_win: int = 5,
+    error: float = 75.0,
+    max_seconds: float = 30.0,
+    seed: int = 0
+) -> tuple[float, ...]:
+    """
+    Play `points` points between two bots with the PHYSICS overrides in
+    `params`, in games to `points_to_win` that alternate first_player,
+    and return the METRICS in order.
+    """
+    settings = {**params, "points_to_win": points_to_win}
+    field    = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    sprites  = GameSprites(physics=params)
+    rng      = np.random.default_rng(seed)
+    max_frames = int(max_seconds * FPS)
+    middle   = SCREEN_HEIGHT // 2
+
+    rallies, frames = [], []
+    first = served_to = stalled = 0
+    scored: list[PointScored] = []
+    keys = Keys()
+    game_no = 0
+    while len(rallies) < points:
+        first_player = game_no % 2
+        game_no += 1
+        bus = EventBus()
+        bus.subscribe(PointScored, scored.append)
+        game = Game(field, ["L", "R"], settings, first_player=first_player, bus=bus, sprites=sprites)
+        (ball,) = game.ball_grp
+        bots = [Bot(paddle, side, error, rng) for paddle, side in game.paddle_index.items()]
+        winner = None
+        while winner is None and len(rallies) < points:
+            serve, toward = game.frame, int(ball.speed_x > 0)
+            while not scored and game.frame - serve < max_frames:
+                keys.clear()
+                for bot in bots:
+                    bot.press(keys, game.ball_grp, middle)
+                winner = game.update(keys)
+            if not scored:
+                # Neither side can miss: call it and serve again
+                stalled += 1
+                rallies.append(game.rally)
+                frames.append(max_frames)
+                game.rally = 0
+                game.reset_ball(to_right=not toward)
+                continue
+            point = scored.pop()
+            rallies.append(point.rally)
+            frames.append(point.frame - serve)
+            first     += point.player == first_player
+            served_to += point.player == toward
+
+    rallies = np.asarray(rallies, np.float64)
+    decided = max(1, len(rallies) - stalled)
+    return (
+        rallies.mean(),
+        np.percentile(rallies, 90),
+        np.mean(frames) / FPS,
+        first / decided,
+        served_to / decided,
+        stalled / len(rallies),
+    )
+
+
+def grid(space: dict[str, tuple[int, ...]] = SPACE) -> list[dict[str,int]]:
+    """Every combination of the values in `space`."""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+
+def sample(n: int, space: dict[str, tuple[int, ...]] = SPACE, seed: int|None = None) -> list[dict[str,int]]:
+    """`n` configurations drawn uniformly within the range of each parameter in `space`."""
+    rng = np.random.default_rng(seed)
+    columns = {
+        name: rng.integers(min(values), max(values), n, endpoint=True).tolist()
+        for name, values in space.items()
+    }
+    return [{name: columns[name][i] for name in space} for i in range(n)]
+
+
+def _measure(job: tuple[dict, dict]) -> tuple[float, ...]:
+    params, options = job
+    return measure(params, **options)
+
+
+def _init_worker() -> None:
+    pygame.font.init()      # GameSprites makes the score font
+
+
+def run(
+    configs: list[dict[str,int]],
+    workers: int|None = None,
+    seed: int = 0,
+    **options
+) -> dict[str, np.ndarray]:
+    """
+    measure() every configuration on a pool of `workers` processes (one
+    per CPU by default). Returns columns: one per PHYSICS parameter,
+    then one per METRICS entry, row i for configs[i]. `options` go to
+    measure(); each configuration gets its own seed, so a sweep is
+    reproducible whatever the number of workers.
+    """
+    configs = [{**PHYSICS, **params} for params in configs]
+    jobs = [(params, {**options, "seed": seed + i}) for i, params in enumerate(configs)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker()
+        rows = list(map(_measure, jobs))
+    else:
+        chunk = max(1, len(jobs) // (workers * 8))
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+            rows = list(pool.map(_measure, jobs, chunksize=chunk))
+    results = {name: np.array([c[name] for c in configs], np.int32) for name in PHYSICS}
+    measured = np.array(rows, np.float64).reshape(len(rows), len(METRICS))
+    results.update(zip(METRICS, measured.T))
+    return results
+
+
+def save(path: str, results: dict[str, np.ndarray]) -> None:
+    """Write the result columns to one compressed .npz (np.load(path) reads them back)."""
+    np.savez_compressed(path, **results)
+
+
+if __name__ == "__main__":
+    # python sweep.py [grid|random] [configs (random)] [points per config] [out.npz]
+    kind   = sys.argv[1] if len(sys.argv) > 1 else "grid"
+    n      = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    points = int(sys.argv[3]) if len(sys.argv) > 3 else 40
+    out    = sys.argv[4] if len(sys.argv) > 4 else "sweep_results.npz"
+    configs = grid() if kind == "grid" else sample(n, seed=0)
+    start = time.perf_counter()
+    results = run(configs, points=points)
+    elapsed = time.perf_counter() - start
+    save(out, results)
+    print(f"configs: {len(configs)}")
+    print(f"elapsed_s: {elapsed:.1f}")
+    print(f"configs_per_s: {len(configs) / elapsed:.1f}")
+    print(f"written: {out}")
+    longest = np.argsort(results["rally_mean"])[::-1][:5]
+    for i in longest:
+        params = " ".join(f"{name}={results[name][i]}" for name in PHYSICS)
+        print(f"{params}  rally={results['rally_mean'][i]:.1f}  point_s={results['point_seconds'][i]:.1f}")
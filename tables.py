@@ -0,0 +1,197 @@
+# tables.py
+
+import math
+import time
+
+import pygame
+
+from constants import COLOR_INACTIVE, FONT_PATH, SCREEN_HEIGHT
+from utils     import get_font, draw_text
+from events    import EventBus
+from game      import Game, GameSprites, Controls, physics
+
+MAX_TABLES = 9
+
+# (up, down) keys for each table's left and right paddle. Table 1 keeps
+# the single-game keys; the others pair a key with the one below it, the
+# way arcade encoders are usually wired.
+TABLE_CONTROLS: tuple[Controls, ...] = (
+    ((pygame.K_w, pygame.K_s),     (pygame.K_UP, pygame.K_DOWN)),
+    ((pygame.K_1, pygame.K_q),     (pygame.K_3, pygame.K_e)),
+    ((pygame.K_4, pygame.K_r),     (pygame.K_5, pygame.K_t)),
+    ((pygame.K_6, pygame.K_y),     (pygame.K_7, pygame.K_u)),
+    ((pygame.K_8, pygame.K_i),     (pygame.K_9, pygame.K_o)),
+    ((pygame.K_a, pygame.K_z),     (pygame.K_d, pygame.K_c)),
+    ((pygame.K_f, pygame.K_v),     (pygame.K_g, pygame.K_b)),
+    ((pygame.K_h, pygame.K_n),     (pygame.K_j, pygame.K_m)),
+    ((pygame.K_k, pygame.K_COMMA), (pygame.K_l, pygame.K_PERIOD)),
+)
+
+def layout(area: pygame.Rect, n: int, gap: int = 4) -> list[pygame.Rect]:
+    """`n` equal viewports in a near-square grid filling `area`, `gap` pixels apart."""
+    cols = math.ceil(math.sqrt(n))
+    rows = math.ceil(n / cols)
+    w = (area.width  - gap * (cols - 1)) // cols
+    h = (area.height - gap * (rows - 1)) // rows
+    return [
+        pygame.Rect(area.x + c * (w + gap), area.y + r * (h + gap), w, h)
+        for r in range(rows) for c in range(cols)
+    ][:n]
+
+
+class Table:
+    """One match in progress (or an empty seat) and its viewport."""
+    def __init__(self, index: int, viewport: pygame.Rect, surface: pygame.Surface, controls: Controls):
+        self.index    = index
+        self.viewport = viewport
+        self.surface  = surface     # subsurface of the screen at `viewport`
+        self.controls = controls
+        self.game: Game|None = None
+        self.names: list[str] = []
+        self.games_won: dict[str,int] = {}
+
+    @property
+    def free(self) -> bool:
+        return self.game is None
+
+
+class MultiTable:
+    """
+    Several independent matches on one screen, each Game drawing into
+    its own subsurface viewport, so a Game still sees a whole surface
+    of its own.
+
+    Every table shares one GameSprites, sized to the viewports, and one
+    header font: paddles, balls and score digits exist once however many
+    tables there are, and render_text's cache serves all of them. Each
+    table's paddles answer to its own keys (TABLE_CONTROLS) in the one
+    pressed-key state read per frame.
+    """
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        tables: int,
+        settings: dict,
+        bus: EventBus,
+        controls: tuple[Controls, ...] = TABLE_CONTROLS
+    ):
+        if not 1 <= tables <= min(MAX_TABLES, len(controls)):
+            raise ValueError(f"between 1 and {min(MAX_TABLES, len(controls))} tables")
+        self.screen   = screen
+        self.settings = settings
+        self.bus      = bus
+        viewports = layout(screen.get_rect(), tables)
+        self.sprites = GameSprites(
+            scale=min(1.0, viewports[0].height / SCREEN_HEIGHT), physics=physics(settings)
+        )
+        self.font    = get_font(max(12, round(26 * self.sprites.scale)), FONT_PATH)
+        self.tables = [
+            Table(i, rect, screen.subsurface(rect), controls[i])
+            for i, rect in enumerate(viewports)
+        ]
+
+    @property
+    def playing(self) -> int:
+        return sum(not table.free for table in self.tables)
+
+    def seat(self, names: list[str], first_player: int = 0) -> Table|None:
+        """Start a match between `names` at the first free table; None if all are taken."""
+        table = next((t for t in self.tables if t.free), None)
+        if table is None:
+            return None
+        table.names     = list(names)
+        table.games_won = {name: 0 for name in names}
+        table.game = Game(
+            table.surface, table.names, self.settings,
+            first_player=first_player, bus=self.bus,
+            sprites=self.sprites, controls=table.controls
+        )
+        return table
+
+    def update(self, keys: pygame.key.ScancodeWrapper|None = None) -> list[tuple[str,str,int,int]]:
+        """
+        Advance every match one frame. Returns the matches that ended,
+        as (winner, loser, winner's games, loser's games); their tables
+        are free again.
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        threshold = self.settings["games_per_match"] // 2 + 1
+        finished = []
+        for table in self.tables:
+            game = table.game
+            if game is None:
+                continue
+            winner = game.update(keys)
+            if not winner:
+                continue
+            table.games_won[winner] += 1
+            if table.games_won[winner] < threshold:
+                game.prepare_next_round()
+                continue
+            loser = next(n for n in table.names if n != winner)
+            finished.append((winner, loser, table.games_won[winner], table.games_won[loser]))
+            table.game = None
+        return finished
+
+    def set_settings(self, settings: dict) -> None:
+        """Play on with `settings`, including the matches under way."""
+        self.settings = settings
+        for table in self.tables:
+            if table.game is not None:
+                table.game.settings = settings
+
+    def set_sprite_alpha(self, enabled: bool) -> None:
+        for table in self.tables:
+            if table.game is not None:
+                table.game.set_sprite_alpha(enabled)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Every table in its viewport, under a one-line header, with a frame around it."""
+        font = self.font
+        header_y = font.get_height() // 2 + 2
+        for table in self.tables:
+            pygame.draw.rect(surface, COLOR_INACTIVE, table.viewport, 1)
+            cx = table.viewport.width // 2
+            if table.game is None:
+                draw_text(
+                    table.surface, f"Table {table.index + 1}",
+                    table.surface.get_rect().center, font, COLOR_INACTIVE
+                )
+                continue
+            table.game.draw()
+            p1, p2 = table.names
+            draw_text(
+                table.surface,
+                f"{p1} {table.games_won[p1]} — {table.games_won[p2]} {p2}",
+                (cx, header_y), font
+            )
+
+
+if __name__ == "__main__":
+    import sys
+    from constants import SCREEN_WIDTH, FPS
+    # Frame cost of N tables, unpaced: python tables.py [tables] [frames]
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else MAX_TABLES
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    tables = MultiTable(screen, n, {"points_to_win": 10**6, "games_per_match": 1}, EventBus())
+    for i in range(n):
+        tables.seat([f"A{i}", f"B{i}"])
+    keys = pygame.key.get_pressed()
+    worst = total = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        tables.update(keys)
+        screen.fill((0, 0, 0))
+        tables.draw(screen)
+        pygame.display.flip()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+    print(f"tables: {n}")
+    print(f"mean_frame_ms: {total / frames * 1000:.2f}")
+    print(f"worst_frame_ms: {worst * 1000:.2f}")
+    print(f"budget_ms: {1000 / FPS:.2f}")
+    pygame.quit()
@@ -0,0 +1,144 @@
+# telemetry.py
+
+import os
+import sys
+import time
+import queue
+import logging
+import threading
+from array import array
+
+from constants import TELEMETRY_FILE
+from events    import (
+    EventBus, PaddleHit, WallBounce, BallCollision, PointScored, GameWon, MatchWon
+)
+
+# Record kinds (stored as the third field of every record)
+PADDLE_HIT, WALL_BOUNCE, BALL_COLLISION, POINT, GAME_WON, MATCH_WON = range(1, 7)
+
+# Every record is FIELDS float64 values: time, frame, kind, a, b, c
+#   PADDLE_HIT:     a=player, b=offset on paddle (-1..1), c=ball speed
+#   WALL_BOUNCE / BALL_COLLISION: a=x, b=y
+#   POINT:          a=scorer, c=rally length
+#   GAME_WON:       a=winner
+#   MATCH_WON:      a=winner, b=winner games, c=loser games
+FIELDS = 6
+
+class TelemetrySink:
+    """
+    Writes gameplay events into a preallocated ring of float64 buffers.
+    Recording an event is a handful of array stores; full buffers are
+    handed to a background thread that appends them to `path`, so the
+    frame loop never does file I/O. If the writer falls behind and every
+    buffer is in flight, events are dropped and counted instead of waiting.
+    """
+    def __init__(self, path: str = TELEMETRY_FILE, capacity: int = 4096, buffers: int = 3):
+        self.path     = path
+        self.capacity = capacity
+        self.dropped  = 0
+        self._free: queue.SimpleQueue = queue.SimpleQueue()
+        self._full: queue.SimpleQueue = queue.SimpleQueue()
+        for _ in range(buffers):
+            self._free.put(array('d', bytes(8 * FIELDS * capacity)))
+        self._buf: array|None = self._free.get()
+        self._n = 0
+        self._writer = threading.Thread(target=self._write_loop, name="telemetry", daemon=True)
+        self._writer.start()
+
+    def attach(self, bus: EventBus) -> None:
+        bus.subscribe(PaddleHit,     lambda e: self.record(PADDLE_HIT, e.frame, e.player, e.offset, e.speed))
+        bus.subscribe(WallBounce,    lambda e: self.record(WALL_BOUNCE, e.frame, e.x, e.y))
+        bus.subscribe(BallCollision, lambda e: self.record(BALL_COLLISION, e.frame, e.x, e.y))
+        bus.subscribe(PointScored,   lambda e: self.record(POINT, e.frame, e.player, 0, e.rally))
+        bus.subscribe(GameWon,       lambda e: self.record(GAME_WON, e.frame, e.player))
+        bus.subscribe(MatchWon,      lambda e: self.record(MATCH_WON, e.frame, e.player, *e.games))
+        # Match boundaries are a natural, infrequent moment to hand off
+        bus.subscribe(MatchWon,      lambda e: self.flush())
+
+    def record(self, kind: int, frame: int, a: float = 0.0, b: float = 0.0, c: float = 0.0) -> None:
+        buf = self._buf
+        if buf is None:
+            try:
+                buf = self._buf = self._free.get_nowait()
+            except queue.Empty:
+                self.dropped += 1
+                return
+        i = self._n * FIELDS
+        buf[i]   = time.time()
+        buf[i+1] = frame
+        buf[i+2] = kind
+        buf[i+3] = a
+        buf[i+4] = b
+        buf[i+5] = c
+        self._n += 1
+        if self._n == self.capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the current (possibly partial) buffer to the writer."""
+        if self._buf is None or not self._n:
+            return
+        self._full.put((self._buf, self._n))
+        self._n = 0
+        try:
+            self._buf = self._free.get_nowait()
+        except queue.Empty:
+            self._buf = None
+
+    def close(self) -> None:
+        """Flush what is buffered and wait for the writer to finish."""
+        self.flush()
+        self._full.put(None)
+        self._writer.join()
+        if self.dropped:
+            logging.warning("Telemetry dropped %d events", self.dropped)
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._full.get()
+            if item is None:
+                return
+            buf, n = item
+            try:
+                with open(self.path, "ab") as f:
+                    f.write(memoryview(buf)[:n * FIELDS])
+            except OSError:
+                logging.exception("Could not write telemetry to %s", self.path)
+            self._free.put(buf)
+
+
+def read_records(path: str = TELEMETRY_FILE) -> list[tuple[float, ...]]:
+    """Load every record from a telemetry file as FIELDS-tuples."""
+    data = array('d')
+    if os.path.isfile(path):
+        with open(path, "rb") as f:
+            raw = f.read()
+        data.frombytes(raw[:len(raw) - len(raw) % (8 * FIELDS)])
+    return [tuple(data[i:i+FIELDS]) for i in range(0, len(data), FIELDS)]
+
+
+def summarize(records: list[tuple[float, ...]], bins: int = 5) -> dict:
+    """
+    Rally-length and hit-location statistics from telemetry records.
+    Hit locations are histogrammed over `bins` equal bands of the paddle,
+    top to bottom, per player.
+    """
+    rallies = [r[5] for r in records if r[2] == POINT]
+    hits = [[0] * bins, [0] * bins]
+    for r in records:
+        if r[2] == PADDLE_HIT:
+            band = min(bins - 1, max(0, int((r[4] + 1) / 2 * bins)))
+            hits[int(r[3])][band] += 1
+    return {
+        "points":       len(rallies),
+        "rally_mean":   sum(rallies) / len(rallies) if rallies else 0.0,
+        "rally_max":    max(rallies, default=0),
+        "paddle_hits":  sum(map(sum, hits)),
+        "hit_location": {"left": hits[0], "right": hits[1]},
+    }
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else TELEMETRY_FILE
+    for key, value in summarize(read_records(path)).items():
+        print(f"{key}: {value}")
@@ -0,0 +1,92 @@
+# tests/test_allocations.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from constants   import SCREEN_WIDTH, SCREEN_HEIGHT
+from states      import GameState
+from allocations import AllocationTracker
+
+# Per-frame budgets once caches are warm: bytes allocated at the peak of
+# a frame, and bytes still held when it ends. PLAYING reads the keyboard
+# state every frame (an ~8 KB tuple); menus only blit cached text.
+PEAK_BUDGET = {
+    "PLAYING":     12 * 1024,
+    "MENU":        512,
+    "SETTINGS":    512,
+    "LEADERBOARD": 1024,
+    "PAUSED":      512,
+}
+NET_BUDGET = 64
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    from main import Session
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    session = Session(screen, {})
+    # No channels, so no sound ends on the audio thread while tracing (see AllocationTracker)
+    pygame.mixer.set_num_channels(0)
+    yield session
+    pygame.mixer.set_num_channels(8)
+
+def measure(stack, frames=120, warmup=10):
+    for _ in range(warmup):
+        stack.update(); stack.draw()
+    with AllocationTracker(site_every=0) as tracker:
+        for _ in range(frames):
+            tracker.begin_frame(stack.state.name)
+            stack.update(); stack.draw()
+            tracker.end_frame()
+    return tracker.report()[stack.state.name]
+
+def check(report, state):
+    assert report["peak_bytes_per_frame"] < PEAK_BUDGET[state], report
+    assert report["net_bytes_per_frame"] < NET_BUDGET, report
+    assert report["gc_per_1000_frames"] < 10, report
+
+@pytest.mark.parametrize("state", [GameState.SETTINGS, GameState.LEADERBOARD])
+def test_menu_allocation_budget(session, state):
+    from main import build_scenes
+    stack = build_scenes(session)
+    stack.reset(GameState.MENU)
+    check(measure(stack), "MENU")
+    stack.push(state)
+    check(measure(stack), state.name)
+
+def test_playing_allocation_budget(session):
+    from main import build_scenes
+    stack = build_scenes(session)
+    session.player_names[:] = ["Ann", "Bob"]
+    session.tournament_settings = dict(session.settings_view.values)
+    stack.reset(GameState.CHOOSE_SERVER)
+    session.serve_box.active = True
+    for key, char in ((pygame.K_1, "1"), (pygame.K_RETURN, "\r")):
+        stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char))
+    assert stack.state == GameState.PLAYING
+    check(measure(stack, frames=300), "PLAYING")
+    stack.push(GameState.PAUSED)
+    check(measure(stack), "PAUSED")
+
+def test_sites_are_attributed():
+    keep = []
+    with AllocationTracker(site_every=1) as tracker:
+        for _ in range(3):
+            tracker.begin_frame("TEST")
+            keep.append(bytearray(10000))
+            tracker.end_frame()
+    report = tracker.report()["TEST"]
+    site, size, blocks = report["sites"][0]
+    assert "test_allocations.py" in site and size >= 10000
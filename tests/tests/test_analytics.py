@@ -0,0 +1,138 @@
+# tests/test_analytics.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import csv
+import random
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from analytics import MatchAnalytics
+from players   import PlayerRegistry
+from utils     import get_font
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+def random_history(n, players=12, seed=3):
+    rng = random.Random(seed)
+    names = [f"P{i}" for i in range(players)]
+    matches = []
+    for i in range(n):
+        w, l = rng.sample(names, 2)
+        lg = rng.randint(0, 2)
+        matches.append((f"2025-01-01 {i % 24:02d}:{i % 60:02d}", w, l, 3, lg))
+    return matches
+
+def write_csv(path, matches):
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["when","player","matches_won","matches_lost","games_won","games_lost"])
+        for when, w, l, wg, lg in matches:
+            out.writerow([when, w, 1, 0, wg, lg])
+            out.writerow([when, l, 0, 1, lg, wg])
+
+def naive(matches):
+    """The same statistics by looping over the match list."""
+    h2h, streak, best, margin, played = {}, {}, {}, {}, {}
+    for _, w, l, wg, lg in matches:
+        h2h[w, l] = h2h.get((w, l), 0) + 1
+        streak[w] = streak.get(w, 0) + 1 if streak.get(w, 0) > 0 else 1
+        streak[l] = streak.get(l, 0) - 1 if streak.get(l, 0) < 0 else -1
+        best[w] = max(best.get(w, 0), streak[w])
+        margin[w] = margin.get(w, 0) + wg - lg
+        margin[l] = margin.get(l, 0) - (wg - lg)
+        played[w] = played.get(w, 0) + 1
+        played[l] = played.get(l, 0) + 1
+    return h2h, streak, best, margin, played
+
+def check_against_naive(a, matches):
+    h2h, streak, best, margin, played = naive(matches)
+    ids = {name: a.players.id_of(name) for name in played}
+    for name, pid in ids.items():
+        assert a.played[pid] == played[name]
+        assert a.streak[pid] == streak[name]
+        assert a.best_streak[pid] == best.get(name, 0)
+        assert a.margin[pid] == margin[name]
+    names = sorted(ids)
+    matrix = a.head_to_head([ids[n] for n in names])
+    for i, x in enumerate(names):
+        for j, y in enumerate(names):
+            assert matrix[i, j] == h2h.get((x, y), 0)
+
+def test_vectorized_load_matches_naive(tmp_path):
+    matches = random_history(500)
+    write_csv(tmp_path / "h.csv", matches)
+    a = MatchAnalytics(PlayerRegistry())
+    a.load_csv(str(tmp_path / "h.csv"))
+    assert a.n == 500
+    check_against_naive(a, matches)
+
+def test_incremental_add_matches_reload(tmp_path):
+    matches = random_history(300)
+    a = MatchAnalytics(PlayerRegistry())
+    write_csv(tmp_path / "h.csv", matches[:200])
+    a.load_csv(str(tmp_path / "h.csv"))
+    a.form(a.players.id_of("P1"))           # cached, must be invalidated
+    for m in matches[200:] + [("2025-01-02 00:00", "Newcomer", "P1", 3, 0)]:
+        a.add(*m)
+    check_against_naive(a, matches + [("", "Newcomer", "P1", 3, 0)])
+    pid = a.players.id_of("P1")
+    res = a.results(pid)
+    assert a.form(pid)[-1] == pytest.approx(res[-10:].mean())
+
+def test_torn_and_blank_rows_are_skipped(tmp_path):
+    matches = random_history(20)
+    path = tmp_path / "h.csv"
+    write_csv(path, matches[:10])
+    with open(path, "a", newline="") as f:
+        f.write("\r\n")
+    with open(path, "a", newline="") as f:
+        csv.writer(f).writerows(
+            row for when, w, l, wg, lg in matches[10:]
+            for row in ([when, w, 1, 0, wg, lg], [when, l, 0, 1, lg, wg])
+        )
+        f.write("2025-01-03 00:00,P1,1,")
+    a = MatchAnalytics(PlayerRegistry())
+    a.load_csv(str(path))
+    assert a.n == 20
+    check_against_naive(a, matches)
+
+def test_add_updates_in_place(tmp_path, monkeypatch):
+    # Load and add() times are measured by `python analytics.py`; here,
+    # that add() never falls back to recomputing from the columns
+    matches = random_history(2000, players=40)
+    write_csv(tmp_path / "big.csv", matches)
+    a = MatchAnalytics(PlayerRegistry())
+    a.load_csv(str(tmp_path / "big.csv"))
+    def recompute():
+        raise AssertionError("add() recomputed the aggregates")
+    monkeypatch.setattr(a, "_recompute", recompute)
+    extra = [("2025-01-02 00:00", "P1", "P2", 3, 1), ("2025-01-02 00:01", "Newcomer", "P1", 3, 0)]
+    for m in extra:
+        a.add(*m)
+    assert a.n == 2002
+    check_against_naive(a, matches + extra)
+
+def test_leaderboard_views(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    screen = pygame.display.set_mode((800, 600))
+    lb = lb_module.Leaderboard(screen, get_font(20))
+    lb.record(["Ann", "Bob"], (3, 1))
+    lb.record(["Ann", "Bob"], (3, 2))
+    for view in range(len(lb.views)):
+        lb.view = view
+        lb.draw()
+    xs, headings, rows = lb._table(2)
+    assert rows[0][:5] == ["Ann", "2", "100%", "2", "W2"]
+    lb.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT))
+    assert lb.view == 0
+    # a new result rebuilds the cached tables
+    lb.record(["Ann", "Bob"], (0, 3))
+    assert lb._table(2)[2][0][4] == "L1"
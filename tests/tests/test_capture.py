@@ -0,0 +1,49 @@
+# tests/test_capture.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import json
+import time
+import threading
+import pygame
+import pytest
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from capture   import FrameRecorder
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+def test_raw_capture_writes_every_frame(tmp_path):
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rec = FrameRecorder(screen, out_dir=str(tmp_path), fmt="raw", pool=4)
+    frames = 0
+    for i in range(20):
+        screen.fill((i, 0, 0))
+        rec.capture(screen)
+        frames += 1
+        time.sleep(0.002)
+    rec.close()
+    assert rec.written + rec.dropped == frames
+    meta = json.load(open(tmp_path / "clip.json"))
+    size = os.path.getsize(tmp_path / "frames.raw")
+    assert size == rec.written * meta["pitch"] * SCREEN_HEIGHT
+
+def test_slow_encoder_drops_instead_of_blocking(tmp_path, monkeypatch):
+    # Capture cost per frame is measured by `python capture.py`; here, the
+    # encoder is held up entirely and capture() must still never wait
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    gate = threading.Event()
+    save = pygame.image.save
+    monkeypatch.setattr(pygame.image, "save", lambda *a: gate.wait(5) and save(*a))
+    rec = FrameRecorder(screen, out_dir=str(tmp_path), fmt="png", pool=2)
+    queued = [rec.capture(screen) for _ in range(30)]
+    assert queued[:2] == [True, True] and not any(queued[2:])
+    assert rec.dropped == 28
+    gate.set()
+    rec.close()
+    assert len(list(tmp_path.glob("frame_*.png"))) == rec.written == 2
@@ -0,0 +1,61 @@
+# tests/test_chaos.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+import pygame
+import pytest
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game      import Game
+from spatial   import SpatialHash
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+class Dot:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 16, 16)
+        self.rect.center = (x, y)
+
+def test_spatial_hash_finds_all_close_pairs():
+    rng  = random.Random(1)
+    dots = [Dot(rng.randrange(800), rng.randrange(600)) for _ in range(300)]
+    grid = SpatialHash(cell_size=16)
+    grid.rebuild(dots)
+    found = {frozenset(map(id, p)) for p in grid.candidate_pairs()}
+    for i, a in enumerate(dots):
+        for b in dots[i+1:]:
+            dx = a.rect.centerx - b.rect.centerx
+            dy = a.rect.centery - b.rect.centery
+            if dx*dx + dy*dy < 16*16:
+                assert frozenset((id(a), id(b))) in found
+
+class CountingSurface(pygame.Surface):
+    def __init__(self, size):
+        super().__init__(size)
+        self.blits_calls = 0
+    def blits(self, *args, **kwargs):
+        self.blits_calls += 1
+        return super().blits(*args, **kwargs)
+
+def test_chaos_mode_scales_with_balls():
+    # Frame cost is measured by `python game.py [balls]`; here, that the
+    # broad phase prunes most pairs and all sprites go out in one blits call
+    screen = CountingSurface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    settings = {"points_to_win": 10**9, "games_per_match": 1, "balls": 500}
+    g = Game(screen, ["A","B"], settings, first_player=0)
+    n = len(g.ball_grp)
+    assert n == 500
+    frames = 60
+    for _ in range(frames):
+        g.update()
+        screen.fill((0,0,0))
+        g.draw()
+        assert sum(1 for _ in g.grid.candidate_pairs()) < n * n // 10
+    assert screen.blits_calls == frames
@@ -0,0 +1,106 @@
+# tests/test_display.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BG
+from display   import Display
+from game      import Game
+from states    import GameState
+
+SETTINGS = {"points_to_win": 10**6, "games_per_match": 1, "balls": 3}
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+def test_letterbox_and_mouse_mapping():
+    display = Display(pygame.display.set_mode((1000, 600)))
+    # Same height: bars left and right, nothing to scale
+    assert display.viewport == pygame.Rect(100, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert not display.scaled and display.native_target() is None
+    assert display.to_logical((100, 0)) == (0, 0)
+
+    display = Display(pygame.display.set_mode((1600, 1300)))
+    assert display.scale == 2 and display.viewport == pygame.Rect(0, 50, 1600, 1200)
+    assert display.scaled and display.surface.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert display.to_logical((800, 650)) == (400, 300)
+
+    with pytest.raises(ValueError):
+        Display(display.window, "stretch")
+
+def test_native_field_matches_scaled_frame():
+    window = pygame.display.set_mode((1600, 1200))
+    game = None
+    frames = {}
+    for mode in ("scale", "native"):
+        display = Display(window, mode)
+        game = game or Game(display.surface, ["A", "B"], SETTINGS)
+        target = display.native_target()
+        if target is None:
+            display.surface.fill(COLOR_BG)
+            game.draw()
+        else:
+            target.fill(COLOR_BG)
+            game.draw(None, target, display.game_sprites())
+        display.present()
+        frames[mode] = window.copy()
+    for x, y in (spr.rect.center for spr in game.all_sprites):
+        assert frames["scale"].get_at((x * 2, y * 2)) == frames["native"].get_at((x * 2, y * 2)) != COLOR_BG
+
+def play(window, tmp_path, monkeypatch):
+    import main
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    display = Display(window, "native")
+    session = main.Session(display.surface, {}, display)
+    stack = main.build_scenes(session)
+    session.player_names[:] = ["Ann", "Bob"]
+    session.tournament_settings = {**session.settings_view.values, **SETTINGS}
+    stack.reset(GameState.CHOOSE_SERVER)
+    session.serve_box.active = True
+    for key, char in ((pygame.K_1, "1"), (pygame.K_RETURN, "\r")):
+        stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char))
+    assert stack.state == GameState.PLAYING
+    return display, stack
+
+def test_native_match_is_not_scaled_per_frame(tmp_path, monkeypatch):
+    display, stack = play(pygame.display.set_mode((1600, 1200)), tmp_path, monkeypatch)
+    calls = []
+    scale = pygame.transform.scale
+    monkeypatch.setattr(pygame.transform, "scale", lambda *a: calls.append(a) or scale(*a))
+    for _ in range(30):
+        stack.update(); stack.draw(); display.present()
+    assert calls == []
+    # Pausing freezes the frame on show, then the menu is scaled up as usual
+    stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+    assert stack.state == GameState.PAUSED
+    backdrop = stack.top.backdrop
+    assert pygame.transform.average_color(backdrop)[:3] != (0, 0, 0)
+    stack.update(); stack.draw(); display.present()
+    assert len(calls) == 1
+
+def test_native_assets_are_made_once_per_resolution(tmp_path, monkeypatch):
+    # Frame costs are compared by `python display.py`; here, that a native
+    # frame reuses the pre-scaled sprites, stamps and fonts
+    display, stack = play(pygame.display.set_mode((2400, 1800)), tmp_path, monkeypatch)
+    session = stack.top.session
+    for _ in range(5):
+        stack.update(); stack.draw(); display.present()
+    sprites = display.game_sprites(session.game.sprites.physics)
+    made = []
+    monkeypatch.setattr(pygame, "Surface", lambda *a, **k: made.append(a) or pygame.surface.Surface(*a, **k))
+    for _ in range(30):
+        stack.update(); stack.draw(); display.present()
+    assert display.game_sprites(session.game.sprites.physics) is sprites and sprites.scale == 3
+    assert len(display._fonts) == 1
+    if session.particles is not None:
+        assert set(session.particles._stamps) <= {3.0}
+    assert made == []
@@ -0,0 +1,48 @@
+# tests/test_events.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from events    import EventBus, PaddleHit, PointScored, GameWon
+from game      import Game
+from telemetry import TelemetrySink, read_records, summarize
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+def play_until_game_won(bus):
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    g = Game(screen, ["A","B"], {"points_to_win": 2}, first_player=0, bus=bus)
+    for _ in range(5000):
+        if g.update():
+            return g
+    pytest.fail("game never ended")
+
+def test_game_publishes_events():
+    bus = EventBus()
+    seen = []
+    for kind in (PaddleHit, PointScored, GameWon):
+        bus.subscribe(kind, seen.append)
+    play_until_game_won(bus)
+    points = [e for e in seen if isinstance(e, PointScored)]
+    assert isinstance(seen[-1], GameWon)
+    assert sum(e.name == seen[-1].name for e in points) == 2
+
+def test_telemetry_batches_to_file(tmp_path):
+    path = str(tmp_path / "telemetry.bin")
+    bus  = EventBus()
+    sink = TelemetrySink(path, capacity=4)
+    sink.attach(bus)
+    play_until_game_won(bus)
+    sink.close()
+    stats = summarize(read_records(path))
+    assert 2 <= stats["points"] <= 3
+    assert stats["paddle_hits"] == sum(stats["hit_location"]["left"] + stats["hit_location"]["right"])
@@ -0,0 +1,119 @@
+# tests/test_governor.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import types
+import pygame
+import pytest
+
+import governor
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from events    import EventBus
+from game      import Game
+from governor  import FrameGovernor
+from main      import HudLayer
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    yield
+    pygame.quit()
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake perf_counter the test advances by hand."""
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(governor, "time", types.SimpleNamespace(perf_counter=lambda: clock.now))
+    return clock
+
+def run(gov, clock, frames, render_ms, update_ms):
+    """Drive `frames` frames: rendered ones cost render_ms, skipped ones update_ms."""
+    for _ in range(frames):
+        gov.begin_frame()
+        rendered = gov.should_render()
+        clock.now += (render_ms if rendered else update_ms) / 1000
+        gov.end_frame(rendered)
+
+def test_sheds_levels_under_load_and_restores_with_hysteresis(clock):
+    gov = FrameGovernor(60, down_after=10, up_after=50)
+    run(gov, clock, 100, render_ms=5, update_ms=1)
+    assert gov.level == 0 and gov.changes == 0
+
+    # 20 ms frames against a 16.7 ms budget: shed until skipped renders fit
+    run(gov, clock, 400, render_ms=20, update_ms=2)
+    assert gov.level == 4
+    assert not gov.alpha and not gov.antialias and gov.hud_cache
+    assert gov.render_every == 2
+    assert gov.cost() < gov.high * gov.budget
+
+    # Back under budget, levels come back one at a time, not all at once
+    run(gov, clock, 100, render_ms=5, update_ms=1)
+    assert gov.level == 3
+    run(gov, clock, 1000, render_ms=5, update_ms=1)
+    assert gov.level == 0 and gov.alpha and gov.antialias
+
+def test_level_between_thresholds_holds(clock):
+    # 12 ms: over `low` (10 ms) but under `high` (15 ms) of the budget
+    gov = FrameGovernor(60, down_after=10, up_after=50)
+    gov.level = 2
+    run(gov, clock, 1000, render_ms=12, update_ms=1)
+    assert gov.level == 2 and gov.changes == 0
+
+def test_restore_that_is_shed_again_backs_off(clock):
+    gov = FrameGovernor(60, down_after=5, up_after=20)
+    gov.level = 1
+    run(gov, clock, 20, render_ms=5, update_ms=1)
+    assert gov.level == 0
+    # Level 0 does not fit after all: shed again, and the next restore waits longer
+    run(gov, clock, 16, render_ms=20, update_ms=1)
+    assert gov.level == 1
+    assert gov._up_wait[0] == 40
+
+def test_max_level_caps_shedding(clock):
+    gov = FrameGovernor(60, down_after=5, max_level=0)
+    run(gov, clock, 200, render_ms=40, update_ms=40)
+    assert gov.level == 0 and gov.changes == 0
+
+def test_render_every_skips_frames():
+    gov = FrameGovernor(60)
+    gov.level = 5
+    drawn = 0
+    for _ in range(30):
+        gov.begin_frame()
+        drawn += gov.should_render()
+    assert drawn == 10
+
+def test_hud_layer_redraws_only_on_change(monkeypatch):
+    import main
+    calls = []
+    monkeypatch.setattr(main, "draw_hud", lambda surface, *a, **k: calls.append(a))
+    hud = HudLayer((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.display.get_surface()
+    for _ in range(5):
+        hud.draw(screen, (1, 0), "x")
+    assert len(calls) == 1
+    hud.draw(screen, (1, 1), "y")
+    assert calls == [("x",), ("y",)]
+
+def test_sprite_alpha_swaps_images_and_render_states_follow():
+    settings = {"points_to_win": 3, "games_per_match": 1, "balls": 3}
+    game = Game(pygame.display.get_surface(), ["A", "B"], settings, bus=EventBus())
+    state = game.render_state()
+    keyed = game.ball_images[False]
+    assert keyed.get_colorkey() is not None and not keyed.get_flags() & pygame.SRCALPHA
+
+    game.set_sprite_alpha(False)
+    assert all(ball.image is keyed for ball in game.ball_grp)
+    game.update(pygame.key.get_pressed())
+    game.capture(state)
+    images = {image for image, _ in state.blits}
+    assert keyed in images and game.ball_images[True] not in images
+    # positions still track the game after the swap
+    assert [r for _, r in state.blits] == [spr.rect for spr in game.all_sprites]
+
+    game.set_sprite_alpha(True)
+    game.capture(state)
+    assert keyed not in {image for image, _ in state.blits}
@@ -0,0 +1,89 @@
+# tests/test_journal.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from journal   import SeriesJournal
+from states    import GameState
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    return tmp_path
+
+SETTINGS = {"num_matches": 3, "games_per_match": 3, "points_to_win": 5}
+
+def record_series(journal):
+    journal.series_started(["A", "B"], SETTINGS)
+    journal.match_started(1, ["A", "B"], 1)
+    for p in (0, 1, 0):
+        journal.append({"t": "point", "p": p})
+
+def test_replay_restores_exact_score(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    j = SeriesJournal(path)
+    record_series(j)
+    j.append({"t": "game", "p": 1})
+    j.append({"t": "point", "p": 1})
+    j.close()
+    # simulate a torn write from a crash
+    with open(path, "a") as f:
+        f.write('{"t": "po')
+    state = SeriesJournal(path).state
+    assert state["points"] == [0, 1]
+    assert state["games_won"] == {"A": 0, "B": 1}
+    assert state["server"] == 0 and state["in_match"]
+
+def test_records_after_a_torn_line_survive(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    j = SeriesJournal(path)
+    record_series(j)
+    j.close()
+    with open(path, "a") as f:
+        f.write('{"t": "po')
+    j = SeriesJournal(path)
+    j.append({"t": "point", "p": 1})
+    j.append({"t": "game", "p": 0})
+    j.close()
+    state = SeriesJournal(path).state
+    assert state["games_won"] == {"A": 1, "B": 0}
+    assert state["points"] == [0, 0] and state["server"] == 0
+    assert all(line.endswith("}\n") for line in open(path))
+
+def test_checkpoints_bound_replay(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    j = SeriesJournal(path, checkpoint_every=10)
+    record_series(j)
+    for _ in range(95):
+        j.append({"t": "point", "p": 0})
+    j.close()
+    assert sum(1 for _ in open(path)) <= 10
+    assert SeriesJournal(path).state["points"] == [2 + 95, 1]
+
+def test_session_resumes_mid_match(store):
+    from main import Session
+    screen  = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    path    = str(store / "journal.jsonl")
+    j = SeriesJournal(path)
+    record_series(j)
+    j.close()
+    session = Session(screen, {})
+    session.journal = SeriesJournal(path)
+    assert session.journal.resumable
+    assert session.resume() == GameState.PLAYING
+    assert session.game.points == {"A": 2, "B": 1}
+    assert session.current_match == 1 and session.player_names == ["A", "B"]
+    session.journal.close()
@@ -0,0 +1,92 @@
+# tests/test_leaderboard.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import json
+import multiprocessing
+import pygame
+import pytest
+
+import leaderboard as lb_module
+
+WRITERS = 8
+MATCHES = 25
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    return tmp_path
+
+def board():
+    return lb_module.Leaderboard(pygame.Surface((800, 600)), pygame.font.Font(None, 20))
+
+def writer(directory: str, n: int, matches: int, start) -> None:
+    """One cabinet: record `matches` results against the shared store."""
+    pygame.init()
+    lb_module.LEADER_JSON = os.path.join(directory, "lb.json")
+    lb_module.LEADER_CSV  = os.path.join(directory, "lb.csv")
+    lb = board()
+    start.wait()
+    for m in range(matches):
+        lb.record([f"cab{n}", f"guest{n}-{m}"], (3, m % 3))
+
+def test_other_cabinets_results_are_seen(store):
+    a, b = board(), board()
+    a.record(["Ann", "Bob"], (3, 1))
+    assert b.refresh() == 1
+    assert b.top == [("Ann", 1)]
+    assert b.refresh() == 0
+    # a write folds in the other cabinet's results before its own
+    b.record(["Cy", "Dee"], (3, 0))
+    a.record(["Ann", "Cy"], (3, 2))
+    assert [e["winner"] for e in a.entries] == ["Ann", "Cy", "Ann"]
+    assert json.load(open(lb_module.LEADER_JSON)) == a.entries
+    assert a.analytics.n == b.analytics.n + 1 == 3
+
+def test_torn_tail_waits_for_the_rest_of_the_line(store):
+    a, b = board(), board()
+    a.record(["Ann", "Bob"], (3, 1))
+    with open(lb_module.LEADER_CSV, "a", newline="") as f:
+        f.write("2024-01-01 10:00,Cy,1,0")
+    assert b.refresh() == 1
+    with open(lb_module.LEADER_CSV, "a", newline="") as f:
+        f.write(",3,0\r\n2024-01-01 10:00,Dee,0,1,0,3\r\n")
+    assert b.refresh() == 1
+    assert b.entries[0]["winner"] == "Cy" and b.entries[0]["loser"] == "Dee"
+
+def test_concurrent_writers_lose_nothing(store):
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Barrier(WRITERS + 1)
+    procs = [
+        ctx.Process(target=writer, args=(str(store), n, MATCHES, start))
+        for n in range(WRITERS)
+    ]
+    for p in procs:
+        p.start()
+    start.wait()
+    for p in procs:
+        p.join(120)
+    assert all(p.exitcode == 0 for p in procs)
+    total = WRITERS * MATCHES
+
+    lb = board()
+    assert lb.analytics.n == total
+    won = {lb.players.name_of(pid): n for pid, n in enumerate(lb.analytics.won)}
+    assert all(won[f"cab{n}"] == MATCHES for n in range(WRITERS))
+    # the JSON holds the newest 100 of everyone's, in CSV order
+    entries = json.load(open(lb_module.LEADER_JSON))
+    assert len(entries) == 100
+    assert len({(e["winner"], e["loser"]) for e in entries}) == 100
+    # each cabinet's own results stay in the order it recorded them
+    for n in range(WRITERS):
+        mine = [int(e["loser"].split("-")[1]) for e in entries if e["winner"] == f"cab{n}"]
+        assert mine == sorted(mine, reverse=True)
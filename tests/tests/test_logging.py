@@ -0,0 +1,77 @@
+# tests/test_logging.py
+
+import io
+import types
+import logging
+import threading
+
+import logsetup
+from logsetup import RateLimitedLogger, context, setup_logging
+
+def test_records_carry_frame_context():
+    stream = io.StringIO()
+    listener = setup_logging(logging.DEBUG, stream=stream)
+    try:
+        context.state, context.frame, context.match = "PLAYING", 42, 3
+        logging.getLogger("t").info("point to %s", "A")
+    finally:
+        listener.stop()
+        logging.getLogger().handlers.clear()
+    assert "[PLAYING f=42 m=3] point to A" in stream.getvalue()
+
+def capture(name):
+    seen = []
+    class Capture(logging.Handler):
+        def emit(self, record):
+            seen.append(record)
+    log = logging.getLogger(name)
+    log.setLevel(logging.DEBUG)
+    log.addHandler(Capture())
+    log.propagate = False
+    return log, seen
+
+def test_rate_limited_logger_counts_suppressed():
+    log, seen = capture("sampled")
+    sampled = RateLimitedLogger(log, every=10)
+    for i in range(25):
+        sampled.debug("tick %d", i)
+    assert [r.getMessage() for r in seen] == ["tick 9 (suppressed=9)", "tick 19 (suppressed=9)"]
+
+def test_sampled_records_point_at_the_caller():
+    log, seen = capture("where")
+    sampled = RateLimitedLogger(log, every=1)
+    sampled.info("from here")
+    sampled.log(logging.INFO, "and here")
+    assert [(r.filename, r.funcName) for r in seen] == [
+        ("test_logging.py", "test_sampled_records_point_at_the_caller"),
+    ] * 2
+
+def test_rate_limited_logger_samples_by_interval(monkeypatch):
+    clock = types.SimpleNamespace(now=100.0)
+    monkeypatch.setattr(logsetup, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    log, seen = capture("per_second")
+    sampled = RateLimitedLogger(log, interval=1.0)
+    for frame in range(180):
+        clock.now = 100.0 + frame / 60
+        sampled.debug("frame %d", frame)
+    assert [r.getMessage() for r in seen] == ["frame 0", "frame 60 (suppressed=59)", "frame 120 (suppressed=59)"]
+
+def test_frame_thread_only_enqueues():
+    # Per-call costs are measured by `python logsetup.py`; here, that the
+    # calling thread never writes to the console itself
+    caller = threading.current_thread()
+    writers = []
+    class Console(io.StringIO):
+        def write(self, s):
+            writers.append(threading.current_thread())
+            return super().write(s)
+    stream = Console()
+    listener = setup_logging(logging.DEBUG, stream=stream)
+    try:
+        for i in range(50):
+            logging.getLogger("t").debug("ball at %d,%d", i, i)
+    finally:
+        listener.stop()
+        logging.getLogger().handlers.clear()
+    assert stream.getvalue().count("ball at") == 50
+    assert writers and caller not in writers
@@ -0,0 +1,110 @@
+# tests/test_metrics.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import urllib.error
+import urllib.request
+import pygame
+import pytest
+
+import leaderboard as lb_module
+import metrics
+from events  import EventBus
+from game    import Game
+from metrics import Registry, MetricsServer
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+def parse(text: str) -> dict[str, float]:
+    return {
+        name: float(value)
+        for name, value in (line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+    }
+
+def scrape(server: MetricsServer, path: str = "/metrics") -> str:
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.port}{path}", timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        return response.read().decode()
+
+def test_exposition_format():
+    reg = Registry()
+    frames = reg.counter("t_frames_total", "Frames.")
+    reg.gauge("t_state", "State.", fn=lambda: {"MENU": 0, "PLAYING": 1}, label="state")
+    hist = reg.histogram("t_seconds", "Time.", buckets=(0.01, 0.1))
+    frames.inc(); frames.inc(2)
+    for v in (0.005, 0.01, 0.05, 3.0):
+        hist.observe(v)
+    text = reg.exposition()
+    assert "# TYPE t_frames_total counter" in text and "# TYPE t_seconds histogram" in text
+    samples = parse(text)
+    assert samples["t_frames_total"] == 3
+    assert samples['t_state{state="PLAYING"}'] == 1 and samples['t_state{state="MENU"}'] == 0
+    # buckets are cumulative, le is inclusive
+    assert samples['t_seconds_bucket{le="0.01"}'] == 2
+    assert samples['t_seconds_bucket{le="0.1"}'] == 3
+    assert samples['t_seconds_bucket{le="+Inf"}'] == samples["t_seconds_count"] == 4
+    assert samples["t_seconds_sum"] == pytest.approx(3.065)
+    assert reg.counter("t_frames_total", "Frames.") is frames
+    with pytest.raises(ValueError):
+        reg.gauge("t_frames_total", "Not a gauge.")
+
+def test_quantile_interpolates_within_bucket():
+    hist = Registry().histogram("q", "Q.", buckets=(0.01, 0.02, 0.03))
+    for _ in range(50):
+        hist.observe(0.005)
+    for _ in range(50):
+        hist.observe(0.015)
+    assert hist.quantile(0.5) == pytest.approx(0.01)
+    assert hist.quantile(0.75) == pytest.approx(0.015)
+
+def test_scrape_over_http(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    server = MetricsServer()
+    server.start()
+    try:
+        before = parse(scrape(server))
+        game = Game(pygame.display.get_surface(), ["A", "B"], {"points_to_win": 3, "balls": 2}, bus=EventBus())
+        keys = pygame.key.get_pressed()
+        for _ in range(120):
+            game.update(keys)
+        board = lb_module.Leaderboard(pygame.display.get_surface(), pygame.font.Font(None, 20))
+        board.record(["A", "B"], (3, 1))
+        after = parse(scrape(server))
+        assert after["pong_game_update_seconds_count"] - before["pong_game_update_seconds_count"] == 120
+        assert after["pong_balls"] == 2
+        assert after["pong_matches_recorded_total"] - before["pong_matches_recorded_total"] == 1
+        assert after["pong_leaderboard_record_seconds_count"] >= 1
+        assert server.scrapes == 2
+        with pytest.raises(urllib.error.HTTPError):
+            scrape(server, "/nope")
+    finally:
+        server.stop()
+
+def test_updates_only_count_into_fixed_buckets():
+    # Per-update cost is measured by `python metrics.py`; here, that an
+    # update adds to preallocated buckets and keeps no samples
+    reg = Registry()
+    frames = reg.counter("c", "C.")
+    hist = reg.histogram("h", "H.")
+    counts = hist.counts
+    n = 100_000
+    values = [(i + 0.5) * 1e-5 for i in range(n)]
+    for v in values:
+        frames.inc()
+        hist.observe(v)
+    assert hist.counts is counts and len(counts) == len(metrics.DEFAULT_BUCKETS) + 1
+    assert frames.value == hist.count == sum(counts) == n
+    lower = 0.0
+    for bound, got in zip(hist.bounds, counts):
+        assert got == sum(1 for v in values if lower < v <= bound)
+        lower = bound
+    assert counts[-1] == sum(1 for v in values if v > hist.bounds[-1])
+    assert hist.sum == pytest.approx(sum(values))
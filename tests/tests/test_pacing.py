@@ -0,0 +1,69 @@
+# tests/test_pacing.py
+
+import pytest
+
+import pacing
+from pacing import FramePacer
+
+class FakeTime:
+    """A clock that moves only when slept on, or a little per reading (spinning)."""
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    def perf_counter(self):
+        self.now += 1e-6
+        return self.now
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(pacing, "time", fake)
+    return fake
+
+def run_frames(pacer, clock, frames, work_s, present_every=1):
+    for i in range(frames):
+        pacer.wait()
+        pacer.mark_input()
+        clock.now += work_s
+        if i % present_every == 0:
+            pacer.mark_present()
+        pacer.end_frame()
+
+def test_hybrid_pacing_hits_target(clock):
+    # Real timings are reported by `python pacing.py [mode] [fps] [work_ms]`
+    pacer = FramePacer(100, mode="hybrid", report_every=0)
+    run_frames(pacer, clock, 60, work_s=0.002)
+    stats = pacer.report()
+    assert stats["interval_mean_ms"] == pytest.approx(10.0, rel=0.01)
+    # Once the work is measured, every frame lands on its deadline
+    assert all(i == pytest.approx(0.010, abs=1e-5) for i in list(pacer.intervals)[1:])
+    # The wait is slept, not spun, apart from the last spin_ms
+    assert len(clock.sleeps) >= 59
+    # Input is sampled late: latency is about the work time, not a frame
+    assert stats["latency_p50_ms"] == pytest.approx(2.0, abs=0.01)
+    assert {"jitter_ms", "interval_p99_ms", "latency_p99_ms"} <= stats.keys()
+
+def test_missed_deadline_drops_instead_of_catching_up(clock):
+    pacer = FramePacer(100, mode="hybrid", report_every=0)
+    run_frames(pacer, clock, 10, work_s=0.002)
+    run_frames(pacer, clock, 1, work_s=0.035)
+    run_frames(pacer, clock, 10, work_s=0.002)
+    intervals = list(pacer.intervals)[-11:]
+    assert intervals[0] > 0.035
+    # The frame after the miss starts at once; after that the schedule
+    # restarts from the late frame instead of bunching frames to catch up
+    assert all(0.010 <= i < 0.011 for i in intervals[2:])
+
+def test_skipped_frames_are_not_counted_as_presented(clock):
+    pacer = FramePacer(100, mode="hybrid", report_every=0)
+    run_frames(pacer, clock, 60, work_s=0.002, present_every=3)
+    # Deadlines still advance every frame; stats cover presented frames only
+    assert len(pacer.latencies) == 20 and len(pacer.intervals) == 19
+    assert all(i == pytest.approx(0.030, abs=1e-5) for i in list(pacer.intervals)[1:])
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        FramePacer(60, mode="vsync")
@@ -0,0 +1,71 @@
+# tests/test_particles.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from events    import EventBus, PaddleHit, PointScored
+from particles import ParticleSystem, SPARK, TRAIL
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+def test_pool_is_fixed_and_expired_particles_are_reused():
+    ps = ParticleSystem(capacity=100, budget=1.0, seed=1)
+    arrays = (ps.pos, ps.vel, ps.life)
+    assert ps.emit(10, 10, 80, SPARK, life=(5, 5)) == 80
+    # A full pool makes room by dropping the particles closest to expiring
+    assert ps.emit(10, 10, 80, SPARK, life=(9, 9)) == 80
+    assert ps.n == 100
+    for _ in range(5):
+        ps.update()
+    assert ps.n == 80
+    assert (ps.life[:ps.n] == 4).all()
+    assert ps.emit(10, 10, 80, SPARK) == 80
+    assert (ps.pos, ps.vel, ps.life) == arrays
+
+def test_update_moves_and_slows_every_particle():
+    ps = ParticleSystem(capacity=10, budget=1.0, drag=0.5, seed=2)
+    ps.emit(100, 100, 10, SPARK, speed=(2, 2), life=(30, 30))
+    vel = ps.vel[:10].copy()
+    ps.update()
+    assert np.allclose(ps.pos[:10], 100 + vel)
+    assert np.allclose(ps.vel[:10], vel * 0.5)
+
+def test_effects_follow_gameplay_events():
+    bus = EventBus()
+    ps = ParticleSystem(seed=3)
+    ps.attach(bus)
+    bus.publish(PaddleHit(1, 0, 0.0, 5.0, 30, 200))
+    hit = ps.n
+    assert hit and np.allclose(ps.pos[:hit], (30, 200))
+    # Sparks fly back into the field, away from the left paddle
+    assert (ps.vel[:hit, 0] > 0).all()
+    bus.publish(PointScored(2, 1, "Bob", 3, 0, 300))
+    assert ps.n > hit
+    surface = pygame.Surface((800, 600))
+    ps.update()
+    ps.draw(surface)
+    assert surface.get_bounding_rect().collidepoint(32, 200)
+
+def test_over_budget_thins_particles_and_recovers():
+    surface = pygame.Surface((800, 600))
+    ps = ParticleSystem(capacity=4096, budget=1e-9, seed=4)
+    for _ in range(10):
+        ps.emit(400, 300, 4096, TRAIL, life=(60, 60))
+        ps.update()
+        ps.draw(surface)
+    assert ps.limit == ps.minimum
+    assert ps.n <= ps.limit
+    # Emitters are thinned in proportion, not starved
+    ps.update()
+    assert 0 < ps.emit(400, 300, 4096, TRAIL) <= ps.minimum
+    ps.budget = 1.0
+    ps.update()
+    assert ps.limit == ps.capacity
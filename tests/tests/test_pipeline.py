@@ -0,0 +1,98 @@
+# tests/test_pipeline.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import threading
+import pygame
+import pytest
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from events    import EventBus, PaddleHit, WallBounce, PointScored
+from game      import Game
+from pipeline  import SimulationPipeline, benchmark
+
+SETTINGS = {"points_to_win": 3, "games_per_match": 1, "balls": 5}
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    yield
+    pygame.quit()
+
+def recording_game():
+    bus = EventBus()
+    log = []
+    for kind in (PaddleHit, WallBounce, PointScored):
+        bus.subscribe(kind, lambda e: log.append((e, threading.current_thread().name)))
+    game = Game(pygame.display.get_surface(), ["A", "B"], SETTINGS, bus=bus)
+    game.rng.seed(7)
+    game.reset_ball(to_right=True)   # re-scatter the balls from the seeded rng
+    return game, log
+
+def test_pipelined_run_matches_serial():
+    keys = pygame.key.get_pressed()
+    serial, serial_log = recording_game()
+    frames = [serial.render_state()]
+    for _ in range(400):
+        serial.update(keys)
+        frames.append(serial.render_state())
+
+    game, log = recording_game()
+    pipeline = SimulationPipeline(game)
+    for n in range(401):
+        pipeline.finish_step()
+        front = pipeline.front
+        # the renderer sees frame n, exactly as the serial loop produced it
+        assert front.frame == frames[n].frame == n
+        assert [r for _, r in front.blits] == [r for _, r in frames[n].blits]
+        assert front.points == frames[n].points
+        if n < 400:
+            pipeline.start_step(keys)
+    pipeline.stop()
+
+    assert [e for e, _ in log] == [e for e, _ in serial_log]
+    # events reach subscribers on the main thread, never the worker
+    assert {t for _, t in log} == {threading.main_thread().name}
+    assert game.bus is not None and not hasattr(game.bus, "flush")
+
+def test_worker_errors_surface_on_main_thread():
+    game, _ = recording_game()
+    pipeline = SimulationPipeline(game)
+    pipeline.start_step(None)
+    game.paddles = None    # break the next update
+    with pytest.raises(TypeError):
+        pipeline.finish_step()
+    pipeline.stop()
+
+def test_benchmark_reports_both_loops():
+    results = benchmark(frames=30, balls=10)
+    assert results["serial_fps"] > 0 and results["pipelined_fps"] > 0
+    assert results["pipelined_latency_ms"] > 0
+
+def test_play_scene_runs_pipelined(tmp_path, monkeypatch):
+    import main
+    import leaderboard as lb_module
+    from states import GameState
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    monkeypatch.setattr(main, "PIPELINE", True)
+    session = main.Session(pygame.display.get_surface(), {})
+    stack = main.build_scenes(session)
+    session.player_names[:] = ["Ann", "Bob"]
+    session.tournament_settings = {**session.settings_view.values, "balls": 5}
+    stack.reset(GameState.CHOOSE_SERVER)
+    session.serve_box.active = True
+    for key, char in ((pygame.K_1, "1"), (pygame.K_RETURN, "\r")):
+        stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char))
+    play = stack.top
+    assert play.pipeline is not None
+    for _ in range(60):
+        stack.update(); stack.draw()
+    # 60 updates: the first only starts a step, so 59 have been handed off
+    assert play.pipeline.front.frame == 59 and play.pipeline.pending
+    stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+    stack.reset(GameState.MENU)
+    assert play.pipeline is None and session.game.bus is session.bus
@@ -0,0 +1,80 @@
+# tests/test_players.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import string
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from players  import PlayerRegistry
+from inputbox import InputBox
+from utils    import get_font
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+def test_names_intern_case_insensitively():
+    reg = PlayerRegistry(["Bryan", "Test"])
+    assert reg.intern("bryan ") == reg.id_of("BRYAN") == 0
+    assert reg.canonical("test") == "Test"
+    assert reg.same("new ", "NEW") and not reg.same("Bryan", "Brian")
+    assert reg.intern("Zoe") == 2 and len(reg) == 3
+
+def test_completion_ranks_by_activity():
+    reg = PlayerRegistry(["Bryan", "Brian", "Brook", "Alice"])
+    reg.bump(reg.id_of("Brook"), 5)
+    assert reg.complete("br") == ["Brook", "Brian", "Bryan"]
+    assert reg.complete("bri") == ["Brian"]
+    assert reg.complete("x") == []
+
+class CountingList(list):
+    reads = 0
+    def __getitem__(self, i):
+        CountingList.reads += 1
+        return super().__getitem__(i)
+
+def test_completion_reads_only_the_prefix_range():
+    # Completion time is measured by `python players.py [names]`
+    rng = random.Random(0)
+    names = {"".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(50000)}
+    reg = PlayerRegistry(names)
+    for pid in range(len(reg)):
+        reg.bump(pid, rng.randrange(100))
+    reg.counts = CountingList(reg.counts)
+    for prefix in ("a", "b", "ma", "sto", "qwe", "z"):
+        matching = sorted((n for n in reg.names if n.startswith(prefix)))
+        CountingList.reads = 0
+        got = reg.complete(prefix)
+        # Ranked from the index slice: one count read per name in range, capped by `scan`
+        assert CountingList.reads == min(len(matching), 2000)
+        if len(matching) <= 2000:
+            expect = sorted(matching, key=lambda n: -reg.counts[reg.id_of(n)])[:3]
+            assert got == expect
+
+def test_inputbox_tab_accepts_suggestion():
+    reg = PlayerRegistry(["Bryan"])
+    box = InputBox((0, 0, 100, 30), get_font(20), suggest=reg.complete)
+    box.active = True
+    box.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_b, unicode="b"))
+    assert box.suggestions == ["Bryan"]
+    box.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_TAB, unicode="\t"))
+    assert box.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r")) == "Bryan"
+
+def test_leaderboard_tally_keyed_by_id(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    screen = pygame.display.set_mode((800, 600))
+    lb = lb_module.Leaderboard(screen, get_font(20))
+    lb.record(["Ann", "Bob"], (3, 1))
+    lb.record(["Bob", "Ann"], (0, 3))
+    assert lb.match_wins[lb.players.id_of("ann")] == 2
+    assert lb.top == [("Ann", 2)]
+    # a fresh board rebuilds the registry from the CSV history
+    lb2 = lb_module.Leaderboard(screen, get_font(20))
+    assert lb2.players.counts[lb2.players.id_of("Bob")] == 2
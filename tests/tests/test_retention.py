@@ -0,0 +1,159 @@
+# tests/test_retention.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import csv
+import time
+import random
+from datetime import datetime, timedelta
+
+import pygame
+import pytest
+
+import leaderboard as lb_module
+import retention
+
+NOW = datetime.now().replace(second=0, microsecond=0)
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    return tmp_path
+
+def board():
+    return lb_module.Leaderboard(pygame.Surface((800, 600)), pygame.font.Font(None, 20))
+
+def compactor(**kwargs):
+    return retention.Compactor(
+        lb_module.LEADER_CSV, lb_module.LEADER_CSV + ".lock", now=lambda: NOW, **kwargs
+    )
+
+def history(n, days, players=8, seed=5):
+    """`n` matches spread over the `days` before NOW, oldest first."""
+    rng = random.Random(seed)
+    names = [f"P{i}" for i in range(players)]
+    step = timedelta(days=days) / n
+    matches = []
+    for i in range(n):
+        w, l = rng.sample(names, 2)
+        when = (NOW - timedelta(days=days) + i * step).strftime("%Y-%m-%d %H:%M")
+        matches.append((when, w, l, 3, rng.randint(0, 2)))
+    return matches
+
+def write_csv(path, matches):
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["when","player","matches_won","matches_lost","games_won","games_lost"])
+        for when, w, l, wg, lg in matches:
+            out.writerow([when, w, 1, 0, wg, lg])
+            out.writerow([when, l, 0, 1, lg, wg])
+
+def stats(lb):
+    a = lb.analytics
+    names = sorted(lb.players.names)
+    ids = [lb.players.id_of(name) for name in names]
+    return {
+        "top": lb.top,
+        "played": [a.played[pid] for pid in ids],
+        "margin": [a.margin[pid] for pid in ids],
+        "best": [a.best_streak[pid] for pid in ids],
+        "streak": [a.streak[pid] for pid in ids],
+        "h2h": a.head_to_head(ids).tolist(),
+        "last": [a.results(pid)[-retention.TAIL:].tolist() for pid in ids],
+        "completions": [lb.players.counts[pid] for pid in ids],
+    }
+
+def test_tally_counts_every_match_not_the_last_100(store):
+    write_csv(lb_module.LEADER_CSV, [
+        (NOW.strftime("%Y-%m-%d %H:%M"), "Ann", "Bob", 3, 1)
+    ] * 150)
+    assert board().top == [("Ann", 150)]
+
+def test_compaction_keeps_all_time_statistics_exact(store):
+    matches = history(12000, days=500, players=4)
+    write_csv(lb_module.LEADER_CSV, matches)
+    before = board()
+    expected = stats(before)
+    size = os.path.getsize(lb_module.LEADER_CSV)
+
+    cutoff = (NOW - timedelta(days=30)).strftime("%Y-%m-%d %H:%M")
+    assert compactor(batch=2500).drain() == sum(m[0] < cutoff for m in matches)
+    assert os.path.getsize(lb_module.LEADER_CSV) < size / 10
+    assert stats(board()) == expected
+    # A board that was open during compaction reloads, and gains nothing
+    assert before.refresh() == 0
+    assert stats(before) == expected
+    # Old days were merged into months; the rollup is far smaller than the log was
+    rollup = retention.load(retention.rollup_path(lb_module.LEADER_CSV))
+    assert {len(row[0]) for row in rollup["pairs"]} == {7, 10}
+    daily_from = (NOW - timedelta(days=365)).strftime("%Y-%m-%d")
+    assert all(row[0] >= daily_from for row in rollup["pairs"] if len(row[0]) == 10)
+    assert os.path.getsize(retention.rollup_path(lb_module.LEADER_CSV)) < size / 4
+
+def test_new_results_build_on_compacted_history(store):
+    matches = history(400, days=90, players=3)
+    write_csv(lb_module.LEADER_CSV, matches)
+    compactor().drain()
+    lb = board()
+    lb.record(["P0", "P1"], (3, 2))
+    fresh = stats(board())
+    assert stats(lb) == fresh
+    assert lb.analytics.played.sum() == 2 * 401
+
+def test_crash_between_fold_and_trim_loses_and_repeats_nothing(store):
+    write_csv(lb_module.LEADER_CSV, history(600, days=120))
+    expected = stats(board())
+    c = compactor(batch=200)
+    assert c.step() == 200
+    # Folded but not trimmed: loaders skip what the rollup holds
+    assert stats(board()) == expected
+    # Trimmed, but the crash came before the mark was cleared
+    rollup = retention.load(c.rollup_path)
+    c._trim(retention.skip(rollup, c.csv_path))
+    assert retention.skip(rollup, c.csv_path) == 0
+    assert stats(board()) == expected
+    c.drain()
+    assert stats(board()) == expected
+
+def test_recent_matches_are_left_alone(store):
+    write_csv(lb_module.LEADER_CSV, history(100, days=20))
+    with open(lb_module.LEADER_CSV, "rb") as f:
+        data = f.read()
+    assert compactor().drain() == 0
+    with open(lb_module.LEADER_CSV, "rb") as f:
+        assert f.read() == data
+
+def test_boards_compact_in_the_background(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    write_csv(lb_module.LEADER_CSV, history(1000, days=60))
+    lb = board()
+    expected = stats(lb)
+    lb.compactor.request()
+    deadline = time.monotonic() + 10
+    rollup = retention.empty()
+    while not rollup["matches"] or rollup["skip"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+        rollup = retention.load(lb.compactor.rollup_path)
+    lb.compactor.stop()
+    assert lb.refresh() == 0
+    assert lb.analytics.n < 600
+    assert stats(lb) == expected
+
+def test_compactor_thread_starts_and_stops(store):
+    import threading
+    lb = board()
+    assert not any(t.name == "compactor" for t in threading.enumerate())
+    lb.compactor.start()
+    lb.compactor.stop()
+    assert not any(t.name == "compactor" for t in threading.enumerate())
@@ -0,0 +1,92 @@
+# tests/test_scenes.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from states    import GameState
+from scenes    import Scene, SceneStack
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    import main
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    monkeypatch.setattr(main, "SETTINGS_FILE", str(tmp_path / "settings.json"))
+    return tmp_path
+
+class Solid(Scene):
+    state = GameState.PLAYING
+    def __init__(self):
+        super().__init__()
+        self.draws = 0
+    def draw(self, surface):
+        self.draws += 1
+        surface.fill((200, 200, 200))
+
+class Overlay(Scene):
+    state = GameState.PAUSED
+    is_overlay = True
+
+def test_overlay_freezes_dimmed_frame():
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    stack = SceneStack(screen)
+    solid, overlay = Solid(), Overlay()
+    stack.register(solid); stack.register(overlay)
+    stack.reset(GameState.PLAYING)
+    stack.draw()
+    stack.push(GameState.PAUSED)
+    assert stack.state == GameState.PAUSED
+    # backdrop is dimmed, and the scene below is no longer redrawn
+    assert overlay.backdrop.get_at((0, 0))[0] < 200
+    stack.draw(); stack.draw()
+    assert solid.draws == 1
+    stack.pop()
+    assert stack.top is solid
+
+def test_settings_overlay_is_reused(store):
+    from main import Session, build_scenes
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    session = Session(screen, {})
+    stack = build_scenes(session)
+    stack.reset(GameState.MENU)
+    view = session.settings_view
+    for key in (pygame.K_DOWN, pygame.K_DOWN, pygame.K_RETURN):
+        stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+    assert stack.state == GameState.SETTINGS and len(stack) == 2
+    stack.draw()
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=view.back_rect.center, button=1)
+    stack.handle_event(click)
+    assert stack.state == GameState.MENU
+    assert session.settings_view is view
+
+def test_second_player_cannot_repeat_the_first(store):
+    from main import Session, build_scenes
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    session = Session(screen, {})
+    stack = build_scenes(session)
+    stack.reset(GameState.ENTER_NAME1)
+    def submit(box, name):
+        box.active = True
+        for char in name:
+            stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=0, unicode=char))
+        stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r"))
+    submit(session.name1_box, "Bryan")
+    assert stack.state == GameState.ENTER_NAME2
+    submit(session.name2_box, " bryan")
+    assert stack.state == GameState.ENTER_NAME2 and session.player_names == ["Bryan"]
+    assert session.name2_box.active and stack.top.message
+    stack.draw()
+    submit(session.name2_box, "Ann")
+    assert stack.state == GameState.SETTINGS and session.player_names == ["Bryan", "Ann"]
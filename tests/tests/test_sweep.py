@@ -0,0 +1,70 @@
+# tests/test_sweep.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import numpy as np
+import pygame
+import pytest
+
+import sweep
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS
+from events    import EventBus
+from game      import Game, GameSprites
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+def field():
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+def test_physics_come_from_settings():
+    game = Game(field(), ["A", "B"], {"points_to_win": 5}, bus=EventBus())
+    paddle = next(iter(game.paddles))
+    (ball,) = game.ball_grp
+    assert paddle.rect.size == (PHYSICS["paddle_w"], PHYSICS["paddle_h"])
+    assert paddle.speed == PHYSICS["paddle_speed"] and abs(ball.speed_x) == PHYSICS["ball_speed"]
+
+    settings = {"points_to_win": 5, "paddle_h": 60, "paddle_speed": 9, "ball_speed": 6, "ball_radius": 4}
+    game = Game(field(), ["A", "B"], settings, bus=EventBus())
+    paddle = next(iter(game.paddles))
+    (ball,) = game.ball_grp
+    assert paddle.rect.size == (PHYSICS["paddle_w"], 60) and paddle.speed == 9
+    assert abs(ball.speed_x) == 6 and ball.rect.width == 8
+    # Scaled sprites keep the overridden sizes
+    assert GameSprites(2.0, settings).paddle.get_size() == (2 * PHYSICS["paddle_w"], 120)
+
+def test_grid_and_sample_cover_the_space():
+    configs = sweep.grid()
+    assert len(configs) == math.prod(len(v) for v in sweep.SPACE.values())
+    assert len({tuple(c.values()) for c in configs}) == len(configs)
+    drawn = sweep.sample(200, seed=3)
+    assert drawn == sweep.sample(200, seed=3)
+    for name, values in sweep.SPACE.items():
+        assert all(min(values) <= c[name] <= max(values) for c in drawn)
+
+def test_measure_tells_configurations_apart():
+    metrics = lambda **params: dict(zip(sweep.METRICS, sweep.measure({**PHYSICS, **params}, points=12)))
+    hopeless = metrics(paddle_h=60, paddle_speed=3, ball_speed=8)
+    generous = metrics(paddle_h=120, paddle_speed=8, ball_speed=4)
+    assert hopeless["rally_mean"] < generous["rally_mean"]
+    assert hopeless["point_seconds"] < generous["point_seconds"]
+    for m in (hopeless, generous):
+        assert 0 <= m["first_share"] <= 1 and 0 <= m["serve_share"] <= 1 and 0 <= m["stalled"] <= 1
+
+def test_pool_results_match_serial_and_save(tmp_path):
+    configs = sweep.sample(4, seed=0)
+    serial = sweep.run(configs, workers=1, points=6)
+    pooled = sweep.run(configs, workers=2, points=6)
+    assert list(serial) == [*PHYSICS, *sweep.METRICS]
+    assert all(np.array_equal(serial[k], pooled[k]) for k in serial)
+    path = tmp_path / "sweep.npz"
+    sweep.save(str(path), serial)
+    with np.load(path) as loaded:
+        assert all(np.array_equal(loaded[k], serial[k]) for k in serial)
+        assert loaded["paddle_h"].tolist() == [c["paddle_h"] for c in configs]
@@ -0,0 +1,144 @@
+# tests/test_tables.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from constants  import SCREEN_WIDTH, SCREEN_HEIGHT
+from events     import EventBus
+from states     import GameState
+from tournament import make_tournament
+from utils      import render_text
+from tables     import MultiTable, TABLE_CONTROLS, layout
+from journal    import SeriesJournal
+
+SETTINGS = {"points_to_win": 1, "games_per_match": 1, "num_matches": 1}
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.fixture
+def screen():
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+class Keys(set):
+    """Pressed-key state holding just the given keys."""
+    __getitem__ = set.__contains__
+
+def test_layout_tiles_without_overlap():
+    area = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    for n in range(1, 10):
+        rects = layout(area, n)
+        assert len(rects) == n
+        assert all(area.contains(r) for r in rects)
+        assert not any(a.colliderect(b) for i, a in enumerate(rects) for b in rects[i+1:])
+    assert layout(area, 1) == [area]
+
+def test_tables_share_sprites_and_text(screen):
+    tables = MultiTable(screen, 4, SETTINGS, EventBus())
+    for i in range(4):
+        tables.seat([f"A{i}", f"B{i}"])
+    games = [t.game for t in tables.tables]
+    images = {id(spr.image) for g in games for spr in g.all_sprites}
+    assert len(images) == 2     # one paddle, one ball
+    assert len({id(g.font) for g in games}) == 1
+    # Each game sees its own viewport as the whole field
+    assert all(g.surface.get_size() == t.viewport.size for g, t in zip(games, tables.tables))
+    tables.draw(screen)
+    cached = render_text.cache_info().currsize
+    tables.draw(screen)
+    assert render_text.cache_info().currsize == cached
+
+def test_each_table_answers_to_its_own_keys(screen):
+    tables = MultiTable(screen, 4, SETTINGS, EventBus())
+    for i in range(4):
+        tables.seat([f"A{i}", f"B{i}"])
+    before = [[p.rect.y for p in t.game.paddles] for t in tables.tables]
+    (up, _), _ = TABLE_CONTROLS[1]
+    tables.update(Keys({up}))
+    after = [[p.rect.y for p in t.game.paddles] for t in tables.tables]
+    moved = [(i, j) for i in range(4) for j in range(2) if before[i][j] != after[i][j]]
+    assert moved == [(1, 0)] and after[1][0] < before[1][0]
+
+def test_nine_tables_advance_together_without_new_text(screen):
+    # Frame time is reported by `python tables.py`; here, that one update
+    # moves every match and redraws render no text after the first frame
+    tables = MultiTable(screen, 9, {"points_to_win": 10**6, "games_per_match": 1}, EventBus())
+    for i in range(9):
+        tables.seat([f"A{i}", f"B{i}"])
+    keys = Keys()
+    tables.update(keys)
+    tables.draw(screen)
+    misses = render_text.cache_info().misses
+    for _ in range(19):     # before a ball can reach a small table's goal line
+        tables.update(keys)
+        screen.fill((0, 0, 0))
+        tables.draw(screen)
+    assert [t.game.frame for t in tables.tables] == [20] * 9
+    assert render_text.cache_info().misses == misses
+
+def test_tournament_is_played_on_tables(screen, tmp_path, monkeypatch):
+    import main
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    monkeypatch.setattr(main, "SETTINGS_FILE", str(tmp_path / "settings.json"))
+    monkeypatch.setattr(main, "TABLES", 4)
+    session = main.Session(screen, {})
+    stack = main.build_scenes(session)
+    players = [f"P{i}" for i in range(8)]
+    session.start_tournament(make_tournament("Round Robin", players))
+    stack.reset(GameState.SETTINGS)
+    session.settings_view.load(SETTINGS)
+    stack.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r"))
+    assert stack.state == GameState.TABLES
+    scene = stack.top
+    most = 0
+    for _ in range(100000):
+        if stack.state != GameState.TABLES:
+            break
+        most = max(most, scene.tables.playing)
+        stack.update()
+        if stack.state == GameState.TABLES:
+            stack.draw()
+    assert stack.state == GameState.SERIES_END
+    assert session.tournament.finished and most == 4
+    assert sum(n for _, n in session.leaderboard.top) == 8 * 7 // 2
+
+def test_crashed_event_resumes_on_tables(screen, tmp_path, monkeypatch):
+    import main
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    monkeypatch.setattr(main, "TABLES", 4)
+    path = str(tmp_path / "journal.jsonl")
+    players = [f"P{i}" for i in range(6)]
+
+    session = main.Session(screen, {})
+    session.journal = SeriesJournal(path)
+    stack = main.build_scenes(session)
+    session.start_tournament(make_tournament("Round Robin", players))
+    session.tournament_settings = dict(SETTINGS)
+    stack.reset(GameState.TABLES)
+    while session.current_match < 5:
+        stack.update()
+    played, reported = session.tournament.wins[:], session.current_match
+    session.journal.close()     # the crash: matches still under way are lost
+
+    session = main.Session(screen, {})
+    session.journal = SeriesJournal(path)
+    assert session.journal.resumable
+    assert session.resume() == GameState.TABLES
+    assert session.tournament.wins == played and session.current_match == reported
+    stack = main.build_scenes(session)
+    stack.reset(GameState.TABLES)
+    while stack.state == GameState.TABLES:
+        stack.update()
+    session.journal.close()
+    assert session.tournament.finished
+    assert sum(session.tournament.wins) == 6 * 5 // 2
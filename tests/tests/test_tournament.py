@@ -0,0 +1,68 @@
+# tests/test_tournament.py
+
+from itertools import combinations
+
+from tournament import (
+    SwissTournament, RoundRobinTournament, EliminationTournament
+)
+
+def play_out(t, pick=lambda a, b: a):
+    """Play every pairing, the winner chosen by `pick`; return all pairings."""
+    played = []
+    while (pairing := t.next_match()) is not None:
+        a, b = pairing
+        w = pick(a, b)
+        t.report(w, b if w == a else a, 2, 1)
+        played.append(pairing)
+    return played
+
+def test_swiss_avoids_rematches():
+    names = [f"P{i}" for i in range(64)]
+    t = SwissTournament(names)
+    played = play_out(t, pick=lambda a, b: min(a, b, key=names.index))
+    assert t.finished and t.round == 6
+    assert len({frozenset(p) for p in played}) == len(played)
+    assert t.champion() == "P0"
+
+def test_swiss_pairing_scales():
+    # Timed by `python tournament.py [players] [rounds]`
+    t = SwissTournament([f"P{i}" for i in range(4001)], rounds=4)
+    played = play_out(t)
+    assert t.finished and t.round == 4
+    assert len(played) == 4 * 2000
+    assert len({frozenset(p) for p in played}) == len(played)
+
+def test_round_robin_everyone_meets_once():
+    names = [f"P{i}" for i in range(7)]
+    played = play_out(RoundRobinTournament(names))
+    assert sorted(map(frozenset, played), key=sorted) == \
+           sorted(map(frozenset, combinations(names, 2)), key=sorted)
+
+def test_single_elimination():
+    names = [f"P{i}" for i in range(13)]
+    t = EliminationTournament(names)
+    played = play_out(t, pick=lambda a, b: min(a, b, key=names.index))
+    assert len(played) == len(names) - 1
+    assert t.champion() == "P0"
+
+def test_double_elimination_needs_two_losses():
+    names = [f"P{i}" for i in range(8)]
+    t = EliminationTournament(names, max_losses=2)
+    play_out(t, pick=lambda a, b: max(a, b, key=names.index))
+    champ = t.champion()
+    assert champ is not None and t.losses[t.index[champ]] < 2
+    assert sum(l == 2 for l in t.losses) == len(names) - 1
+
+def test_replay_accepts_results_out_of_order():
+    names = [f"P{i}" for i in range(8)]
+    live = SwissTournament(names)
+    # Four tables: the round's pairings are handed out, then finish in reverse
+    pairings = [live.next_match() for _ in range(4)]
+    results = [(a, b, 2, 1) for a, b in reversed(pairings[1:])]
+    for r in results:
+        live.report(*r)
+    resumed = SwissTournament(names)
+    resumed.replay(results)
+    assert resumed.wins == live.wins and resumed.round == live.round
+    # Only the unfinished pairing is left to play
+    assert resumed.next_match() == pairings[0] and resumed.next_match() is None
@@ -0,0 +1,119 @@
+# tests/test_widgets.py
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import leaderboard as lb_module
+from constants       import SCREEN_WIDTH, SCREEN_HEIGHT
+from inputbox        import InputBox
+from menu            import MainMenu
+from settings_screen import SettingsScreen
+from spatial         import RectIndex
+from utils           import get_font
+from widgets         import Button, Label, Panel, Table
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    yield
+    pygame.quit()
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+def test_settings_click_before_first_draw():
+    view = SettingsScreen(pygame.display.get_surface(), get_font(40))
+    plus = view.steppers["num_matches"].plus_rect
+    assert view.handle_event(click(plus.center)) is None
+    assert view.values["num_matches"] == 4
+    assert view.handle_event(click(view.back_rect.center)) == "BACK"
+
+def test_stepper_relayout_moves_hit_targets():
+    view = SettingsScreen(pygame.display.get_surface(), get_font(40))
+    balls = view.steppers["balls"]
+    narrow = balls.plus_rect.copy()
+    for _ in range(4):
+        view.handle_event(click(balls.plus_rect.center))
+    assert view.values["balls"] == 25
+    assert balls.plus_rect.x > narrow.x
+    # the left edge of the old + is now part of the value, not a button
+    view.handle_event(click((narrow.left + 1, narrow.centery)))
+    assert view.values["balls"] == 25
+    view.handle_event(click(balls.minus_rect.center))
+    assert view.values["balls"] == 10
+    view.load({"balls": 1})
+    assert view.values["balls"] == 1 and balls.plus_rect == narrow
+
+def test_widgets_render_once_until_changed():
+    screen = pygame.display.get_surface()
+    panel = Panel()
+    button = panel.add(Button("Go", get_font(30), (100, 100)))
+    panel.draw(screen)
+    image = button.image
+    assert panel.draw(screen) == ()
+    assert button.image is image
+    button.selected = True
+    assert button.image is None
+    assert panel.draw(screen) == [button.rect]
+    assert button.image is not image
+
+def test_panel_hit_index_finds_topmost():
+    panel = Panel(cell_size=32)
+    font = get_font(30)
+    table = panel.add(Table(font, 100))
+    table.set([100, 300], [["a", "b"], ["c", "d"]], ["One", "Two"])
+    button = panel.add(Button("Over", font, table.rect.center, size=(60, 30)))
+    assert panel.widget_at(button.rect.center) is button
+    assert panel.widget_at((table.rect.left + 1, table.rect.top + 1)) is table
+    assert panel.widget_at((5, 5)) is None
+    # a relabelled label is re-indexed under its new size
+    label = panel.add(Label("x", font, (600, 500)))
+    label.text = "a much longer label"
+    assert panel.widget_at((label.rect.right - 2, label.rect.centery)) is label
+
+def test_rect_index_files_rects_under_every_cell():
+    class Item:
+        def __init__(self, rect):
+            self.rect = pygame.Rect(rect)
+    wide, small = Item((10, 10, 200, 20)), Item((150, 12, 5, 5))
+    index = RectIndex(cell_size=32)
+    index.rebuild([wide, small])
+    assert index.at((190, 25)) == [wide]
+    assert index.at((152, 14)) == [wide, small]
+    assert index.at((300, 300)) == []
+
+def test_menu_selection_and_click():
+    menu = MainMenu(pygame.display.get_surface(), get_font(40))
+    menu.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+    assert menu.buttons[1].selected and not menu.buttons[0].selected
+    assert menu.handle_event(click(menu.buttons[3].rect.center)) == "leaderboard"
+    assert menu.selected_index == 3
+    # unchanged options keep their buttons (and rendered images)
+    buttons = menu.buttons
+    menu.set_options(["Start", "Tournament", "Settings", "Leaderboard"])
+    assert menu.buttons is buttons and menu.selected_index == 0
+
+def test_inputbox_bounds_follow_suggestions():
+    box = InputBox((0, 0, 100, 30), get_font(20), suggest=lambda prefix: ["Bryan", "Brook"])
+    box.active = True
+    box.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_b, unicode="b"))
+    assert box.bounds.bottom > box.rect.bottom
+    box.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r"))
+    assert box.bounds == box.rect
+
+def test_leaderboard_view_switch_refills_tables(tmp_path, monkeypatch):
+    monkeypatch.setattr(lb_module, "LEADER_JSON", str(tmp_path / "lb.json"))
+    monkeypatch.setattr(lb_module, "LEADER_CSV",  str(tmp_path / "lb.csv"))
+    lb = lb_module.Leaderboard(pygame.display.get_surface(), get_font(20))
+    lb.record(["Ann", "Bob"], (3, 1))
+    assert [text for text, _ in lb.wins_table.cells] == ["Ann: 1"]
+    assert not lb.view_table.cells
+    lb.handle_event(click(lb.view_button.rect.center))
+    assert lb.view == 1 and lb.view_button.text == "<  Head-to-Head  >"
+    assert lb.view_table.cells and not lb.wins_table.cells
+    assert lb.handle_event(click(lb.back_button.rect.center)) == "BACK"
@@ -0,0 +1,332 @@
+# tournament.py
+
+import math
+from collections import deque
+
+Pairing = tuple[int, int|None]   # (player id, opponent id or None for a bye)
+
+class Tournament:
+    """
+    Base class for many-player events.
+    Names are interned to integer ids on entry; every per-player statistic
+    lives in a plain list indexed by id, so standings and pairing never
+    compare strings or rescan match history.
+
+    Flow: call next_match() for the next (name, name) pairing, play it,
+    then report() the result. Byes are scored automatically.
+    """
+    name = "Tournament"
+
+    def __init__(self, players: list[str]):
+        if len(players) < 2:
+            raise ValueError("A tournament needs at least two players")
+        if len(set(players)) != len(players):
+            raise ValueError("Player names must be unique")
+        self.players: list[str]       = list(players)
+        self.index:   dict[str,int]   = {n: i for i, n in enumerate(self.players)}
+        n = len(self.players)
+        self.wins:          list[int] = [0] * n
+        self.losses:        list[int] = [0] * n
+        self.games_for:     list[int] = [0] * n
+        self.games_against: list[int] = [0] * n
+        self.byes:          list[int] = [0] * n
+        self.opponents:     list[set[int]] = [set() for _ in range(n)]
+        self.round = 0
+        self._queue:   deque[tuple[int,int]] = deque()
+        self._pending: int = 0
+
+    # ——— Subclass hooks ———
+    def _pair_round(self) -> list[Pairing]:
+        raise NotImplementedError
+
+    def _is_finished(self) -> bool:
+        raise NotImplementedError
+
+    # ——— Match flow ———
+    def next_match(self) -> tuple[str,str]|None:
+        """
+        The next pairing to play, pairing a new round when the current one
+        is exhausted. Returns None once the tournament is over.
+        """
+        while not self._queue:
+            if self._pending or not self._next_round():
+                return None
+        a, b = self._queue.popleft()
+        return self.players[a], self.players[b]
+
+    def _next_round(self) -> bool:
+        """Pair the next round into the queue; False once the event is over."""
+        if self._is_finished():
+            return False
+        self.round += 1
+        for a, b in self._pair_round():
+            if b is None:
+                self._record_bye(a)
+            else:
+                self._queue.append((a, b))
+        self._pending = len(self._queue)
+        return True
+
+    def report(self, winner: str, loser: str, winner_games: int = 0, loser_games: int = 0) -> None:
+        """Record the result of a pairing returned by next_match()."""
+        w, l = self.index[winner], self.index[loser]
+        self.wins[w]   += 1
+        self.losses[l] += 1
+        self.games_for[w]     += winner_games
+        self.games_against[w] += loser_games
+        self.games_for[l]     += loser_games
+        self.games_against[l] += winner_games
+        self.opponents[w].add(l)
+        self.opponents[l].add(w)
+        self._pending -= 1
+
+    def replay(self, results: list[tuple[str,str,int,int]]) -> None:
+        """
+        Report recorded (winner, loser, winner games, loser games) results
+        in the order they finished, which within a round need not be the
+        order next_match() handed the pairings out (multi-table mode).
+        Pairings without a result stay queued for next_match().
+        """
+        for winner, loser, winner_games, loser_games in results:
+            while not self._pending:
+                if not self._next_round():
+                    raise ValueError(f"{winner} vs {loser}: the event is already over")
+            ids = {self.index[winner], self.index[loser]}
+            pairing = next((p for p in self._queue if set(p) == ids), None)
+            if pairing is None:
+                raise ValueError(f"{winner} vs {loser} is not a pairing of round {self.round}")
+            self._queue.remove(pairing)
+            self.report(winner, loser, winner_games, loser_games)
+
+    def _record_bye(self, pid: int) -> None:
+        self.wins[pid] += 1
+        self.byes[pid] += 1
+
+    @property
+    def finished(self) -> bool:
+        return not self._queue and not self._pending and self._is_finished()
+
+    # ——— Standings ———
+    def buchholz(self) -> list[int]:
+        """Tiebreak: sum of each player's opponents' match wins."""
+        wins = self.wins
+        return [sum(wins[o] for o in opps) for opps in self.opponents]
+
+    def _ranking(self) -> list[int]:
+        """Player ids best-first: wins, Buchholz, game difference, seed."""
+        bh = self.buchholz()
+        gd = [f - a for f, a in zip(self.games_for, self.games_against)]
+        return sorted(
+            range(len(self.players)),
+            key=lambda i: (-self.wins[i], -bh[i], -gd[i], i)
+        )
+
+    def standings(self) -> list[tuple[str,int,int,int]]:
+        """Rows of (name, wins, losses, buchholz), best first."""
+        bh = self.buchholz()
+        return [
+            (self.players[i], self.wins[i], self.losses[i], bh[i])
+            for i in self._ranking()
+        ]
+
+    def champion(self) -> str|None:
+        if not self.finished:
+            return None
+        return self.players[self._ranking()[0]]
+
+
+class SwissTournament(Tournament):
+    """
+    Swiss system: each round, players are paired top-down within their
+    score group, avoiding rematches. Defaults to ceil(log2(n)) rounds.
+    """
+    name = "Swiss"
+
+    def __init__(self, players: list[str], rounds: int|None = None):
+        super().__init__(players)
+        self.rounds = rounds or max(1, math.ceil(math.log2(len(players))))
+
+    def _is_finished(self) -> bool:
+        return self.round >= self.rounds
+
+    def _pair_round(self) -> list[Pairing]:
+        wins = self.wins
+        order = sorted(range(len(self.players)), key=lambda i: (-wins[i], i))
+        pairs: list[Pairing] = []
+
+        # Odd field: lowest-ranked player who has not had a bye sits out
+        if len(order) % 2:
+            sit = next((i for i in reversed(order) if not self.byes[i]), order[-1])
+            order.remove(sit)
+            pairs.append((sit, None))
+
+        # Doubly linked list over the still-unpaired players, so the scan
+        # for a partner skips everyone already paired this round.
+        n = len(order)
+        nxt = list(range(1, n + 1))
+        prv = list(range(-1, n - 1))
+        head = 0
+
+        def unlink(k: int) -> int:
+            nonlocal head
+            if prv[k] >= 0:
+                nxt[prv[k]] = nxt[k]
+            else:
+                head = nxt[k]
+            if nxt[k] < n:
+                prv[nxt[k]] = prv[k]
+            return nxt[k]
+
+        matched: list[tuple[int,int]] = []
+        while head < n:
+            a = order[head]
+            unlink(head)
+            k = head
+            while k < n and order[k] in self.opponents[a]:
+                k = nxt[k]
+            if k < n:
+                matched.append((a, order[k]))
+                unlink(k)
+                continue
+            # Everyone left has played `a`: take the next player and try to
+            # untangle the rematch by swapping with an earlier pair.
+            b = order[head]
+            unlink(head)
+            matched.append(self._repair(matched, a, b))
+        return pairs + matched
+
+    def _repair(self, matched: list[tuple[int,int]], a: int, b: int) -> tuple[int,int]:
+        """
+        Find an earlier pair (x, y) that can be re-split as (x, a) + (y, b)
+        or (x, b) + (y, a) without rematches; fall back to a rematch.
+        """
+        opp = self.opponents
+        for idx in range(len(matched) - 1, -1, -1):
+            x, y = matched[idx]
+            if a not in opp[x] and b not in opp[y]:
+                matched[idx] = (x, a)
+                return (y, b)
+            if b not in opp[x] and a not in opp[y]:
+                matched[idx] = (x, b)
+                return (y, a)
+        return (a, b)
+
+
+class RoundRobinTournament(Tournament):
+    """Everyone plays everyone once (circle method, one round at a time)."""
+    name = "Round Robin"
+
+    def __init__(self, players: list[str]):
+        super().__init__(players)
+        self._slots: list[int|None] = list(range(len(self.players)))
+        if len(self._slots) % 2:
+            self._slots.append(None)
+        self.rounds = len(self._slots) - 1
+
+    def _is_finished(self) -> bool:
+        return self.round >= self.rounds
+
+    def _pair_round(self) -> list[Pairing]:
+        slots = self._slots
+        m = len(slots)
+        r = (self.round - 1) % (m - 1)
+        # Slot 0 stays fixed; the rest rotate by one per round
+        rest = slots[1:]
+        rotated = [slots[0]] + rest[-r:] + rest[:-r] if r else list(slots)
+        pairs: list[Pairing] = []
+        for i in range(m // 2):
+            a, b = rotated[i], rotated[m - 1 - i]
+            if a is None:
+                a, b = b, a
+            pairs.append((a, b))
+        return pairs
+
+
+class EliminationTournament(Tournament):
+    """
+    Single (max_losses=1) or double (max_losses=2) elimination.
+    Round one follows a standard seeded bracket; afterwards players are
+    paired with their bracket neighbours inside each loss pool, so a
+    double-elimination losers bracket runs alongside the winners bracket.
+    """
+    def __init__(self, players: list[str], max_losses: int = 1):
+        super().__init__(players)
+        self.max_losses = max_losses
+        self.name = "Double Elimination" if max_losses == 2 else "Single Elimination"
+        # Bracket position of every seed (seed 0 is the top seed)
+        size = 1 << max(1, math.ceil(math.log2(len(self.players))))
+        seeds = [0, 1]
+        while len(seeds) < size:
+            seeds = [s for seed in seeds for s in (seed, 2*len(seeds) - 1 - seed)]
+        self.bracket: list[int|None] = [s if s < len(self.players) else None for s in seeds]
+        self.position = [0] * len(self.players)
+        for pos, seed in enumerate(self.bracket):
+            if seed is not None:
+                self.position[seed] = pos
+
+    def alive(self) -> list[int]:
+        return [i for i, l in enumerate(self.losses) if l < self.max_losses]
+
+    def _is_finished(self) -> bool:
+        return len(self.alive()) <= 1
+
+    def _pair_round(self) -> list[Pairing]:
+        if self.round == 1:
+            return [
+                (a, b) if a is not None else (b, None)
+                for a, b in zip(self.bracket[0::2], self.bracket[1::2])
+            ]
+        pools: dict[int, list[int]] = {}
+        for pid in sorted(self.alive(), key=self.position.__getitem__):
+            pools.setdefault(self.losses[pid], []).append(pid)
+        pairs: list[Pairing] = []
+        leftovers: list[int] = []
+        for losses in sorted(pools):
+            pool = pools[losses]
+            if len(pool) % 2:
+                leftovers.append(pool.pop())
+            pairs.extend(zip(pool[0::2], pool[1::2]))
+        # Odd players across pools meet each other (e.g. the grand final)
+        pairs.extend(zip(leftovers[0::2], leftovers[1::2]))
+        if len(leftovers) % 2:
+            pairs.append((leftovers[-1], None))
+        return pairs
+
+    def champion(self) -> str|None:
+        alive = self.alive()
+        if not self.finished or not alive:
+            return None
+        return self.players[alive[0]]
+
+
+FORMATS = ["Swiss", "Round Robin", "Single Elimination", "Double Elimination"]
+
+def make_tournament(fmt: str, players: list[str]) -> Tournament:
+    """Build a tournament of the given FORMATS entry."""
+    if fmt == "Swiss":
+        return SwissTournament(players)
+    if fmt == "Round Robin":
+        return RoundRobinTournament(players)
+    if fmt == "Single Elimination":
+        return EliminationTournament(players, max_losses=1)
+    if fmt == "Double Elimination":
+        return EliminationTournament(players, max_losses=2)
+    raise ValueError(f"Unknown tournament format: {fmt}")
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    # Swiss pairing cost: python tournament.py [players] [rounds]
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 4001
+    rounds  = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    t = SwissTournament([f"P{i}" for i in range(players)], rounds=rounds)
+    matches = 0
+    start = time.perf_counter()
+    while (pairing := t.next_match()) is not None:
+        t.report(pairing[0], pairing[1], 2, 1)
+        matches += 1
+    elapsed = time.perf_counter() - start
+    print(f"matches: {matches}")
+    print(f"elapsed_s: {elapsed:.3f}")
+    print(f"per_match_us: {elapsed / max(1, matches) * 1e6:.1f}")
@@ -1,4 +1,5 @@
 import pygame
+from functools import lru_cache
 from typing import Tuple
 
 def get_font(size: int, path: str|None=None) -> pygame.font.Font:
@@ -9,6 +10,9 @@ def get_font(size: int, path: str|None=None) -> pygame.font.Font:
         return pygame.font.SysFont(None, size)
     return pygame.font.Font(path, size)
 
+# Text antialiasing for draw_text; the frame governor turns it off under load
+text_antialias: bool = True
+
 def draw_text(
     surface: pygame.Surface,
     text: str,
@@ -19,6 +23,20 @@ def draw_text(
     """
     Render text centered at `position`.
     """
-    rendered = font.render(text, True, color)
+    rendered = render_text(font, text, color, text_antialias)
     rect     = rendered.get_rect(center=position)
     surface.blit(rendered, rect)
+
+@lru_cache(maxsize=512)
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: Tuple[int,int,int]=(255,255,255),
+    antialias: bool=True
+) -> pygame.Surface:
+    """
+    `text` in `color`, rendered once and then reused.
+    Menus and the HUD redraw the same strings every frame; the returned
+    surface is shared, so blit it but never draw on it.
+    """
+    return font.render(text, antialias, color)
@@ -0,0 +1,357 @@
+# widgets.py
+
+import pygame
+from typing import Iterable, Sequence
+
+from constants import COLOR_BG, COLOR_FG
+from spatial   import RectIndex
+from utils     import draw_text
+
+# Colour of the selected option in menus
+COLOR_SELECTED: tuple[int,int,int] = (255, 255, 0)
+
+class Widget:
+    """
+    Base for retained UI elements. A widget keeps its rendered `image`
+    between frames and rebuilds it only after invalidate(), so drawing
+    an unchanged widget is one blit. `rect` is where it sits on screen
+    and the area it answers clicks for.
+    """
+    def __init__(self, rect: pygame.Rect|tuple = (0, 0, 0, 0), name: str|None = None):
+        self.rect  = pygame.Rect(rect)
+        self.name  = name
+        self.panel: "Panel|None" = None
+        self.image: pygame.Surface|None = None
+
+    @staticmethod
+    def canvas(size: tuple[int,int]) -> pygame.Surface:
+        """
+        A blank image to render into. COLOR_BG is colour-keyed out and
+        run-length encoded, which blits several times faster than
+        per-pixel alpha for mostly empty text images.
+        """
+        image = pygame.Surface(size)
+        image.fill(COLOR_BG)
+        image.set_colorkey(COLOR_BG, pygame.RLEACCEL)
+        return image
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Area the image covers: the rect, unless the widget draws outside it."""
+        return self.rect
+
+    def invalidate(self, old: pygame.Rect|None = None) -> None:
+        """
+        Drop the cached image after a change. Pass the `old` bounds when
+        the layout (and so the rect) may have changed.
+        """
+        self.image = None
+        if self.panel is not None:
+            self.panel.changed(self, old)
+
+    def render(self) -> pygame.Surface:
+        """Build the image; called only when the cached one was dropped."""
+        raise NotImplementedError
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self.image is None:
+            self.image = self.render()
+        surface.blit(self.image, self.bounds)
+
+    def handle_event(self, event: pygame.event.Event) -> object:
+        """React to an event routed to this widget; returns a result or None."""
+        return None
+
+
+class Label(Widget):
+    """One line of text, placed by `anchor` (a Rect attribute) at `pos`."""
+    def __init__(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        pos: tuple[int,int],
+        color: tuple[int,int,int] = COLOR_FG,
+        anchor: str = "center",
+        name: str|None = None
+    ):
+        super().__init__(name=name)
+        self.font   = font
+        self.pos    = pos
+        self.color  = color
+        self.anchor = anchor
+        self._text: str|None = None
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        if text == self._text:
+            return
+        old = self.rect.copy()
+        self._text = text
+        self.rect = pygame.Rect((0, 0), self.font.size(text))
+        setattr(self.rect, self.anchor, self.pos)
+        self.invalidate(old)
+
+    def render(self) -> pygame.Surface:
+        image = self.canvas(self.rect.size)
+        draw_text(image, self._text, image.get_rect().center, self.font, color=self.color)
+        return image
+
+
+class Button(Widget):
+    """
+    A clickable text button of `size` (default: fitted to its text),
+    boxed unless `border` is False, and highlighted while `selected`.
+    Its name (default: the lower-cased text) is what a click returns.
+    """
+    def __init__(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        center: tuple[int,int],
+        size: tuple[int,int]|None = None,
+        name: str|None = None,
+        border: bool = True
+    ):
+        rect = pygame.Rect((0, 0), size or font.size(text))
+        rect.center = center
+        super().__init__(rect, text.lower() if name is None else name)
+        self._text  = text
+        self.font   = font
+        self.border = border
+        self._selected = False
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        """Relabel in place; the button keeps its rect."""
+        if text != self._text:
+            self._text = text
+            self.invalidate()
+
+    @property
+    def selected(self) -> bool:
+        return self._selected
+
+    @selected.setter
+    def selected(self, selected: bool) -> None:
+        if selected != self._selected:
+            self._selected = selected
+            self.invalidate()
+
+    def handle_event(self, event: pygame.event.Event) -> str|None:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos):
+            return self.name
+        return None
+
+    def render(self) -> pygame.Surface:
+        image = self.canvas(self.rect.size)
+        color = COLOR_SELECTED if self._selected else COLOR_FG
+        if self.border:
+            pygame.draw.rect(image, color, image.get_rect(), 2)
+        draw_text(image, self._text, image.get_rect().center, self.font, color=color)
+        return image
+
+
+class Stepper(Widget):
+    """
+    "Label: [-] value [+]" for a number, laid out from measured text
+    widths starting at `midleft`. Clicking - or + moves the value one
+    notch: by one, or to the neighbouring entry of `presets`, never
+    below `minimum`.
+    """
+    def __init__(
+        self,
+        label: str,
+        value: int,
+        font: pygame.font.Font,
+        midleft: tuple[int,int],
+        name: str|None = None,
+        presets: Sequence[int]|None = None,
+        minimum: int = 1
+    ):
+        super().__init__(name=name)
+        self.label   = label
+        self.font    = font
+        self.midleft = midleft
+        self.presets = presets
+        self.minimum = minimum
+        self.value: int|None = None
+        self.set_value(value)
+
+    def set_value(self, value: int) -> None:
+        if value == self.value:
+            return
+        old = self.rect.copy()
+        self.value = value
+        self._layout()
+        self.invalidate(old)
+
+    def _layout(self) -> None:
+        x, y = self.midleft
+        # 1) Label, 2) minus button right of it, 3) value, 4) plus button
+        self.label_rect = pygame.Rect((0, 0), self.font.size(self.label))
+        self.label_rect.midleft = (x, y)
+        self.minus_rect = pygame.Rect(0, 0, 30, 30)
+        self.minus_rect.center = (self.label_rect.right + 30, y)
+        self.value_rect = pygame.Rect((0, 0), self.font.size(str(self.value)))
+        self.value_rect.midleft = (self.minus_rect.right + 20, y)
+        self.plus_rect = pygame.Rect(0, 0, 30, 30)
+        self.plus_rect.center = (self.value_rect.right + 30, y)
+        self.rect = self.label_rect.unionall([self.minus_rect, self.value_rect, self.plus_rect])
+
+    def step(self, direction: int) -> None:
+        """Move one notch up (+1) or down (-1)."""
+        value, presets = self.value, self.presets
+        if not presets:
+            value += direction
+        elif direction > 0:
+            value = next((p for p in presets if p > value), presets[-1])
+        else:
+            value = next((p for p in reversed(presets) if p < value), presets[0])
+        self.set_value(max(value, self.minimum))
+
+    def handle_event(self, event: pygame.event.Event) -> int|None:
+        """Step on a click on - or +; returns the new value, else None."""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.minus_rect.collidepoint(event.pos) and self.value > self.minimum:
+                self.step(-1)
+                return self.value
+            if self.plus_rect.collidepoint(event.pos):
+                self.step(+1)
+                return self.value
+        return None
+
+    def render(self) -> pygame.Surface:
+        image = self.canvas(self.rect.size)
+        dx, dy = -self.rect.x, -self.rect.y
+        draw_text(image, self.label, self.label_rect.move(dx, dy).center, self.font)
+        draw_text(image, str(self.value), self.value_rect.move(dx, dy).center, self.font)
+        for box, sign in ((self.minus_rect, "-"), (self.plus_rect, "+")):
+            box = box.move(dx, dy)
+            pygame.draw.rect(image, COLOR_FG, box, 2)
+            draw_text(image, sign, box.center, self.font)
+        return image
+
+
+class Table(Widget):
+    """
+    Rows of text cells centred on the column positions `xs`, one line
+    every `row_height` pixels from `y` down, headings (if any) first.
+    The whole table is one image, rebuilt by set().
+    """
+    def __init__(self, font: pygame.font.Font, y: int, row_height: int = 30, name: str|None = None):
+        super().__init__(name=name)
+        self.font       = font
+        self.y          = y
+        self.row_height = row_height
+        self.cells: list[tuple[str, pygame.Rect]] = []
+
+    def set(
+        self,
+        xs: Sequence[int],
+        rows: Iterable[Sequence[str]],
+        headings: Sequence[str] = (),
+        y: int|None = None
+    ) -> None:
+        """Replace the contents (and optionally move the table to `y`)."""
+        old = self.rect.copy()
+        if y is not None:
+            self.y = y
+        lines = ([headings] if headings else []) + list(rows)
+        self.cells = []
+        for i, line in enumerate(lines):
+            cy = self.y + i * self.row_height
+            for x, text in zip(xs, line):
+                rect = pygame.Rect((0, 0), self.font.size(text))
+                rect.center = (x, cy)
+                self.cells.append((text, rect))
+        if self.cells:
+            self.rect = self.cells[0][1].unionall([rect for _, rect in self.cells])
+        else:
+            self.rect = pygame.Rect(xs[0] if xs else 0, self.y, 0, 0)
+        self.invalidate(old)
+
+    def render(self) -> pygame.Surface:
+        image = self.canvas(self.rect.size)
+        dx, dy = -self.rect.x, -self.rect.y
+        for text, rect in self.cells:
+            draw_text(image, text, rect.move(dx, dy).center, self.font)
+        return image
+
+
+class Panel:
+    """
+    One screen's widgets, in draw order.
+
+    Widgets report their changes here: the areas they covered and now
+    cover collect as dirty rects, and one that moved or resized marks
+    the hit index stale, so layout is redone only after a change. Clicks
+    are looked up in a grid index of widget rects instead of being
+    tested against every widget.
+    """
+    def __init__(self, cell_size: int = 64):
+        self.widgets: list[Widget] = []
+        self.index = RectIndex(cell_size)
+        self.dirty: list[pygame.Rect] = []
+        self._stale = True
+
+    def add(self, widget: Widget) -> Widget:
+        widget.panel = self
+        self.widgets.append(widget)
+        self.dirty.append(widget.bounds.copy())
+        self._stale = True
+        return widget
+
+    def clear(self) -> None:
+        for widget in self.widgets:
+            self.dirty.append(widget.bounds.copy())
+            widget.panel = None
+        self.widgets.clear()
+        self._stale = True
+
+    def changed(self, widget: Widget, old: pygame.Rect|None = None) -> None:
+        """Called by a widget whose image (and, with `old`, layout) changed."""
+        if old is not None:
+            self.dirty.append(old)
+            if old != widget.rect:
+                self._stale = True
+        self.dirty.append(widget.bounds.copy())
+
+    def widget_at(self, pos: tuple[int,int]) -> Widget|None:
+        """The topmost (last drawn) widget whose rect contains `pos`."""
+        if self._stale:
+            self.index.rebuild(self.widgets)
+            self._stale = False
+        hits = self.index.at(pos)
+        return hits[-1] if hits else None
+
+    def handle_event(self, event: pygame.event.Event) -> tuple[Widget|None, object]:
+        """
+        Route a left click to the widget under it. Returns that widget
+        and what its handle_event returned, or (None, None).
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            widget = self.widget_at(event.pos)
+            if widget is not None:
+                return widget, widget.handle_event(event)
+        return None, None
+
+    def draw(self, surface: pygame.Surface) -> Sequence[pygame.Rect]:
+        """
+        Blit every widget's cached image. Returns the rects that changed
+        since the previous draw, for pygame.display.update().
+        """
+        for widget in self.widgets:
+            widget.draw(surface)
+        if not self.dirty:
+            return ()
+        dirty, self.dirty = self.dirty, []
+        return dirty